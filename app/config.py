@@ -1,4 +1,6 @@
-from pydantic_settings import BaseSettings
+from functools import lru_cache
+from typing import Optional
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     AZURE_OPENAI_API_KEY: str
@@ -8,14 +10,49 @@ class Settings(BaseSettings):
     AZURE_OPENAI_MODEL_NAME: str 
     AZURE_OPENAI_EMBEDDING_DEPLOYMENT: str = "text-embedding-ada-002"
     AZURE_OPENAI_EMBEDDING_MODEL: str = "text-embedding-ada-002"
+    # Truncated (Matryoshka) embedding width for text-embedding-3 models, e.g. 1024 to
+    # shrink every stored vector and HNSW distance computation; None keeps the native
+    # width. Changing it requires re-embedding into fresh collections.
+    AZURE_OPENAI_EMBEDDING_DIMENSIONS: Optional[int] = None
+    
+    # Upper bound on concurrent LLM analyses in batch operations
+    LLM_MAX_CONCURRENCY: int = 16
+    
+    # Process-wide cap on in-flight chat completions; size it to the deployment's quota
+    AZURE_OPENAI_MAX_INFLIGHT: int = 32
+    
+    # Semantic response cache: reuse a completion when a new input embeds this close
+    # (cosine similarity) to one already answered with the same prompt. Off by default:
+    # it costs an embedding call per miss, and near-identical abstracts that differ in
+    # their numbers or sample would be given each other's analysis
+    LLM_SEMANTIC_CACHE_ENABLED: bool = False
+    LLM_SEMANTIC_CACHE_THRESHOLD: float = 0.98
+    LLM_CACHE_COLLECTION_NAME: str = "smartlit_llm_cache"
+    LLM_SEMANTIC_CACHE_TTL_SECONDS: float = 7 * 86400
+    LLM_SEMANTIC_CACHE_MAX_ENTRIES: int = 10000
+    
+    # Semantic cache of RAG answers: a question this similar to one already answered
+    # with the same k and filters gets the stored answer and sources
+    RAG_CACHE_ENABLED: bool = True
+    RAG_CACHE_THRESHOLD: float = 0.95
+    RAG_CACHE_COLLECTION_NAME: str = "smartlit_rag_cache"
+    RAG_CACHE_TTL_SECONDS: float = 86400
+    RAG_CACHE_MAX_ENTRIES: int = 10000
+    # Look cached questions up in an in-memory LSH index instead of querying Chroma
+    RAG_CACHE_USE_LSH: bool = True
 
     SPREADSHEET_ID: str
     
     # Vector store settings
     CHROMA_PERSIST_DIRECTORY: str = "./chroma_db"
     CHROMA_COLLECTION_NAME: str = "smartlit_articles"
+    
+    # Contact address sent to CrossRef so requests are routed to its polite pool
+    CROSSREF_MAILTO: str = ""
 
-    class Config:
-        env_file = ".env"
+    model_config = SettingsConfigDict(env_file=".env", defer_build=True)
 
-settings = Settings() 
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, parsing the environment and .env only once"""
+    return Settings()
@@ -1,131 +1,421 @@
-from fastapi import FastAPI, Query, HTTPException, UploadFile, File, Form
-from typing import List, Optional
-import json
+import os
+
+# Skip the redundant core-schema validation pass when Pydantic builds schemas;
+# must be set before pydantic is first imported
+os.environ.setdefault("PYDANTIC_SKIP_VALIDATING_CORE_SCHEMAS", "true")
+
+from fastapi import FastAPI, Query, HTTPException, UploadFile, File, Form, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from typing import List, Optional, Dict, Any, Callable, NamedTuple, Set
+from functools import lru_cache
+from contextlib import asynccontextmanager
+import asyncio
+import logging
+import posixpath
+import tempfile
+import uuid
+import httpx
+import msgspec
+import orjson
+from urllib.parse import unquote
 from dotenv import load_dotenv
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
-from app.tools.crossref import CrossRefSearchTool
-from app.tools.article_analyzer import ArticleAnalyzer
-from app.tools.sheets_handler import GoogleSheetsHandler
-from app.tools.vector_store import VectorStoreService
-from app.tools.rag_service import RAGService
-from app.tools.pdf_processor import PDFProcessor
-from app.tools.citation_graph import CitationGraphGenerator
-from app.tools.article_monitor import ArticleMonitor, run_manual_monitoring
+from app.logging_config import configure_logging, shutdown_logging
+from app.tools.http_client import get_http_client, close_http_client
+from app.tools.process_pool import shutdown_process_pool
+from app.tools.ttl_cache import TTLCache
 
 # Load environment variables
 load_dotenv()
 
-# Pydantic models for request bodies
-class QueryRequest(BaseModel):
+# Log through a background queue listener so handler I/O stays off request paths
+configure_logging()
+logger = logging.getLogger(__name__)
+
+# Request bodies for the hot JSON endpoints are msgspec structs decoded straight
+# from the raw body, which skips the per-request Pydantic validation pass
+class QueryRequest(msgspec.Struct):
     question: str
     k: int = 5
     filters: Optional[dict] = None
 
-class MultiArticleSummaryRequest(BaseModel):
-    article_titles: List[str]
-    focus_question: Optional[str] = None
-
-class SearchFilters(BaseModel):
+class SearchFilters(msgspec.Struct):
     year_from: Optional[int] = None
     year_to: Optional[int] = None
     risk_type: Optional[str] = None
     journal: Optional[str] = None
     level_of_analysis: Optional[str] = None
 
-class SearchArticlesRequest(BaseModel):
+class SearchArticlesRequest(msgspec.Struct):
     topic: str
     filters: Optional[SearchFilters] = None
 
-app = FastAPI(title="SmartLit API", description="Academic Literature Analysis with RAG", version="2.0.0")
-crossref_tool = CrossRefSearchTool()
-article_analyzer = ArticleAnalyzer()
-sheets_handler = GoogleSheetsHandler()
-vector_store = VectorStoreService()
-rag_service = RAGService()
-pdf_processor = PDFProcessor()
-citation_graph = CitationGraphGenerator()
-article_monitor = ArticleMonitor()
-
-@app.on_event("startup")
-async def startup_event():
+class BatchCall(msgspec.Struct):
+    endpoint: str
+    method: str = "GET"
+    body: Optional[Any] = None  # JSON body, or query parameters for GET
+
+# Pydantic models for request bodies
+class MultiArticleSummaryRequest(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    article_titles: List[str]
+    focus_question: Optional[str] = None
+
+async def decode_body(request: Request, body_type: type):
+    """Decode a JSON request body into a msgspec struct, mapping errors to 422"""
+    try:
+        return msgspec.json.decode(await request.body(), type=body_type)
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid request body: {str(e)}")
+
+# Tool services pull in heavy dependencies (langchain, chromadb, PyPDF2, networkx,
+# scipy), so each one is imported and constructed on first use
+@lru_cache(maxsize=None)
+def get_crossref_tool():
+    from app.tools.crossref import CrossRefSearchTool
+    return CrossRefSearchTool()
+
+@lru_cache(maxsize=None)
+def get_article_analyzer():
+    from app.tools.article_analyzer import ArticleAnalyzer
+    return ArticleAnalyzer()
+
+@lru_cache(maxsize=None)
+def get_sheets_handler():
+    from app.tools.sheets_handler import GoogleSheetsHandler
+    return GoogleSheetsHandler()
+
+@lru_cache(maxsize=None)
+def get_vector_store():
+    from app.tools.vector_store import VectorStoreService
+    return VectorStoreService()
+
+@lru_cache(maxsize=None)
+def get_rag_service():
+    from app.tools.rag_service import RAGService
+    return RAGService()
+
+@lru_cache(maxsize=None)
+def get_pdf_processor():
+    from app.tools.pdf_processor import PDFProcessor
+    return PDFProcessor()
+
+@lru_cache(maxsize=None)
+def get_citation_graph():
+    from app.tools.citation_graph import CitationGraphGenerator
+    return CitationGraphGenerator()
+
+@lru_cache(maxsize=None)
+def get_article_monitor():
+    from app.tools.article_monitor import ArticleMonitor
+    return ArticleMonitor()
+
+# Cap concurrent LLM analyses per process to stay under Azure OpenAI rate limits
+MAX_CONCURRENT_ANALYSES = 10
+analysis_semaphore = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
+
+async def analyze_bounded(abstract: str):
+    """Analyze an abstract while holding a slot of the shared analysis semaphore"""
+    async with analysis_semaphore:
+        return await get_article_analyzer().analyze(abstract)
+
+# CrossRef results are cached per topic; stale entries are served while a
+# background refresh fetches the latest results
+CROSSREF_CACHE_TTL_SECONDS = 3600
+CROSSREF_CACHE_MAX_STALE_SECONDS = 24 * 3600
+crossref_cache = TTLCache(maxsize=1024, ttl=CROSSREF_CACHE_TTL_SECONDS, max_stale=CROSSREF_CACHE_MAX_STALE_SECONDS)
+crossref_refresh_tasks: Dict[str, asyncio.Task] = {}
+
+async def fetch_crossref(topic: str) -> List[dict]:
+    """Run a CrossRef search on the shared async HTTP client and cache the results"""
+    articles = await get_crossref_tool()._arun(topic)
+    crossref_cache.set(topic, articles)
+    return articles
+
+async def refresh_crossref(topic: str):
+    try:
+        await fetch_crossref(topic)
+    except Exception as e:
+        logger.error("Error refreshing CrossRef results for '%s': %s", topic, e)
+    finally:
+        crossref_refresh_tasks.pop(topic, None)
+
+async def search_crossref(topic: str) -> List[dict]:
+    """
+    Search CrossRef for a topic using stale-while-revalidate caching
+    
+    Returns:
+        A fresh copy of the article list, safe for callers to filter or slice
+    """
+    cached = crossref_cache.get_with_freshness(topic)
+    if cached is None:
+        return list(await fetch_crossref(topic))
+    
+    articles, is_fresh = cached
+    if not is_fresh and topic not in crossref_refresh_tasks:
+        crossref_refresh_tasks[topic] = asyncio.create_task(refresh_crossref(topic))
+    return list(articles)
+
+# Built graphs are cached briefly since demo topics and queries tend to repeat
+GRAPH_CACHE_TTL_SECONDS = 600
+citation_graph_cache = TTLCache(maxsize=128, ttl=GRAPH_CACHE_TTL_SECONDS)
+knowledge_base_graph_cache = TTLCache(maxsize=128, ttl=GRAPH_CACHE_TTL_SECONDS)
+
+# Collection stats served by /knowledge_base_stats; the short TTL bounds how long a
+# worker shows a count that predates writes made by other workers
+KNOWLEDGE_BASE_STATS_TTL_SECONDS = 10
+knowledge_base_stats_cache = TTLCache(maxsize=1, ttl=KNOWLEDGE_BASE_STATS_TTL_SECONDS, max_stale=0)
+
+def invalidate_knowledge_base_caches():
+    """Drop cached views of the vector store after it has been written to"""
+    knowledge_base_stats_cache.clear()
+    knowledge_base_graph_cache.clear()
+
+async def warm_vector_store():
+    """Open the vector store off the event loop, cache its collection stats and load its index"""
+    try:
+        stats = await asyncio.to_thread(lambda: get_vector_store().get_collection_stats())
+        if "error" not in stats:
+            knowledge_base_stats_cache.set("stats", stats)
+        logger.info("Vector store initialized with %s documents", stats.get('total_documents', 0))
+        
+        # Page the HNSW index in now rather than on the first user query
+        await asyncio.to_thread(lambda: get_vector_store().warm_index())
+    except Exception as e:
+        logger.error("Error warming vector store: %s", e)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Shared pooled HTTP/2 client for CrossRef and Azure OpenAI
+    app.state.http = get_http_client()
+    
+    # Warm the vector store in the background so readiness doesn't wait on ChromaDB
+    warmup_task = asyncio.create_task(warm_vector_store())
+    
     # Initialize the Google Sheet with headers
-    sheets_handler.initialize_sheet()
-    print("✅ Google Sheets initialized")
+    await asyncio.to_thread(lambda: get_sheets_handler().initialize_sheet())
+    logger.info("Google Sheets initialized")
     
-    # Initialize vector store
-    stats = vector_store.get_collection_stats()
-    print(f"✅ Vector store initialized with {stats.get('total_documents', 0)} documents")
+    logger.info("SmartLit API with RAG is ready")
+    yield
     
-    print("🚀 SmartLit API with RAG is ready!")
+    warmup_task.cancel()
+    await close_http_client()
+    shutdown_process_pool()
+    shutdown_logging()
+
+app = FastAPI(
+    title="SmartLit API",
+    description="Academic Literature Analysis with RAG",
+    version="2.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
 
 # Add a root endpoint for health check
 @app.get("/")
 async def root():
     return {"status": "ok", "message": "API is running"}
 
-@app.post("/search_articles")
-async def search_articles(request: SearchArticlesRequest):
+class CompiledFilters(NamedTuple):
+    metadata: Callable[[dict], bool]  # checks on CrossRef metadata, applied before analysis
+    analysis: Callable[[dict], bool]  # checks on LLM analysis fields, applied after
+
+def accept_all(record: dict) -> bool:
+    return True
+
+def all_of(checks: List[Callable[[dict], bool]]) -> Callable[[dict], bool]:
+    if not checks:
+        return accept_all
+    if len(checks) == 1:
+        return checks[0]
+    return lambda record: all(check(record) for check in checks)
+
+def compile_search_filters(filters: Optional[SearchFilters]) -> CompiledFilters:
+    """
+    Build per-request predicates containing only the filters that are actually set,
+    so each article is checked without re-testing every inactive filter field
+    """
+    metadata_checks = []
+    analysis_checks = []
+    
+    if filters:
+        if filters.year_from:
+            year_from = filters.year_from
+            metadata_checks.append(lambda article: not article.get('year') or article['year'] >= year_from)
+        if filters.year_to:
+            year_to = filters.year_to
+            metadata_checks.append(lambda article: not article.get('year') or article['year'] <= year_to)
+        if filters.journal:
+            journal = filters.journal
+            metadata_checks.append(lambda article: article.get('journal') == journal)
+        if filters.risk_type:
+            risk_type = filters.risk_type
+            analysis_checks.append(lambda analysis: analysis.get('risk_type') == risk_type)
+        if filters.level_of_analysis:
+            level_of_analysis = filters.level_of_analysis
+            analysis_checks.append(lambda analysis: analysis.get('level_of_analysis') == level_of_analysis)
+    
+    return CompiledFilters(all_of(metadata_checks), all_of(analysis_checks))
+
+def merge_analysis(article: dict, outcome, search_filters: CompiledFilters) -> Optional[dict]:
+    """
+    Combine an article with its analysis outcome, returning None when the analysis
+    failed or the result does not pass the search filters
+    """
+    if isinstance(outcome, Exception):
+        logger.error("Error analyzing article '%s': %s", article['title'], outcome)
+        return None
+    
+    analysis, token_usage = outcome
+    
+    logger.debug("Token usage for article '%s': %s", article['title'], token_usage)
+    
+    # Apply the filters that depend on the analysis; metadata filters were
+    # already applied before analysis
+    if not search_filters.analysis(analysis):
+        return None
+    
+    # Combine metadata with analysis
+    return {**article, **analysis}
+
+async def store_search_results(results: List[dict]):
+    """Store analyzed articles in Google Sheets and the vector store"""
+    if not results:
+        return
+    
+    # Store results in Google Sheet
+    await asyncio.to_thread(get_sheets_handler().append_articles, results)
+    
+    # Add to vector store for RAG
+    vector_stats = await get_vector_store().add_articles_async(results)
+    invalidate_knowledge_base_caches()
+    logger.info("Added %s chunks to vector store from %s articles", vector_stats['total_chunks'], vector_stats['processed_articles'])
+
+async def stream_analyzed_articles(articles: List[dict], search_filters: CompiledFilters, results: List[dict]):
+    """
+    Yield each article as an NDJSON line as soon as its analysis completes,
+    collecting the emitted articles into results for storage afterwards
+    """
+    async def analyze_with_article(article: dict):
+        try:
+            return article, await analyze_bounded(article["abstract"])
+        except Exception as e:
+            return article, e
+    
+    tasks = [asyncio.create_task(analyze_with_article(article)) for article in articles]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            article, outcome = await next_done
+            full_article = merge_analysis(article, outcome, search_filters)
+            if full_article is not None:
+                results.append(full_article)
+                yield orjson.dumps(full_article) + b"\n"
+    finally:
+        # Stop outstanding analyses if the client disconnects mid-stream
+        for task in tasks:
+            task.cancel()
+
+@app.post("/search_articles", response_model=None)
+async def search_articles(
+    raw_request: Request,
+    stream: bool = Query(default=False, description="Stream analyzed articles as NDJSON as they complete")
+):
     """
     Search for articles and analyze them, storing results in both Google Sheets and vector store
+    
+    With stream=true the response is NDJSON with one analyzed article per line;
+    results are stored once the stream has been fully sent.
     """
+    request = await decode_body(raw_request, SearchArticlesRequest)
+    
     # Search for articles
-    articles = crossref_tool._run(request.topic)
+    articles = await search_crossref(request.topic)
+    
+    # Metadata filters run before analysis so rejected articles skip the LLM
+    search_filters = compile_search_filters(request.filters)
+    articles = [
+        article for article in articles
+        if article["abstract"] and search_filters.metadata(article)
+    ]
+    
+    if stream:
+        results = []
+        return StreamingResponse(
+            stream_analyzed_articles(articles, search_filters, results),
+            media_type="application/x-ndjson",
+            background=BackgroundTask(store_search_results, results)
+        )
+    
+    # Analyze all articles with abstracts concurrently
+    analyses = await asyncio.gather(
+        *(analyze_bounded(article["abstract"]) for article in articles),
+        return_exceptions=True
+    )
     
     results = []
-    for article in articles:
-        if article["abstract"]:
-            # Analyze article
-            analysis, token_usage = await article_analyzer.analyze(article["abstract"])
-            
-            # Print token usage
-            print(f"Token usage for article '{article['title']}': {json.dumps(token_usage, indent=2)}")
-            
-            # Combine metadata with analysis
-            full_article = {**article, **analysis}
-            
-            # Apply filters if provided
-            if request.filters:
-                if request.filters.year_from and article.get('year') and article['year'] < request.filters.year_from:
-                    continue
-                if request.filters.year_to and article.get('year') and article['year'] > request.filters.year_to:
-                    continue
-                if request.filters.risk_type and analysis.get('risk_type') != request.filters.risk_type:
-                    continue
-                if request.filters.journal and article.get('journal') != request.filters.journal:
-                    continue
-                if request.filters.level_of_analysis and analysis.get('level_of_analysis') != request.filters.level_of_analysis:
-                    continue
-            
+    for article, outcome in zip(articles, analyses):
+        full_article = merge_analysis(article, outcome, search_filters)
+        if full_article is not None:
             results.append(full_article)
     
-    # Store results in Google Sheet
-    if results:
-        sheets_handler.append_articles(results)
-        
-        # Add to vector store for RAG
-        vector_stats = vector_store.add_articles(results)
-        print(f"Added {vector_stats['total_chunks']} chunks to vector store from {vector_stats['processed_articles']} articles")
+    await store_search_results(results)
     
-    return {
+    return ORJSONResponse({
         "articles": results,
         "total_found": len(results),
         "topic": request.topic,
-        "filters_applied": request.filters.dict() if request.filters else None
-    }
+        "filters_applied": msgspec.structs.asdict(request.filters) if request.filters else None
+    })
+
+async def stream_rag_events(events):
+    """
+    Encode RAG stream events as NDJSON lines
+    
+    The 200 status is already sent when the events start, so a failure ends the
+    stream with an "error" event rather than an HTTP error.
+    """
+    try:
+        async for event in events:
+            yield orjson.dumps(event) + b"\n"
+    except Exception as e:
+        logger.error("Error streaming knowledge base answer: %s", e)
+        yield orjson.dumps({"type": "error", "error": f"Error querying knowledge base: {str(e)}"}) + b"\n"
 
-@app.post("/query_knowledge_base")
-async def query_knowledge_base(request: QueryRequest):
+@app.post("/query_knowledge_base", response_model=None)
+async def query_knowledge_base(
+    raw_request: Request,
+    stream: bool = Query(default=False, description="Stream the sources, then the answer tokens, as NDJSON")
+):
     """
     Query the knowledge base using RAG to answer questions about the research articles
+    
+    With stream=true the response is NDJSON: a "sources" event first, then
+    "token" events carrying the answer as it is generated; a failed stream ends
+    with an "error" event.
     """
+    request = await decode_body(raw_request, QueryRequest)
+    
+    if stream:
+        return StreamingResponse(
+            stream_rag_events(get_rag_service().query_knowledge_base_stream(
+                question=request.question,
+                k=request.k,
+                filters=request.filters
+            )),
+            media_type="application/x-ndjson"
+        )
+    
     try:
-        result = await rag_service.query_knowledge_base(
+        result = await get_rag_service().query_knowledge_base(
             question=request.question,
             k=request.k,
             filters=request.filters
         )
-        return result
+        return ORJSONResponse(result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error querying knowledge base: {str(e)}")
 
@@ -135,7 +425,7 @@ async def multi_article_summary(request: MultiArticleSummaryRequest):
     Generate a synthesized summary across multiple specific articles
     """
     try:
-        result = await rag_service.multi_article_summary(
+        result = await get_rag_service().multi_article_summary(
             article_titles=request.article_titles,
             focus_question=request.focus_question
         )
@@ -149,23 +439,150 @@ async def suggest_research_gaps(domain: str = Query(default="risk management")):
     Analyze the knowledge base to suggest research gaps in a specific domain
     """
     try:
-        result = await rag_service.suggest_research_gaps(domain=domain)
+        result = await get_rag_service().suggest_research_gaps(domain=domain)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error analyzing research gaps: {str(e)}")
 
+# Long LLM-backed requests can run as background jobs that clients poll. Status and
+# results are kept in SQLite so any worker can answer a poll; finished jobs expire
+# after the TTL. Running tasks are held here until they finish, since the event loop
+# keeps only weak references to tasks.
+JOB_TTL_SECONDS = 3600
+running_jobs: Set[asyncio.Task] = set()
+
+@lru_cache(maxsize=None)
+def get_job_store():
+    from app.tools.job_store import JobStore
+    return JobStore(ttl_seconds=JOB_TTL_SECONDS)
+
+async def run_job(job_id: str, coro):
+    """Run a job's coroutine and record its outcome in the job store"""
+    try:
+        result = await coro
+        status, payload = "done", result
+    except asyncio.CancelledError:
+        status, payload = "failed", "Job was cancelled"
+    except Exception as e:
+        status, payload = "failed", str(e)
+    
+    try:
+        await asyncio.to_thread(get_job_store().finish, job_id, status, payload)
+    except Exception as e:
+        logger.error("Error recording outcome of job %s: %s", job_id, e)
+
+async def submit_job(coro) -> ORJSONResponse:
+    """Start a coroutine as a background job and return its ID for /job polling"""
+    job_id = uuid.uuid4().hex
+    await asyncio.to_thread(get_job_store().start, job_id)
+    
+    task = asyncio.create_task(run_job(job_id, coro))
+    running_jobs.add(task)
+    task.add_done_callback(running_jobs.discard)
+    return ORJSONResponse({"job_id": job_id}, status_code=202)
+
+@app.post("/query_knowledge_base/submit", response_model=None)
+async def submit_query_knowledge_base(raw_request: Request):
+    """Start a knowledge base query as a background job"""
+    request = await decode_body(raw_request, QueryRequest)
+    return await submit_job(get_rag_service().query_knowledge_base(
+        question=request.question,
+        k=request.k,
+        filters=request.filters
+    ))
+
+@app.post("/multi_article_summary/submit", response_model=None)
+async def submit_multi_article_summary(request: MultiArticleSummaryRequest):
+    """Start a multi-article summary as a background job"""
+    return await submit_job(get_rag_service().multi_article_summary(
+        article_titles=request.article_titles,
+        focus_question=request.focus_question
+    ))
+
+@app.post("/suggest_research_gaps/submit", response_model=None)
+async def submit_suggest_research_gaps(domain: str = Query(default="risk management")):
+    """Start a research gap analysis as a background job"""
+    return await submit_job(get_rag_service().suggest_research_gaps(domain=domain))
+
+@app.get("/job/{job_id}", response_model=None)
+async def get_job(job_id: str):
+    """
+    Poll a background job
+    
+    Returns {"status": "running"}, {"status": "done", "result": ...} or
+    {"status": "failed", "error": ...}
+    """
+    job = await asyncio.to_thread(get_job_store().get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired job")
+    return ORJSONResponse(job)
+
 @app.get("/knowledge_base_stats")
 async def get_knowledge_base_stats():
     """
     Get statistics about the current knowledge base
     """
     try:
-        stats = rag_service.get_knowledge_base_stats()
+        stats = knowledge_base_stats_cache.get("stats")
+        if stats is None:
+            stats = await asyncio.to_thread(lambda: get_vector_store().get_collection_stats())
+            if "error" not in stats:
+                knowledge_base_stats_cache.set("stats", stats)
         return stats
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting knowledge base stats: {str(e)}")
 
-@app.get("/search_similar")
+# Upper bound on calls per /batch request
+MAX_BATCH_CALLS = 20
+
+async def dispatch_batch_call(client: httpx.AsyncClient, call: BatchCall) -> dict:
+    """Run one call of a batch against this app in-process and capture its response"""
+    try:
+        url = httpx.URL(call.endpoint)
+    except httpx.InvalidURL as e:
+        return {"status": 400, "body": {"detail": f"Invalid endpoint: {str(e)}"}}
+    
+    # Only paths on this app: no scheme or host (which also catches "//host/..."),
+    # compared after decoding and normalizing the way routing will see them
+    if url.is_absolute_url or url.host or not url.path.startswith("/"):
+        return {"status": 400, "body": {"detail": "Batch endpoints must be paths on this API"}}
+    if posixpath.normpath(unquote(url.path)) == "/batch":
+        return {"status": 400, "body": {"detail": "Nested batches are not allowed"}}
+    
+    method = call.method.upper()
+    if method == "GET":
+        response = await client.get(call.endpoint, params=call.body)
+    else:
+        response = await client.request(method, call.endpoint, json=call.body)
+    
+    try:
+        body = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        body = response.text
+    return {"status": response.status_code, "body": body}
+
+@app.post("/batch", response_model=None)
+async def batch(raw_request: Request):
+    """
+    Run several API calls in one round trip
+    
+    The body is a list of {endpoint, method, body} calls; they are served
+    concurrently in-process and the response is a list of {status, body}
+    aligned with the calls.
+    """
+    calls = await decode_body(raw_request, List[BatchCall])
+    if len(calls) > MAX_BATCH_CALLS:
+        raise HTTPException(status_code=422, detail=f"At most {MAX_BATCH_CALLS} calls per batch")
+    
+    # Calls go straight to the ASGI app, with no network hop
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://smartlit", timeout=None
+    ) as client:
+        results = await asyncio.gather(*(dispatch_batch_call(client, call) for call in calls))
+    
+    return ORJSONResponse(results)
+
+@app.get("/search_similar", response_model=None)
 async def search_similar(
     query: str = Query(..., description="Search query"),
     k: int = Query(default=5, description="Number of results to return"),
@@ -185,7 +602,7 @@ async def search_similar(
         if journal:
             filters["journal"] = journal
         
-        results = vector_store.search_similar(query=query, k=k, **filters)
+        results = await asyncio.to_thread(get_vector_store().search_similar, query=query, k=k, **filters)
         
         # Format results for API response
         formatted_results = []
@@ -196,15 +613,46 @@ async def search_similar(
                 "relevance_score": getattr(doc, 'relevance_score', None)
             })
         
-        return {
+        return ORJSONResponse({
             "query": query,
             "results": formatted_results,
             "total_found": len(formatted_results),
             "filters_applied": filters
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error searching similar documents: {str(e)}")
 
+# Uploads are spooled to disk in fixed-size chunks and rejected once they exceed the cap
+MAX_UPLOAD_SIZE_MB = 50
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+async def save_upload_to_tempfile(file: UploadFile, max_size_mb: int = MAX_UPLOAD_SIZE_MB) -> str:
+    """
+    Stream an uploaded PDF to a temporary file, enforcing the size limit mid-stream
+    
+    Returns:
+        Path of the temporary file; the caller is responsible for removing it
+    """
+    max_bytes = max_size_mb * 1024 * 1024
+    bytes_written = 0
+    
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+        try:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                bytes_written += len(chunk)
+                if bytes_written > max_bytes:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"File size exceeds maximum allowed size ({max_size_mb} MB)"
+                    )
+                tmp.write(chunk)
+        except BaseException:
+            tmp.close()
+            os.remove(tmp.name)
+            raise
+    
+    return tmp.name
+
 @app.post("/upload_pdf")
 async def upload_pdf(
     file: UploadFile = File(...),
@@ -220,12 +668,15 @@ async def upload_pdf(
     if not file.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail="Only PDF files are allowed")
     
+    pdf_path = None
     try:
-        # Read the file content
-        pdf_content = await file.read()
+        pdf_processor = get_pdf_processor()
+        
+        # Stream the upload to disk instead of holding it in memory
+        pdf_path = await save_upload_to_tempfile(file)
         
         # Validate the PDF
-        validation = pdf_processor.validate_pdf(pdf_content)
+        validation = await pdf_processor.validate_pdf_async(pdf_path, max_size_mb=MAX_UPLOAD_SIZE_MB)
         if not validation["valid"]:
             raise HTTPException(status_code=400, detail=validation["error"])
         
@@ -242,23 +693,27 @@ async def upload_pdf(
         
         # Process the PDF
         result = await pdf_processor.process_pdf(
-            pdf_content=pdf_content,
+            pdf_source=pdf_path,
             filename=file.filename,
             custom_metadata=custom_metadata if custom_metadata else None
         )
         
         if result["success"]:
-            # Add to Google Sheets if analysis was successful
-            try:
-                sheets_handler.append_articles([result["article"]])
-                result["added_to_sheets"] = True
-            except Exception as e:
-                result["added_to_sheets"] = False
-                result["sheets_error"] = str(e)
+            # A re-uploaded file is already in the knowledge base and the sheet
+            if not result.get("duplicate"):
+                invalidate_knowledge_base_caches()
+                
+                # Add to Google Sheets if analysis was successful
+                try:
+                    await asyncio.to_thread(get_sheets_handler().append_articles, [result["article"]])
+                    result["added_to_sheets"] = True
+                except Exception as e:
+                    result["added_to_sheets"] = False
+                    result["sheets_error"] = str(e)
             
             return {
                 "success": True,
-                "message": "PDF processed successfully",
+                "message": "PDF already in knowledge base" if result.get("duplicate") else "PDF processed successfully",
                 "filename": file.filename,
                 "article": {
                     "title": result["article"].get("title", ""),
@@ -284,6 +739,9 @@ async def upload_pdf(
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing PDF: {str(e)}")
+    finally:
+        if pdf_path:
+            os.remove(pdf_path)
 
 @app.get("/pdf_info")
 async def get_pdf_info(file: UploadFile = File(...)):
@@ -293,9 +751,10 @@ async def get_pdf_info(file: UploadFile = File(...)):
     if not file.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail="Only PDF files are allowed")
     
+    pdf_path = None
     try:
-        pdf_content = await file.read()
-        info = pdf_processor.get_pdf_info(pdf_content)
+        pdf_path = await save_upload_to_tempfile(file)
+        info = await get_pdf_processor().get_pdf_info_async(pdf_path)
         
         if "error" in info:
             raise HTTPException(status_code=400, detail=info["error"])
@@ -309,8 +768,31 @@ async def get_pdf_info(file: UploadFile = File(...)):
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error reading PDF info: {str(e)}")
+    finally:
+        if pdf_path:
+            os.remove(pdf_path)
+
+def build_graph(articles: List[dict], graph_type: str) -> Dict[str, Any]:
+    """Build the requested network and its HTML visualization for a set of articles"""
+    # Create the appropriate network
+    citation_graph = get_citation_graph()
+    if graph_type == "author":
+        network_data = citation_graph.create_author_network(articles)
+    elif graph_type == "keyword":
+        network_data = citation_graph.create_keyword_network(articles)
+    elif graph_type == "article":
+        network_data = citation_graph.create_article_similarity_network(articles)
+    
+    # Generate HTML visualization
+    html_viz = citation_graph.generate_html_visualization(network_data, graph_type)
+    
+    return {
+        "total_articles": len(articles),
+        "network_stats": network_data["stats"],
+        "html_visualization": html_viz
+    }
 
-@app.post("/generate_citation_graph")
+@app.post("/generate_citation_graph", response_model=None)
 async def generate_citation_graph(
     topic: str = Query(..., description="Topic to search for articles"),
     graph_type: str = Query(default="author", description="Type of graph: 'author', 'keyword', or 'article'"),
@@ -324,8 +806,14 @@ async def generate_citation_graph(
         raise HTTPException(status_code=400, detail=f"graph_type must be one of: {valid_types}")
     
     try:
+        cache = citation_graph_cache
+        cache_key = (topic, graph_type, max_articles)
+        graph = cache.get(cache_key)
+        if graph is not None:
+            return ORJSONResponse({"success": True, "topic": topic, "graph_type": graph_type, **graph})
+        
         # Search for articles on the topic
-        articles = crossref_tool._run(topic)
+        articles = await search_crossref(topic)
         
         # Limit the number of articles for performance
         articles = articles[:max_articles]
@@ -333,31 +821,49 @@ async def generate_citation_graph(
         if not articles:
             raise HTTPException(status_code=404, detail="No articles found for the given topic")
         
-        # Create the appropriate network
-        if graph_type == "author":
-            network_data = citation_graph.create_author_network(articles)
-        elif graph_type == "keyword":
-            network_data = citation_graph.create_keyword_network(articles)
-        elif graph_type == "article":
-            network_data = citation_graph.create_article_similarity_network(articles)
-        
-        # Generate HTML visualization
-        html_viz = citation_graph.generate_html_visualization(network_data, graph_type)
+        graph = build_graph(articles, graph_type)
+        cache.set(cache_key, graph)
         
-        return {
+        return ORJSONResponse({
             "success": True,
             "topic": topic,
             "graph_type": graph_type,
-            "total_articles": len(articles),
-            "network_stats": network_data["stats"],
-            "html_visualization": html_viz
-        }
+            **graph
+        })
     
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating citation graph: {str(e)}")
 
+def articles_from_documents(docs: list) -> List[dict]:
+    """
+    Collapse retrieved chunks into one article record per title
+    
+    Titles are deduplicated first, keeping the first (most relevant) chunk, so
+    article records are only built once per unique title.
+    """
+    first_chunks = {}
+    for doc in docs:
+        title = doc.metadata.get('title')
+        if title and title not in first_chunks:
+            first_chunks[title] = doc
+    
+    articles = []
+    for title, doc in first_chunks.items():
+        metadata = doc.metadata
+        authors = metadata.get('authors')
+        articles.append({
+            'title': title,
+            'authors': authors.split(', ') if authors else [],
+            'year': metadata.get('year'),
+            'journal': metadata.get('journal', ''),
+            'risk_type': metadata.get('risk_type', ''),
+            'level_of_analysis': metadata.get('level_of_analysis', ''),
+            'abstract': doc.page_content[:500]  # Use chunk content as abstract
+        })
+    return articles
+
 @app.post("/generate_graph_from_knowledge_base")
 async def generate_graph_from_knowledge_base(
     graph_type: str = Query(default="author", description="Type of graph: 'author', 'keyword', or 'article'"),
@@ -372,29 +878,19 @@ async def generate_graph_from_knowledge_base(
         raise HTTPException(status_code=400, detail=f"graph_type must be one of: {valid_types}")
     
     try:
+        cache = knowledge_base_graph_cache
+        cache_key = (query, graph_type, max_results)
+        graph = cache.get(cache_key)
+        if graph is not None:
+            return {"success": True, "query": query, "graph_type": graph_type, **graph}
+        
         # Get articles from knowledge base
         if query:
             # Search for specific articles
-            docs = vector_store.search_similar(query=query, k=max_results)
+            docs = await asyncio.to_thread(get_vector_store().search_similar, query=query, k=max_results)
             
             # Extract article data from document metadata
-            articles = []
-            seen_titles = set()
-            
-            for doc in docs:
-                title = doc.metadata.get('title')
-                if title and title not in seen_titles:
-                    article = {
-                        'title': title,
-                        'authors': doc.metadata.get('authors', '').split(', ') if doc.metadata.get('authors') else [],
-                        'year': doc.metadata.get('year'),
-                        'journal': doc.metadata.get('journal', ''),
-                        'risk_type': doc.metadata.get('risk_type', ''),
-                        'level_of_analysis': doc.metadata.get('level_of_analysis', ''),
-                        'abstract': doc.page_content[:500]  # Use chunk content as abstract
-                    }
-                    articles.append(article)
-                    seen_titles.add(title)
+            articles = articles_from_documents(docs)
         else:
             # This would require a method to get all articles from vector store
             # For now, return an error asking for a query
@@ -403,24 +899,14 @@ async def generate_graph_from_knowledge_base(
         if not articles:
             raise HTTPException(status_code=404, detail="No articles found in knowledge base")
         
-        # Create the appropriate network
-        if graph_type == "author":
-            network_data = citation_graph.create_author_network(articles)
-        elif graph_type == "keyword":
-            network_data = citation_graph.create_keyword_network(articles)
-        elif graph_type == "article":
-            network_data = citation_graph.create_article_similarity_network(articles)
-        
-        # Generate HTML visualization
-        html_viz = citation_graph.generate_html_visualization(network_data, graph_type)
+        graph = build_graph(articles, graph_type)
+        cache.set(cache_key, graph)
         
         return {
             "success": True,
             "query": query,
             "graph_type": graph_type,
-            "total_articles": len(articles),
-            "network_stats": network_data["stats"],
-            "html_visualization": html_viz
+            **graph
         }
     
     except HTTPException:
@@ -428,25 +914,28 @@ async def generate_graph_from_knowledge_base(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating graph from knowledge base: {str(e)}")
 
-@app.post("/run_monitoring")
+@app.post("/run_monitoring", response_model=None)
 async def run_article_monitoring(topics: Optional[List[str]] = None):
     """
     Run article monitoring manually for specified topics or default topics
     """
     try:
+        from app.tools.article_monitor import run_manual_monitoring
         result = await run_manual_monitoring(topics)
-        return result
+        invalidate_knowledge_base_caches()
+        # Serialize the summary (including every analyzed article) straight through orjson
+        return ORJSONResponse(result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error running article monitoring: {str(e)}")
 
-@app.get("/monitoring_status")
+@app.get("/monitoring_status", response_model=None)
 async def get_monitoring_status():
     """
     Get current article monitoring status and configuration
     """
     try:
-        status = article_monitor.get_status()
-        return status
+        status = get_article_monitor().get_status()
+        return ORJSONResponse(status)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting monitoring status: {str(e)}")
 
@@ -468,6 +957,7 @@ async def update_monitoring_config(
         if max_days_since_publication is not None:
             config_updates["max_days_since_publication"] = max_days_since_publication
         
+        article_monitor = get_article_monitor()
         article_monitor.update_config(**config_updates)
         
         return {
@@ -487,6 +977,7 @@ async def manage_monitoring_topics(
     Add or remove topics from monitoring
     """
     try:
+        article_monitor = get_article_monitor()
         if action == "add":
             article_monitor.add_topic(topic)
             return {
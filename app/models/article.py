@@ -1,21 +1,44 @@
-from sqlalchemy import Column, Integer, String, Text
-from sqlalchemy.ext.declarative import declarative_base
+from typing import Any, Dict, List, Optional
+from sqlalchemy import Integer, String, Text, insert
+from sqlalchemy.orm import DeclarativeBase, Mapped, MappedAsDataclass, Session, mapped_column
 
-Base = declarative_base()
+class Base(MappedAsDataclass, DeclarativeBase):
+    pass
 
 class Article(Base):
     __tablename__ = "articles"
-    
-    id = Column(Integer, primary_key=True)
-    title = Column(String(500))
-    authors = Column(String(500))
-    year = Column(Integer)
-    journal = Column(String(255))
-    objective = Column(Text)
-    methodology = Column(Text)
-    key_variables = Column(Text)
-    risk_type = Column(String(255))
-    level_of_analysis = Column(String(255))
-    main_findings = Column(Text)
-    implications = Column(Text)
-    limitations = Column(Text) 
\ No newline at end of file
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, init=False)
+    title: Mapped[Optional[str]] = mapped_column(String(500), default=None)
+    authors: Mapped[Optional[str]] = mapped_column(String(500), default=None)
+    year: Mapped[Optional[int]] = mapped_column(Integer, default=None)
+    journal: Mapped[Optional[str]] = mapped_column(String(255), default=None)
+    objective: Mapped[Optional[str]] = mapped_column(Text, default=None)
+    methodology: Mapped[Optional[str]] = mapped_column(Text, default=None)
+    key_variables: Mapped[Optional[str]] = mapped_column(Text, default=None)
+    risk_type: Mapped[Optional[str]] = mapped_column(String(255), default=None)
+    level_of_analysis: Mapped[Optional[str]] = mapped_column(String(255), default=None)
+    main_findings: Mapped[Optional[str]] = mapped_column(Text, default=None)
+    implications: Mapped[Optional[str]] = mapped_column(Text, default=None)
+    limitations: Mapped[Optional[str]] = mapped_column(Text, default=None)
+
+def bulk_insert_articles(session: Session, rows: List[Dict[str, Any]]) -> None:
+    """
+    Insert many article rows with one executemany INSERT, without building ORM instances
+
+    Args:
+        session: Active SQLAlchemy session
+        rows: Article dictionaries; keys that are not Article columns are ignored
+    """
+    if not rows:
+        return
+
+    columns = [column.key for column in Article.__table__.columns if column.key != "id"]
+    values = []
+    for row in rows:
+        value = {column: row.get(column) for column in columns}
+        if isinstance(value["authors"], list):
+            value["authors"] = ", ".join(value["authors"])
+        values.append(value)
+
+    session.execute(insert(Article), values)
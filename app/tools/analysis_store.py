@@ -0,0 +1,46 @@
+import sqlite3
+import threading
+from typing import Any, Dict, Optional
+
+import orjson
+
+# Default on-disk location of the persistent analysis cache
+ANALYSIS_DB_PATH = "analysis_cache.db"
+
+
+class AnalysisStore:
+    def __init__(self, path: str = ANALYSIS_DB_PATH):
+        """
+        On-disk cache of LLM analyses keyed by abstract content hash
+
+        Survives restarts and is shared by all uvicorn workers (WAL mode), so identical
+        abstracts, e.g. a preprint and its published version, are analyzed only once.
+
+        Args:
+            path: SQLite database file
+        """
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS analyses ("
+            "abstract_hash TEXT PRIMARY KEY, "
+            "analysis BLOB NOT NULL)"
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored analysis for an abstract hash, or None"""
+        with self._lock:
+            row = self._conn.execute("SELECT analysis FROM analyses WHERE abstract_hash = ?", (key,)).fetchone()
+        return orjson.loads(row[0]) if row is not None else None
+
+    def set(self, key: str, analysis: Dict[str, Any]) -> None:
+        """Store an analysis, replacing any previous one for the same abstract"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO analyses (abstract_hash, analysis) VALUES (?, ?)",
+                (key, orjson.dumps(analysis))
+            )
+
+    def close(self) -> None:
+        self._conn.close()
@@ -1,9 +1,182 @@
+import asyncio
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple, Union
+
+from .analysis_store import AnalysisStore
 from .langchain_model import LangChainModel
+from .rate_limiter import TokenBucket, retry_after_seconds
+
+# The one cache of LLM analyses: an in-memory LRU keyed by a hash of the abstract,
+# shared by every analyzer in the process and backed by the on-disk AnalysisStore,
+# so overlapping CrossRef results and re-uploaded PDFs skip the LLM call
+ANALYSIS_CACHE_SIZE = 4096
+DEFAULT_BATCH_CONCURRENCY = 16
+_analysis_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_pending_analyses: Dict[str, "asyncio.Future"] = {}
+
+
+@lru_cache(maxsize=1)
+def get_analysis_store() -> AnalysisStore:
+    """Persistent second-level cache behind the in-memory LRU"""
+    return AnalysisStore()
+
+
+def abstract_hash(abstract: str) -> str:
+    """Return a compact content hash used as the cache key for an abstract"""
+    return hashlib.blake2b(abstract.encode(), digest_size=16).hexdigest()
+
 
 class ArticleAnalyzer:
     def __init__(self):
         self.model = LangChainModel()
-    
-    async def analyze(self, abstract: str) -> dict:
-        result = await self.model.analyze_article(abstract)
-        return result 
\ No newline at end of file
+
+    async def analyze(self, abstract: str) -> Tuple[Dict[str, Any], Dict[str, int]]:
+        """
+        Analyze an abstract, reusing earlier results for identical content
+
+        Cache hits (including requests that join an analysis already in flight)
+        report zero token usage since no new tokens were spent.
+        """
+        key = abstract_hash(abstract)
+
+        cached = _analysis_cache.get(key)
+        if cached is not None:
+            _analysis_cache.move_to_end(key)
+            return dict(cached), _empty_token_usage()
+
+        pending = _pending_analyses.get(key)
+        if pending is not None:
+            analysis = await asyncio.shield(pending)
+            return dict(analysis), _empty_token_usage()
+
+        stored = get_analysis_store().get(key)
+        if stored is not None:
+            self._remember(key, stored)
+            return dict(stored), _empty_token_usage()
+
+        future = asyncio.get_running_loop().create_future()
+        _pending_analyses[key] = future
+        try:
+            analysis, token_usage = await self.model.analyze_article(abstract)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody joined this analysis
+            future.exception()
+            raise
+        finally:
+            del _pending_analyses[key]
+
+        future.set_result(analysis)
+        self._remember(key, analysis)
+        get_analysis_store().set(key, analysis)
+
+        return dict(analysis), token_usage
+
+    def _remember(self, key: str, analysis: Dict[str, Any]) -> None:
+        _analysis_cache[key] = analysis
+        if len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
+
+    async def analyze_batch(
+        self,
+        abstracts: List[str],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        rate_limiter: Optional[TokenBucket] = None
+    ) -> List[Union[Tuple[Dict[str, Any], Dict[str, int]], Exception]]:
+        """
+        Analyze several abstracts concurrently, at most max_concurrency at a time
+
+        When a rate limiter is given, each analysis takes one token before calling the
+        LLM, and a rate-limit error carrying Retry-After pauses the limiter.
+
+        Returns:
+            One entry per abstract, in order: an (analysis, token_usage) tuple, or the
+            exception raised for that abstract so one failure doesn't abort the batch
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def analyze_bounded(abstract: str):
+            async with semaphore:
+                return await self.analyze_rate_limited(abstract, rate_limiter)
+
+        return await asyncio.gather(
+            *(analyze_bounded(abstract) for abstract in abstracts),
+            return_exceptions=True
+        )
+
+    async def analyze_rate_limited(
+        self,
+        abstract: str,
+        rate_limiter: Optional[TokenBucket] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, int]]:
+        """
+        Analyze one abstract after taking a token from the rate limiter, if any
+
+        A rate-limit error carrying Retry-After pauses the limiter before it is re-raised.
+        """
+        if rate_limiter is None:
+            return await self.analyze(abstract)
+
+        await rate_limiter.acquire()
+        try:
+            return await self.analyze(abstract)
+        except Exception as e:
+            delay = retry_after_seconds(e)
+            if delay:
+                rate_limiter.pause(delay)
+            raise
+
+
+    async def analyze_bulk(
+        self,
+        abstracts: List[str]
+    ) -> List[Union[Tuple[Dict[str, Any], Dict[str, int]], Exception]]:
+        """
+        Analyze many abstracts through the LLM Batch API, for non-interactive backfills
+
+        Abstracts already in the analysis cache are answered directly; the rest go
+        to a single batch job, which is cheaper but may take hours to complete.
+
+        Returns:
+            One entry per abstract, in order: an (analysis, token_usage) tuple, or the
+            exception raised for that abstract
+        """
+        store = get_analysis_store()
+        results: List[Any] = [None] * len(abstracts)
+        misses: Dict[str, List[int]] = {}
+        for i, abstract in enumerate(abstracts):
+            key = abstract_hash(abstract)
+            cached = _analysis_cache.get(key) or store.get(key)
+            if cached is not None:
+                self._remember(key, cached)
+                results[i] = (dict(cached), _empty_token_usage())
+            else:
+                misses.setdefault(key, []).append(i)
+
+        if misses:
+            # Submit each distinct abstract once; duplicates share its result
+            indices = list(misses.values())
+            outcomes = await self.model.batch_analyze([abstracts[group[0]] for group in indices])
+            for key, group, outcome in zip(misses, indices, outcomes):
+                if isinstance(outcome, Exception):
+                    for i in group:
+                        results[i] = outcome
+                    continue
+
+                analysis, token_usage = outcome
+                self._remember(key, analysis)
+                store.set(key, analysis)
+                results[group[0]] = (dict(analysis), token_usage)
+                for i in group[1:]:
+                    results[i] = (dict(analysis), _empty_token_usage())
+
+        return results
+
+
+def _empty_token_usage() -> Dict[str, int]:
+    return {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
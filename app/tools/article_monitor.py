@@ -1,8 +1,5 @@
 import asyncio
-import schedule
-import time
-import json
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import List, Dict, Any, Optional
 import logging
 
@@ -10,6 +7,19 @@ from .crossref import CrossRefSearchTool
 from .article_analyzer import ArticleAnalyzer
 from .vector_store import VectorStoreService
 from .sheets_handler import GoogleSheetsHandler
+from .rate_limiter import TokenBucket
+from .processed_set import ProcessedSet, article_key
+
+# Upper bound on CrossRef searches in flight across concurrently processed topics
+MAX_CONCURRENT_CROSSREF_SEARCHES = 5
+
+# Request budgets for the token-bucket limiters
+CROSSREF_REQUESTS_PER_MINUTE = 50
+LLM_REQUESTS_PER_MINUTE = 300
+LLM_BURST_REQUESTS = 10
+
+# Capacity of the queues between monitoring pipeline stages
+PIPELINE_QUEUE_SIZE = 64
 
 
 class ArticleMonitor:
@@ -24,8 +34,8 @@ class ArticleMonitor:
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
         
-        # Track processed articles to avoid duplicates
-        self.processed_titles = set()
+        # Track processed articles by content key to avoid duplicates (persisted in SQLite)
+        self.processed_articles = ProcessedSet()
         
         # Default search topics
         self.default_topics = [
@@ -36,128 +46,197 @@ class ArticleMonitor:
             "enterprise risk management"
         ]
         
+        # Bound concurrent CrossRef searches when topics are processed in parallel
+        self._crossref_semaphore = asyncio.BoundedSemaphore(MAX_CONCURRENT_CROSSREF_SEARCHES)
+        
+        # Proactive per-endpoint rate limits so batched calls wait instead of hitting 429s
+        self._crossref_bucket = TokenBucket(CROSSREF_REQUESTS_PER_MINUTE, CROSSREF_REQUESTS_PER_MINUTE / 60)
+        self._llm_bucket = TokenBucket(LLM_BURST_REQUESTS, LLM_REQUESTS_PER_MINUTE / 60)
+        
+        # Set by stop_monitoring() to end schedule_monitoring()
+        self._stop = asyncio.Event()
+        
         # Monitoring configuration
         self.config = {
             "max_articles_per_topic": 5,
             "min_days_since_publication": 1,
             "max_days_since_publication": 30,
+            "analyzer_batch_size": 16,
+            "storage_flush_size": 32,
             "enabled": True
         }
     
-    def load_processed_titles(self, filepath: str = "processed_articles.json") -> None:
-        """Load previously processed article titles from file"""
-        try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-                self.processed_titles = set(data.get('processed_titles', []))
-                self.logger.info(f"Loaded {len(self.processed_titles)} processed article titles")
-        except FileNotFoundError:
-            self.logger.info("No previous processed articles file found, starting fresh")
-        except Exception as e:
-            self.logger.error(f"Error loading processed titles: {str(e)}")
-    
-    def save_processed_titles(self, filepath: str = "processed_articles.json") -> None:
-        """Save processed article titles to file"""
+    def save_processed_articles(self) -> None:
+        """Persist article keys processed in this cycle with one batched insert"""
         try:
-            data = {
-                "processed_titles": list(self.processed_titles),
-                "last_updated": datetime.now().isoformat()
-            }
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
-            self.logger.info(f"Saved {len(self.processed_titles)} processed article titles")
+            saved = self.processed_articles.flush()
+            self.logger.info(f"Saved {saved} new processed article keys")
         except Exception as e:
-            self.logger.error(f"Error saving processed titles: {str(e)}")
+            self.logger.error(f"Error saving processed articles: {str(e)}")
     
     def is_article_recent(self, article: Dict[str, Any]) -> bool:
         """Check if article is within the specified date range"""
+        pub_date = article.get('pub_date')
+        if pub_date:
+            try:
+                age = date.today() - date.fromisoformat(pub_date)
+                return age <= timedelta(days=self.config["max_days_since_publication"])
+            except ValueError:
+                pass
+        
+        # Fall back to the publication year when no full date is available
         year = article.get('year')
         if not year:
             return False
         
-        # Simple check based on year (could be enhanced with full date parsing)
         current_year = datetime.now().year
         min_year = current_year - (self.config["max_days_since_publication"] // 365)
         
         return year >= min_year
     
-    async def search_and_analyze_new_articles(self, topic: str) -> List[Dict[str, Any]]:
+    async def find_new_articles(self, topic: str) -> List[Dict[str, Any]]:
         """
-        Search for new articles on a topic and analyze them
+        Search CrossRef for a topic and claim the articles that still need analysis
         
         Args:
             topic: Search topic
             
         Returns:
-            List of newly processed articles
+            Recent, unprocessed articles with an abstract
         """
-        if not self.config["enabled"]:
-            return []
+        self.logger.info(f"Searching for new articles on topic: {topic}")
         
-        try:
-            self.logger.info(f"Searching for new articles on topic: {topic}")
+        # Search for articles
+        async with self._crossref_semaphore:
+            articles = await self.crossref_tool._arun(topic, rate_limiter=self._crossref_bucket)
+        
+        # Filter for new and recent articles
+        new_articles = []
+        for article in articles[:self.config["max_articles_per_topic"]]:
+            key = article_key(article)
             
-            # Search for articles
-            articles = self.crossref_tool._run(topic)
+            # Skip if already processed (formatting variants share a key)
+            if key in self.processed_articles:
+                continue
             
-            # Filter for new and recent articles
-            new_articles = []
-            for article in articles[:self.config["max_articles_per_topic"]]:
-                title = article.get('title', '')
-                
-                # Skip if already processed
-                if title in self.processed_titles:
-                    continue
-                
-                # Skip if not recent enough
-                if not self.is_article_recent(article):
-                    continue
-                
-                # Skip if no abstract
-                if not article.get('abstract'):
-                    continue
-                
-                new_articles.append(article)
+            # Skip if not recent enough
+            if not self.is_article_recent(article):
+                continue
             
-            if not new_articles:
-                self.logger.info(f"No new articles found for topic: {topic}")
-                return []
+            # Skip if no abstract
+            if not article.get('abstract'):
+                continue
             
+            # Claim the article now so concurrently processed topics don't pick it up too
+            self.processed_articles.add(key)
+            new_articles.append(article)
+        
+        if not new_articles:
+            self.logger.info(f"No new articles found for topic: {topic}")
+        else:
             self.logger.info(f"Found {len(new_articles)} new articles for topic: {topic}")
+        
+        return new_articles
+    
+    def _build_full_article(self, article: Dict[str, Any], analysis: Dict[str, Any], topic: str) -> Dict[str, Any]:
+        """Combine article metadata with its analysis"""
+        full_article = {**article, **analysis}
+        full_article["processed_date"] = datetime.now().isoformat()
+        full_article["monitoring_topic"] = topic
+        
+        self.logger.info(f"Analyzed article: {article.get('title', 'Unknown')[:50]}...")
+        return full_article
+    
+    async def _fetch_stage(self, topic_queue: asyncio.Queue, article_queue: asyncio.Queue) -> None:
+        """Pipeline worker: search topics and pass each new article downstream"""
+        while True:
+            try:
+                topic = topic_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
             
-            # Analyze the new articles
-            analyzed_articles = []
-            for article in new_articles:
-                try:
-                    # Analyze article
-                    analysis, token_usage = await self.article_analyzer.analyze(article["abstract"])
-                    
-                    # Combine metadata with analysis
-                    full_article = {**article, **analysis}
-                    full_article["processed_date"] = datetime.now().isoformat()
-                    full_article["monitoring_topic"] = topic
-                    
-                    analyzed_articles.append(full_article)
-                    
-                    # Mark as processed
-                    self.processed_titles.add(article.get('title', ''))
-                    
-                    self.logger.info(f"Analyzed article: {article.get('title', 'Unknown')[:50]}...")
-                    
-                except Exception as e:
-                    self.logger.error(f"Error analyzing article '{article.get('title', 'Unknown')}': {str(e)}")
-                    continue
+            try:
+                for article in await self.find_new_articles(topic):
+                    await article_queue.put((topic, article))
+            except Exception as e:
+                self.logger.error(f"Error searching for articles on topic '{topic}': {str(e)}")
+    
+    async def _analyze_stage(self, article_queue: asyncio.Queue, analyzed_queue: asyncio.Queue,
+                             topic_results: Dict[str, int]) -> None:
+        """Pipeline worker: analyze articles until it receives the None sentinel"""
+        while True:
+            item = await article_queue.get()
+            if item is None:
+                return
             
-            return analyzed_articles
+            topic, article = item
+            try:
+                analysis, token_usage = await self.article_analyzer.analyze_rate_limited(
+                    article["abstract"], self._llm_bucket
+                )
+            except Exception as e:
+                self.logger.error(f"Error analyzing article '{article.get('title', 'Unknown')}': {str(e)}")
+                # Release the claim so the article is retried in a later cycle
+                self.processed_articles.discard(article_key(article))
+                continue
             
-        except Exception as e:
-            self.logger.error(f"Error searching for articles on topic '{topic}': {str(e)}")
-            return []
+            topic_results[topic] += 1
+            await analyzed_queue.put(self._build_full_article(article, analysis, topic))
+    
+    async def _store_stage(self, analyzed_queue: asyncio.Queue, all_articles: List[Dict[str, Any]]) -> None:
+        """Pipeline worker: write analyzed articles in micro-batches until the None sentinel"""
+        batch = []
+        while True:
+            article = await analyzed_queue.get()
+            if article is not None:
+                batch.append(article)
+            
+            if batch and (article is None or len(batch) >= self.config["storage_flush_size"]):
+                # Checkpoint stored articles right away so a crash mid-cycle doesn't redo them;
+                # a failed write releases the claims so the next cycle retries the batch
+                if await self._store_batch(batch):
+                    self.processed_articles.commit(article_key(stored) for stored in batch)
+                else:
+                    for failed in batch:
+                        self.processed_articles.discard(article_key(failed))
+                all_articles.extend(batch)
+                batch = []
+            
+            if article is None:
+                return
+    
+    async def _store_batch(self, batch: List[Dict[str, Any]]) -> bool:
+        """
+        Write one micro-batch to Google Sheets and the vector store concurrently
+        
+        Returns:
+            True when both writes succeeded
+        """
+        sheets_result, vector_result = await asyncio.gather(
+            asyncio.to_thread(self.sheets_handler.append_articles, batch),
+            self.vector_store.add_articles_async(batch),
+            return_exceptions=True
+        )
+        
+        if isinstance(sheets_result, Exception):
+            self.logger.error(f"Error adding articles to Google Sheets: {str(sheets_result)}")
+        else:
+            self.logger.info(f"Added {len(batch)} articles to Google Sheets")
+        
+        if isinstance(vector_result, Exception):
+            self.logger.error(f"Error adding articles to vector store: {str(vector_result)}")
+        else:
+            self.logger.info(f"Added {vector_result['total_chunks']} chunks to vector store")
+        
+        return not isinstance(sheets_result, Exception) and not isinstance(vector_result, Exception)
     
     async def process_all_topics(self) -> Dict[str, Any]:
         """
         Process all configured topics and return summary
         
+        Topics flow through a Fetch -> Analyze -> Store pipeline of worker pools joined
+        by bounded queues, so CrossRef searches, LLM analysis and storage writes overlap.
+        
         Returns:
             Summary of processing results
         """
@@ -167,43 +246,42 @@ class ArticleMonitor:
         
         start_time = datetime.now()
         all_articles = []
-        topic_results = {}
+        topic_results = {topic: 0 for topic in self.default_topics}
         
         self.logger.info("Starting article monitoring cycle")
         
-        # Load previously processed titles
-        self.load_processed_titles()
-        
-        # Process each topic
+        topic_queue = asyncio.Queue()
         for topic in self.default_topics:
-            try:
-                articles = await self.search_and_analyze_new_articles(topic)
-                all_articles.extend(articles)
-                topic_results[topic] = len(articles)
-                
-                # Small delay between topics to be respectful to APIs
-                await asyncio.sleep(2)
-                
-            except Exception as e:
-                self.logger.error(f"Error processing topic '{topic}': {str(e)}")
-                topic_results[topic] = 0
+            topic_queue.put_nowait(topic)
         
-        # Store results if any articles were found
-        if all_articles:
-            try:
-                # Add to Google Sheets
-                self.sheets_handler.append_articles(all_articles)
-                self.logger.info(f"Added {len(all_articles)} articles to Google Sheets")
-                
-                # Add to vector store
-                vector_stats = self.vector_store.add_articles(all_articles)
-                self.logger.info(f"Added {vector_stats['total_chunks']} chunks to vector store")
-                
-            except Exception as e:
-                self.logger.error(f"Error storing articles: {str(e)}")
+        # Bounded queues apply backpressure between stages
+        article_queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        analyzed_queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
         
-        # Save processed titles
-        self.save_processed_titles()
+        fetchers = [
+            asyncio.create_task(self._fetch_stage(topic_queue, article_queue))
+            for _ in range(MAX_CONCURRENT_CROSSREF_SEARCHES)
+        ]
+        analyzers = [
+            asyncio.create_task(self._analyze_stage(article_queue, analyzed_queue, topic_results))
+            for _ in range(self.config["analyzer_batch_size"])
+        ]
+        storer = asyncio.create_task(self._store_stage(analyzed_queue, all_articles))
+        
+        try:
+            # Drain each stage in order, then signal the next one to finish
+            await asyncio.gather(*fetchers)
+            for _ in analyzers:
+                await article_queue.put(None)
+            await asyncio.gather(*analyzers)
+            await analyzed_queue.put(None)
+            await storer
+        finally:
+            for task in (*fetchers, *analyzers, storer):
+                task.cancel()
+        
+        # Save processed articles
+        self.save_processed_articles()
         
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
@@ -250,37 +328,44 @@ class ArticleMonitor:
             "enabled": self.config["enabled"],
             "topics": self.default_topics,
             "config": self.config,
-            "processed_articles_count": len(self.processed_titles)
+            "processed_articles_count": len(self.processed_articles)
         }
     
-    def schedule_monitoring(self, interval_hours: int = 24) -> None:
+    async def schedule_monitoring(self, interval_hours: float = 24) -> None:
         """
-        Schedule regular monitoring
+        Run monitoring cycles every interval_hours until stop_monitoring() is called
+        
+        Each cycle starts one interval after the previous one started, and a cycle
+        that overruns delays the next instead of overlapping with it.
         
         Args:
             interval_hours: Hours between monitoring cycles
         """
-        def run_monitoring():
-            """Wrapper to run async monitoring in sync context"""
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        loop = asyncio.get_running_loop()
+        self._stop.clear()
+        
+        self.logger.info(f"Scheduled monitoring every {interval_hours} hours")
+        
+        while not self._stop.is_set():
+            started = loop.time()
             try:
-                result = loop.run_until_complete(self.process_all_topics())
-                self.logger.info(f"Scheduled monitoring completed: {result['total_articles_processed']} articles")
+                result = await self.process_all_topics()
+                self.logger.info(f"Scheduled monitoring completed: {result.get('total_articles_processed', 0)} articles")
             except Exception as e:
                 self.logger.error(f"Error in scheduled monitoring: {str(e)}")
-            finally:
-                loop.close()
-        
-        # Schedule the monitoring
-        schedule.every(interval_hours).hours.do(run_monitoring)
-        
-        self.logger.info(f"Scheduled monitoring every {interval_hours} hours")
+            
+            # Sleep for the rest of the interval, waking immediately on stop
+            remaining = max(0.0, interval_hours * 3600 - (loop.time() - started))
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=remaining)
+            except asyncio.TimeoutError:
+                pass
         
-        # Keep the scheduler running
-        while True:
-            schedule.run_pending()
-            time.sleep(3600)  # Check every hour
+        self.logger.info("Scheduled monitoring stopped")
+    
+    def stop_monitoring(self) -> None:
+        """Interrupt schedule_monitoring, including a pending sleep"""
+        self._stop.set()
 
 
 # Utility function to run monitoring manually
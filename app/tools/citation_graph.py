@@ -1,69 +1,223 @@
 import networkx as nx
-from pyvis.network import Network
-import json
-from typing import Dict, List, Any, Optional
+import numpy as np
+from scipy import sparse
+import orjson
+from typing import Dict, Iterable, List, Any, Optional, Tuple, Union
 from collections import Counter, defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 import re
 
 from .vector_store import VectorStoreService
 
+# Compiled once at import: runs of at least 3 letters (no digits or underscores)
+DEFAULT_MIN_KEYWORD_LENGTH = 3
+# Whole word tokens; tokens mixing letters with digits or underscores are dropped
+# entirely (not split into letter runs) by the isalpha() check in _keywords_from_text
+_WORD_RE = re.compile(r"\w+")
+
+# Common stop words excluded from keyword extraction
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
+    'by', 'this', 'that', 'these', 'those', 'is', 'are', 'was', 'were', 'be', 'been',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
+    'may', 'might', 'must', 'can', 'cannot', 'from', 'into', 'through', 'during',
+    'before', 'after', 'above', 'below', 'up', 'down', 'out', 'off', 'over', 'under',
+    'again', 'further', 'then', 'once', 'here', 'there', 'when', 'where', 'why', 'how',
+    'all', 'any', 'both', 'each', 'few', 'more', 'most', 'other', 'some', 'such',
+    'no', 'nor', 'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very'
+})
+
+# One pass strips an honorific prefix, a degree/generational suffix, and collapses whitespace
+_AUTHOR_CLEAN_RE = re.compile(
+    r"^\s*(?:Dr|Prof|Mr|Ms|Mrs)\.?\s+(?=\S)|(?<=\S)\s+(?:Jr|Sr|PhD|MD)\.?\s*$|^\s+|\s+$|\s+",
+    re.IGNORECASE
+)
+
+# Node colors by risk type
+RISK_TYPE_COLORS = {
+    'Financial': '#ff6b6b',
+    'Operational': '#4ecdc4', 
+    'Strategic': '#45b7d1',
+    'Credit': '#f9ca24',
+    'Market': '#6c5ce7',
+    'Unknown': '#95a5a6'
+}
+
+# Static vis-network page, read once; graphs only substitute their JSON payloads
+_NETWORK_TEMPLATE = (Path(__file__).resolve().parent.parent / "templates" / "network.html").read_text()
+
+# Rendering options shared by every graph (matches the former PyVis defaults)
+NETWORK_OPTIONS = {
+    "nodes": {"shape": "dot", "font": {"color": "black"}},
+    "physics": {
+        "enabled": True,
+        "stabilization": {"iterations": 100}
+    }
+}
+
+# Repeated abstracts across graph builds reuse their extracted keywords
+KEYWORD_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=KEYWORD_CACHE_SIZE)
+def _keywords_from_text(text: str, min_length: int) -> frozenset:
+    """Extract the lowercase keywords of a text in a single regex scan"""
+    return frozenset(
+        word for word in _WORD_RE.findall(text.lower())
+        if len(word) >= min_length and word.isalpha()
+    ) - _STOP_WORDS
+
+
+# Article fields combined into the text that keywords are extracted from
+KEYWORD_TEXT_FIELDS = ('title', 'abstract', 'objective', 'key_variables', 'main_findings')
+
+
+@dataclass
+class ArticleColumns:
+    """Column-oriented view of a batch of articles, built once by _to_columns"""
+    records: List[Dict[str, Any]]
+    titles: List[Any]
+    risk_type: np.ndarray
+    level_of_analysis: np.ndarray
+    year: np.ndarray
+    authors: List[List[str]]
+    clean_authors: List[List[str]]
+    text: List[str]
+
+
+@lru_cache(maxsize=8192)
+def _clean_author_name(author_name: str) -> str:
+    """Normalize an author name; the same names recur across many articles"""
+    def replace(match: re.Match) -> str:
+        # Interior whitespace collapses to one space; prefixes, suffixes and edges are dropped
+        return ' ' if match.group().isspace() and 0 < match.start() and match.end() < len(author_name) else ''
+    
+    return _AUTHOR_CLEAN_RE.sub(replace, author_name).title()
+
+
+@lru_cache(maxsize=256)
+def _color_by_risk_type(risk_type: str) -> str:
+    """Get color based on risk type"""
+    return RISK_TYPE_COLORS.get(risk_type, '#95a5a6')
+
+
+def _script_json(value: Any) -> str:
+    """Serialize a payload for embedding inside a <script> block"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode().replace("</", "<\\/")
+
+
+def _truncate_label(label: str, max_length: int = 20) -> str:
+    """Truncate labels for better visualization"""
+    return label[:max_length - 3] + "..." if len(label) > max_length else label
+
 
 class CitationGraphGenerator:
     def __init__(self):
         """Initialize the citation graph generator with vector store access"""
         self.vector_store = VectorStoreService()
     
-    def create_author_network(self, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _to_columns(self, articles: List[Dict[str, Any]]) -> ArticleColumns:
         """
-        Create a network graph of author collaborations
+        Transpose article dictionaries into per-field columns in a single pass
+        
+        Author names are cleaned once per unique name rather than once per occurrence.
         
         Args:
             articles: List of article dictionaries
             
+        Returns:
+            ArticleColumns for the articles, in order
+        """
+        clean_names = {}
+        titles, risk_types, levels, years, authors, clean_authors, texts = [], [], [], [], [], [], []
+        
+        for article in articles:
+            article_authors = article.get('authors') or []
+            if isinstance(article_authors, str):
+                article_authors = [article_authors]
+            
+            cleaned = []
+            for author in article_authors:
+                if not author:
+                    continue
+                if author not in clean_names:
+                    clean_names[author] = self._clean_author_name(author)
+                cleaned.append(clean_names[author])
+            
+            titles.append(article.get('title', 'Unknown'))
+            risk_types.append(article.get('risk_type') or None)
+            levels.append(article.get('level_of_analysis') or None)
+            years.append(float(article['year']) if article.get('year') else np.nan)
+            authors.append(article_authors)
+            clean_authors.append(cleaned)
+            texts.append(' '.join([str(article.get(field, '')) for field in KEYWORD_TEXT_FIELDS]))
+        
+        return ArticleColumns(
+            records=list(articles),
+            titles=titles,
+            risk_type=np.array(risk_types, dtype=object),
+            level_of_analysis=np.array(levels, dtype=object),
+            year=np.array(years, dtype=np.float64),
+            authors=authors,
+            clean_authors=clean_authors,
+            text=texts
+        )
+    
+    def create_author_network(self, articles: Union[List[Dict[str, Any]], ArticleColumns]) -> Dict[str, Any]:
+        """
+        Create a network graph of author collaborations
+        
+        Args:
+            articles: List of article dictionaries, or their ArticleColumns
+            
         Returns:
             Dictionary containing network data and statistics
         """
+        columns = articles if isinstance(articles, ArticleColumns) else self._to_columns(articles)
         G = nx.Graph()
         
         # Track author information
         author_articles = defaultdict(list)
         author_info = {}
+        collaborations = []
+        collaboration_titles = []
         
-        for article in articles:
-            authors = article.get('authors', [])
-            if isinstance(authors, str):
-                authors = [authors]
+        for i, clean_authors in enumerate(columns.clean_authors):
+            if len(clean_authors) <= 1:
+                continue
             
-            # Clean author names
-            clean_authors = [self._clean_author_name(author) for author in authors if author]
+            title = columns.titles[i]
+            risk_type = columns.risk_type[i]
+            year = columns.year[i]
             
-            if len(clean_authors) > 1:
-                # Add authors as nodes
-                for author in clean_authors:
-                    if author not in author_info:
-                        author_info[author] = {
-                            'articles': 0,
-                            'risk_types': set(),
-                            'years': []
-                        }
-                    
-                    author_info[author]['articles'] += 1
-                    if article.get('risk_type'):
-                        author_info[author]['risk_types'].add(article['risk_type'])
-                    if article.get('year'):
-                        author_info[author]['years'].append(article['year'])
-                    
-                    author_articles[author].append(article.get('title', 'Unknown'))
+            # Add authors as nodes
+            for author in clean_authors:
+                if author not in author_info:
+                    author_info[author] = {
+                        'articles': 0,
+                        'risk_types': set(),
+                        'years': []
+                    }
                 
-                # Add collaboration edges
-                for i, author1 in enumerate(clean_authors):
-                    for author2 in clean_authors[i+1:]:
-                        if G.has_edge(author1, author2):
-                            G[author1][author2]['weight'] += 1
-                            G[author1][author2]['collaborations'].append(article.get('title', 'Unknown'))
-                        else:
-                            G.add_edge(author1, author2, weight=1, 
-                                     collaborations=[article.get('title', 'Unknown')])
+                author_info[author]['articles'] += 1
+                if risk_type:
+                    author_info[author]['risk_types'].add(risk_type)
+                if not np.isnan(year):
+                    author_info[author]['years'].append(int(year))
+                
+                author_articles[author].append(title)
+            
+            collaborations.append(clean_authors)
+            collaboration_titles.append(title)
+        
+        # Add collaboration edges from one sparse co-authorship product
+        incidence, authors = self._incidence_matrix(collaborations)
+        G.add_edges_from(
+            (author1, author2, {'weight': weight, 'collaborations': titles})
+            for author1, author2, weight, titles in self._cooccurrence_edges(incidence, authors, collaboration_titles)
+        )
         
         # Add node attributes
         for author, info in author_info.items():
@@ -83,67 +237,58 @@ class CitationGraphGenerator:
             'author_articles': dict(author_articles)
         }
     
-    def create_keyword_network(self, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def create_keyword_network(self, articles: Union[List[Dict[str, Any]], ArticleColumns]) -> Dict[str, Any]:
         """
         Create a network graph of keyword co-occurrences
         
         Args:
-            articles: List of article dictionaries
+            articles: List of article dictionaries, or their ArticleColumns
             
         Returns:
             Dictionary containing network data and statistics
         """
+        columns = articles if isinstance(articles, ArticleColumns) else self._to_columns(articles)
         G = nx.Graph()
         
         # Extract keywords from various fields
-        all_keywords = []
         keyword_articles = defaultdict(list)
+        article_keyword_sets = []
         
-        for article in articles:
-            article_keywords = set()
-            
-            # Extract from various text fields
-            text_fields = ['title', 'abstract', 'objective', 'key_variables', 'main_findings']
-            combined_text = ' '.join([str(article.get(field, '')) for field in text_fields])
-            
+        for i, text in enumerate(columns.text):
             # Extract meaningful keywords (simple approach)
-            keywords = self._extract_keywords(combined_text)
+            keywords = self._extract_keywords(text)
             
             # Add risk type as keyword
-            if article.get('risk_type'):
-                keywords.add(article['risk_type'].lower())
+            if columns.risk_type[i]:
+                keywords.add(columns.risk_type[i].lower())
             
             # Add level of analysis as keyword
-            if article.get('level_of_analysis'):
-                keywords.add(article['level_of_analysis'].lower().replace('-', ' '))
-            
-            all_keywords.extend(keywords)
+            if columns.level_of_analysis[i]:
+                keywords.add(columns.level_of_analysis[i].lower().replace('-', ' '))
             
             # Track which articles contain each keyword
             for keyword in keywords:
-                keyword_articles[keyword].append(article.get('title', 'Unknown'))
-                article_keywords.add(keyword)
+                keyword_articles[keyword].append(columns.titles[i])
             
-            # Add co-occurrence edges
-            keywords_list = list(article_keywords)
-            for i, kw1 in enumerate(keywords_list):
-                for kw2 in keywords_list[i+1:]:
-                    if G.has_edge(kw1, kw2):
-                        G[kw1][kw2]['weight'] += 1
-                        G[kw1][kw2]['articles'].append(article.get('title', 'Unknown'))
-                    else:
-                        G.add_edge(kw1, kw2, weight=1, 
-                                 articles=[article.get('title', 'Unknown')])
-        
-        # Add node attributes (keyword frequency)
-        keyword_counts = Counter(all_keywords)
-        for keyword, count in keyword_counts.items():
+            article_keyword_sets.append(keywords)
+        
+        # Keyword frequencies are the column sums of the article x keyword incidence matrix
+        incidence, vocabulary = self._incidence_matrix(article_keyword_sets)
+        frequencies = np.asarray(incidence.sum(axis=0)).ravel()
+        keyword_counts = Counter(dict(zip(vocabulary, frequencies.tolist())))
+        
+        # Keep only keywords that appear in multiple articles
+        frequent = np.flatnonzero(frequencies >= 2)
+        incidence = incidence[:, frequent]
+        vocabulary = [vocabulary[index] for index in frequent.tolist()]
+        for keyword, count in zip(vocabulary, frequencies[frequent].tolist()):
             G.add_node(keyword, frequency=count, articles=keyword_articles[keyword])
         
-        # Filter to keep only keywords that appear in multiple articles
-        nodes_to_remove = [node for node, data in G.nodes(data=True) 
-                          if data.get('frequency', 0) < 2]
-        G.remove_nodes_from(nodes_to_remove)
+        # Add co-occurrence edges from one sparse keyword x keyword product
+        G.add_edges_from(
+            (kw1, kw2, {'weight': weight, 'articles': titles})
+            for kw1, kw2, weight, titles in self._cooccurrence_edges(incidence, vocabulary, columns.titles)
+        )
         
         stats = self._calculate_network_stats(G)
         
@@ -154,18 +299,19 @@ class CitationGraphGenerator:
             'keyword_articles': dict(keyword_articles)
         }
     
-    def create_article_similarity_network(self, articles: List[Dict[str, Any]], 
+    def create_article_similarity_network(self, articles: Union[List[Dict[str, Any]], ArticleColumns], 
                                         similarity_threshold: float = 0.7) -> Dict[str, Any]:
         """
         Create a network based on article similarity using semantic embeddings
         
         Args:
-            articles: List of article dictionaries
+            articles: List of article dictionaries, or their ArticleColumns
             similarity_threshold: Minimum similarity to create an edge
             
         Returns:
             Dictionary containing network data and statistics
         """
+        columns = articles if isinstance(articles, ArticleColumns) else self._to_columns(articles)
         G = nx.Graph()
         
         # Create simplified network based on shared attributes for now
@@ -173,7 +319,7 @@ class CitationGraphGenerator:
         
         article_data = {}
         
-        for i, article in enumerate(articles):
+        for i, article in enumerate(columns.records):
             article_id = f"article_{i}"
             title = article.get('title', f'Article {i}')
             
@@ -187,18 +333,14 @@ class CitationGraphGenerator:
             
             article_data[article_id] = article
         
-        # Create edges based on shared attributes
+        # Create edges based on shared attributes, scoring every pair at once
         nodes = list(G.nodes())
-        for i, node1 in enumerate(nodes):
-            for node2 in nodes[i+1:]:
-                similarity_score = self._calculate_article_similarity(
-                    article_data[node1], article_data[node2]
-                )
-                
-                if similarity_score >= similarity_threshold:
-                    G.add_edge(node1, node2, 
-                             weight=similarity_score,
-                             similarity=similarity_score)
+        similarity = self._similarity_matrix(columns)
+        rows, cols = np.nonzero(np.triu(similarity >= similarity_threshold, 1))
+        G.add_edges_from(
+            (nodes[i], nodes[j], {'weight': score, 'similarity': score})
+            for i, j, score in zip(rows.tolist(), cols.tolist(), similarity[rows, cols].tolist())
+        )
         
         stats = self._calculate_network_stats(G)
         
@@ -211,7 +353,7 @@ class CitationGraphGenerator:
     def generate_html_visualization(self, network_data: Dict[str, Any], 
                                   network_type: str = "author") -> str:
         """
-        Generate HTML visualization using PyVis
+        Generate HTML visualization by filling the static vis-network template
         
         Args:
             network_data: Network data from create_*_network methods
@@ -222,25 +364,13 @@ class CitationGraphGenerator:
         """
         G = network_data['network']
         
-        # Create PyVis network
-        net = Network(height="600px", width="100%", bgcolor="#ffffff", font_color="black")
-        
-        # Configure physics
-        net.set_options("""
-        var options = {
-          "physics": {
-            "enabled": true,
-            "stabilization": {"iterations": 100}
-          }
-        }
-        """)
-        
-        # Add nodes with styling based on network type
+        # Build node payloads with styling based on network type
+        nodes = []
         for node, data in G.nodes(data=True):
             if network_type == "author":
                 size = min(50, 10 + data.get('articles', 1) * 5)
                 title = f"Author: {node}<br>Articles: {data.get('articles', 0)}<br>Risk Types: {', '.join(data.get('risk_types', []))}"
-                color = self._get_color_by_risk_type(data.get('risk_types', ['Unknown'])[0] if data.get('risk_types') else 'Unknown')
+                color = _color_by_risk_type(data.get('risk_types', ['Unknown'])[0] if data.get('risk_types') else 'Unknown')
             
             elif network_type == "keyword":
                 size = min(50, 10 + data.get('frequency', 1) * 3)
@@ -250,12 +380,13 @@ class CitationGraphGenerator:
             elif network_type == "article":
                 size = 20
                 title = f"Title: {data.get('title', node)}<br>Year: {data.get('year', 'Unknown')}<br>Risk Type: {data.get('risk_type', 'Unknown')}"
-                color = self._get_color_by_risk_type(data.get('risk_type', 'Unknown'))
+                color = _color_by_risk_type(data.get('risk_type', 'Unknown'))
             
-            net.add_node(node, label=self._truncate_label(str(node)), 
-                        size=size, title=title, color=color)
+            nodes.append({'id': node, 'label': _truncate_label(str(node)),
+                          'size': size, 'title': title, 'color': color})
         
-        # Add edges
+        # Build edge payloads
+        edges = []
         for edge in G.edges(data=True):
             weight = edge[2].get('weight', 1)
             width = min(10, weight * 2)
@@ -267,90 +398,132 @@ class CitationGraphGenerator:
             elif network_type == "article":
                 title = f"Similarity: {edge[2].get('similarity', 0):.2f}"
             
-            net.add_edge(edge[0], edge[1], width=width, title=title)
-        
-        # Generate HTML
-        html_string = net.generate_html()
+            edges.append({'from': edge[0], 'to': edge[1], 'width': width, 'title': title})
         
-        return html_string
+        return _NETWORK_TEMPLATE % {
+            'nodes': _script_json(nodes),
+            'edges': _script_json(edges),
+            'options': _script_json(NETWORK_OPTIONS)
+        }
     
     def _clean_author_name(self, author_name: str) -> str:
         """Clean and normalize author names"""
         if not author_name or not isinstance(author_name, str):
             return ""
         
-        # Remove extra whitespace and common prefixes/suffixes
-        name = re.sub(r'\s+', ' ', author_name.strip())
-        name = re.sub(r'^(Dr\.?|Prof\.?|Mr\.?|Ms\.?|Mrs\.?)\s+', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'\s+(Jr\.?|Sr\.?|PhD\.?|MD\.?)$', '', name, flags=re.IGNORECASE)
-        
-        return name.title()
+        return _clean_author_name(author_name)
     
-    def _extract_keywords(self, text: str, min_length: int = 3) -> set:
+    def _extract_keywords(self, text: str, min_length: int = DEFAULT_MIN_KEYWORD_LENGTH) -> set:
         """Extract meaningful keywords from text"""
         if not text:
             return set()
         
-        # Convert to lowercase and remove special characters
-        text = re.sub(r'[^\w\s]', ' ', text.lower())
-        words = text.split()
-        
-        # Filter out common stop words and short words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
-            'by', 'this', 'that', 'these', 'those', 'is', 'are', 'was', 'were', 'be', 'been',
-            'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should',
-            'may', 'might', 'must', 'can', 'cannot', 'from', 'into', 'through', 'during',
-            'before', 'after', 'above', 'below', 'up', 'down', 'out', 'off', 'over', 'under',
-            'again', 'further', 'then', 'once', 'here', 'there', 'when', 'where', 'why', 'how',
-            'all', 'any', 'both', 'each', 'few', 'more', 'most', 'other', 'some', 'such',
-            'no', 'nor', 'not', 'only', 'own', 'same', 'so', 'than', 'too', 'very'
-        }
+        # Callers extend the result, so hand out a copy of the cached set
+        return set(_keywords_from_text(text, min_length))
+    
+    def _similarity_matrix(self, columns: ArticleColumns) -> np.ndarray:
+        """
+        Score all article pairs at once on shared attributes
         
-        keywords = set()
-        for word in words:
-            if (len(word) >= min_length and 
-                word not in stop_words and 
-                not word.isdigit() and
-                word.isalpha()):
-                keywords.add(word)
+        Weights are risk type 0.3, level of analysis 0.2, year proximity 0.1 and
+        author overlap 0.4, normalized by the weights of attributes both articles have.
+        
+        Args:
+            columns: Columnar article data from _to_columns
+            
+        Returns:
+            Symmetric N x N matrix of similarity scores
+        """
+        n = len(columns.records)
+        similarity = np.zeros((n, n))
+        total_weight = np.zeros_like(similarity)
+        
+        # Risk type and level of analysis: equal category codes, counted only when both are set
+        for values, weight in ((columns.risk_type, 0.3), (columns.level_of_analysis, 0.2)):
+            codes = self._factorize(values)
+            present = codes >= 0
+            both = present[:, None] & present[None, :]
+            similarity += weight * (both & (codes[:, None] == codes[None, :]))
+            total_weight += weight * both
+        
+        # Year similarity (linear decay to zero at 3 years apart)
+        years = columns.year
+        present = ~np.isnan(years)
+        both = present[:, None] & present[None, :]
+        year_diff = np.abs(years[:, None] - years[None, :])
+        similarity += np.where(both, 0.1 * np.clip(1 - year_diff / 3, 0, 1), 0)
+        total_weight += 0.1 * both
+        
+        # Author overlap relative to the larger author list, via a sparse article x author product
+        incidence, _ = self._incidence_matrix(columns.authors)
+        overlap = (incidence @ incidence.T).toarray()
+        counts = np.asarray(incidence.sum(axis=1)).ravel()
+        both = (counts[:, None] > 0) & (counts[None, :] > 0)
+        largest = np.maximum(counts[:, None], counts[None, :])
+        similarity += 0.4 * np.divide(overlap, largest, out=np.zeros_like(similarity), where=both)
+        total_weight += 0.4 * both
+        
+        return np.divide(similarity, total_weight, out=np.zeros_like(similarity), where=total_weight > 0)
+    
+    def _factorize(self, values: Iterable[Any]) -> np.ndarray:
+        """Map values to integer category codes, with -1 for missing values"""
+        categories = {}
+        return np.array([categories.setdefault(value, len(categories)) if value else -1 for value in values],
+                        dtype=np.int64)
+    
+    def _incidence_matrix(self, rows: Iterable[Iterable[str]]) -> Tuple[sparse.csr_matrix, List[str]]:
+        """
+        Build a binary sparse row x label matrix (e.g. article x author)
         
-        return keywords
+        Args:
+            rows: Labels attached to each row; duplicates within a row are ignored
+            
+        Returns:
+            Tuple of the CSR matrix and the label for each column
+        """
+        labels = {}
+        row_indices = []
+        col_indices = []
+        n_rows = 0
+        for row, row_labels in enumerate(rows):
+            n_rows += 1
+            if isinstance(row_labels, str):
+                row_labels = [row_labels]
+            for label in dict.fromkeys(row_labels):
+                row_indices.append(row)
+                col_indices.append(labels.setdefault(label, len(labels)))
+        
+        matrix = sparse.csr_matrix(
+            (np.ones(len(row_indices), dtype=np.int64), (row_indices, col_indices)),
+            shape=(n_rows, len(labels))
+        )
+        return matrix, list(labels)
     
-    def _calculate_article_similarity(self, article1: Dict, article2: Dict) -> float:
-        """Calculate similarity between two articles based on attributes"""
-        similarity = 0.0
-        total_weight = 0.0
-        
-        # Risk type similarity
-        if article1.get('risk_type') and article2.get('risk_type'):
-            if article1['risk_type'] == article2['risk_type']:
-                similarity += 0.3
-            total_weight += 0.3
-        
-        # Level of analysis similarity
-        if article1.get('level_of_analysis') and article2.get('level_of_analysis'):
-            if article1['level_of_analysis'] == article2['level_of_analysis']:
-                similarity += 0.2
-            total_weight += 0.2
-        
-        # Year similarity (within 3 years)
-        if article1.get('year') and article2.get('year'):
-            year_diff = abs(article1['year'] - article2['year'])
-            if year_diff <= 3:
-                similarity += 0.1 * (1 - year_diff / 3)
-            total_weight += 0.1
-        
-        # Author overlap
-        authors1 = set(article1.get('authors', []))
-        authors2 = set(article2.get('authors', []))
-        if authors1 and authors2:
-            overlap = len(authors1.intersection(authors2))
-            if overlap > 0:
-                similarity += 0.4 * (overlap / max(len(authors1), len(authors2)))
-            total_weight += 0.4
-        
-        return similarity / total_weight if total_weight > 0 else 0.0
+    def _cooccurrence_edges(self, incidence: sparse.csr_matrix, labels: List[str],
+                            titles: List[str]) -> List[Tuple[str, str, int, List[str]]]:
+        """
+        List label pairs that share rows, from one sparse label x label product
+        
+        Args:
+            incidence: Binary row x label matrix from _incidence_matrix
+            labels: Label for each column
+            titles: Title for each row
+            
+        Returns:
+            (label1, label2, shared row count, shared row titles) for every co-occurring pair
+        """
+        cooccurrence = sparse.triu(incidence.T @ incidence, k=1).tocoo()
+        by_label = incidence.tocsc()
+        
+        edges = []
+        for i, j, weight in zip(cooccurrence.row.tolist(), cooccurrence.col.tolist(), cooccurrence.data.tolist()):
+            shared = np.intersect1d(
+                by_label.indices[by_label.indptr[i]:by_label.indptr[i + 1]],
+                by_label.indices[by_label.indptr[j]:by_label.indptr[j + 1]],
+                assume_unique=True
+            )
+            edges.append((labels[i], labels[j], weight, [titles[row] for row in shared.tolist()]))
+        return edges
     
     def _calculate_network_stats(self, G: nx.Graph) -> Dict[str, Any]:
         """Calculate network statistics"""
@@ -374,18 +547,6 @@ class CitationGraphGenerator:
         
         return stats
     
-    def _get_color_by_risk_type(self, risk_type: str) -> str:
-        """Get color based on risk type"""
-        color_map = {
-            'Financial': '#ff6b6b',
-            'Operational': '#4ecdc4', 
-            'Strategic': '#45b7d1',
-            'Credit': '#f9ca24',
-            'Market': '#6c5ce7',
-            'Unknown': '#95a5a6'
-        }
-        return color_map.get(risk_type, '#95a5a6')
-    
     def _get_color_by_frequency(self, frequency: int) -> str:
         """Get color based on frequency"""
         if frequency >= 10:
@@ -394,9 +555,3 @@ class CitationGraphGenerator:
             return '#f39c12'  # Orange for medium frequency
         else:
             return '#3498db'  # Blue for low frequency
-    
-    def _truncate_label(self, label: str, max_length: int = 20) -> str:
-        """Truncate labels for better visualization"""
-        if len(label) <= max_length:
-            return label
-        return label[:max_length-3] + "..."
\ No newline at end of file
@@ -1,37 +1,102 @@
 from langchain.tools import BaseTool
-import requests
+import asyncio
+import httpx
+from datetime import date
 from typing import List, Dict, Any, Optional
 from pydantic import Field
 
+from ..config import get_settings
+from .http_client import HTTP_TIMEOUT_SECONDS, get_http_client
+from .rate_limiter import TokenBucket, retry_after_seconds
+
+CROSSREF_WORKS_URL = "https://api.crossref.org/works"
+CROSSREF_USER_AGENT = "SmartLit/1.0"
+
 class CrossRefSearchTool(BaseTool):
     name: str = Field(default="crossref_search")
     description: str = Field(default="Search for academic articles using CrossRef API")
 
-    def _run(self, query: str) -> List[Dict[str, Any]]:
-        base_url = "https://api.crossref.org/works"
-        params = {
+    def _build_headers(self) -> Dict[str, str]:
+        # CrossRef asks clients to identify themselves; a mailto gets the polite pool
+        mailto = get_settings().CROSSREF_MAILTO
+        user_agent = f"{CROSSREF_USER_AGENT} (mailto:{mailto})" if mailto else CROSSREF_USER_AGENT
+        return {"User-Agent": user_agent}
+
+    def _build_params(self, query: str) -> Dict[str, Any]:
+        return {
             "query": query,
             "rows": 10,  # Limit results
-            "select": "title,author,published-print,container-title,abstract"
+            "select": "title,author,published-print,published-online,container-title,abstract"
         }
-        
-        response = requests.get(base_url, params=params)
-        results = response.json()["message"]["items"]
-        
+
+    def _parse_pub_date(self, item: Dict[str, Any]) -> Optional[str]:
+        """ISO publication date from print or online date-parts; missing month/day default to 1"""
+        for field in ("published-print", "published-online"):
+            parts = item.get(field, {}).get("date-parts", [[None]])[0]
+            if parts and parts[0]:
+                year, month, day = (list(parts) + [1, 1])[:3]
+                try:
+                    return date(year, month or 1, day or 1).isoformat()
+                except (TypeError, ValueError):
+                    continue
+        return None
+
+    def _parse_items(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         articles = []
         for item in results:
             article = {
                 "title": item.get("title", [None])[0],
-                "authors": [author.get("given", "") + " " + author.get("family", "") 
+                "authors": [author.get("given", "") + " " + author.get("family", "")
                           for author in item.get("author", [])],
                 "year": item.get("published-print", {}).get("date-parts", [[None]])[0][0],
                 "journal": item.get("container-title", [None])[0],
-                "abstract": item.get("abstract", "")
+                "abstract": item.get("abstract", ""),
+                "pub_date": self._parse_pub_date(item)
             }
             articles.append(article)
-            
+
         return articles
 
-    async def _arun(self, query: str) -> List[Dict[str, Any]]:
-        # Implement async version if needed
-        raise NotImplementedError("Async not implemented") 
\ No newline at end of file
+    def _run(self, query: str) -> List[Dict[str, Any]]:
+        """Sync entry point for LangChain callers; async code should await _arun instead"""
+        async def search() -> List[Dict[str, Any]]:
+            # A private client: the shared one is bound to the app's event loop
+            async with httpx.AsyncClient(http2=True, timeout=HTTP_TIMEOUT_SECONDS) as client:
+                return await self._arun(query, client=client)
+
+        return asyncio.run(search())
+
+    async def _arun(
+        self,
+        query: str,
+        rate_limiter: Optional[TokenBucket] = None,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Search CrossRef without blocking the event loop
+
+        Args:
+            query: Search query
+            rate_limiter: Optional limiter to take a token from before the request
+            client: HTTP client to use; defaults to the shared pooled HTTP/2 client
+
+        Returns:
+            Parsed article dictionaries
+        """
+        if rate_limiter is not None:
+            await rate_limiter.acquire()
+        
+        # The shared client reuses connections across searches
+        response = await (client or get_http_client()).get(
+            CROSSREF_WORKS_URL, params=self._build_params(query), headers=self._build_headers()
+        )
+        
+        # Hold further requests on this limiter for as long as CrossRef asks
+        if response.status_code == 429 and rate_limiter is not None:
+            delay = retry_after_seconds(response)
+            if delay:
+                rate_limiter.pause(delay)
+        
+        response.raise_for_status()
+        results = response.json()["message"]["items"]
+        return self._parse_items(results)
@@ -0,0 +1,50 @@
+from typing import Optional
+import httpx
+
+# One pooled HTTP/2 client per process, shared by the CrossRef tool and the
+# Azure OpenAI clients so TCP/TLS connections are reused across requests; a sync
+# twin serves the LangChain calls that run in worker threads
+HTTP_TIMEOUT_SECONDS = 60.0
+HTTP_CONNECT_TIMEOUT_SECONDS = 10.0
+HTTP_MAX_CONNECTIONS = 50
+
+_client: Optional[httpx.AsyncClient] = None
+_sync_client: Optional[httpx.Client] = None
+
+
+def _timeout() -> httpx.Timeout:
+    return httpx.Timeout(HTTP_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS)
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_CONNECTIONS
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared async HTTP client, creating it on first use"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(http2=True, timeout=_timeout(), limits=_limits())
+    return _client
+
+
+def get_sync_http_client() -> httpx.Client:
+    """Return the shared sync HTTP client, creating it on first use"""
+    global _sync_client
+    if _sync_client is None or _sync_client.is_closed:
+        _sync_client = httpx.Client(http2=True, timeout=_timeout(), limits=_limits())
+    return _sync_client
+
+
+async def close_http_client() -> None:
+    """Close the shared clients and their pooled connections"""
+    global _client, _sync_client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+    if _sync_client is not None:
+        _sync_client.close()
+        _sync_client = None
@@ -0,0 +1,78 @@
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import orjson
+
+# Default on-disk location of the background job table
+JOBS_DB_PATH = "jobs.db"
+
+
+class JobStore:
+    def __init__(self, path: str = JOBS_DB_PATH, ttl_seconds: float = 3600):
+        """
+        Status and results of background jobs, shared by all uvicorn workers (WAL mode)
+
+        A job is recorded when it starts and updated once it finishes, so a poll can
+        be answered by any worker, not only the one running the job.
+
+        Args:
+            path: SQLite database file
+            ttl_seconds: Jobs not updated for this long are expired
+        """
+        self.ttl_seconds = ttl_seconds
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "job_id TEXT PRIMARY KEY, "
+            "status TEXT NOT NULL, "
+            "payload BLOB, "
+            "updated REAL NOT NULL)"
+        )
+        self._lock = threading.Lock()
+
+    def start(self, job_id: str) -> None:
+        """Record a job as running, expiring old jobs on the way"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("DELETE FROM jobs WHERE updated < ?", (now - self.ttl_seconds,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jobs (job_id, status, payload, updated) VALUES (?, 'running', NULL, ?)",
+                (job_id, now)
+            )
+
+    def finish(self, job_id: str, status: str, payload: Any) -> None:
+        """Store the outcome of a job: status "done" with its result, or "failed" with an error"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, payload = ?, updated = ? WHERE job_id = ?",
+                (status, orjson.dumps(payload), time.time(), job_id)
+            )
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look a job up
+
+        Returns:
+            {"status": "running"}, {"status": "done", "result": ...} or
+            {"status": "failed", "error": ...}; None for unknown or expired jobs
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, payload FROM jobs WHERE job_id = ? AND updated >= ?",
+                (job_id, time.time() - self.ttl_seconds)
+            ).fetchone()
+        if row is None:
+            return None
+
+        status, payload = row
+        if status == "done":
+            return {"status": status, "result": orjson.loads(payload)}
+        if status == "failed":
+            return {"status": status, "error": orjson.loads(payload)}
+        return {"status": status}
+
+    def close(self) -> None:
+        self._conn.close()
@@ -1,9 +1,154 @@
-from typing import Optional, Dict, Any, Tuple
-from openai import AsyncAzureOpenAI
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import random
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, NamedTuple, Tuple, Union
+import httpx
+import orjson
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    AsyncAzureOpenAI,
+    InternalServerError,
+    RateLimitError,
+)
 from langchain_core.output_parsers import JsonOutputParser
-from langchain_core.prompts import PromptTemplate
 from pydantic import BaseModel
-from ..config import settings
+from ..config import get_settings
+from .http_client import get_http_client
+from .rate_limiter import retry_after_seconds
+
+logger = logging.getLogger(__name__)
+
+# Retries are handled by _call_llm below, so the SDK's own retry loop is disabled
+# rather than multiplying attempts
+OPENAI_MAX_RETRIES = 0
+
+# Transient failures worth retrying, with exponential backoff and full jitter
+LLM_RETRY_EXCEPTIONS = (RateLimitError, APIConnectionError, APITimeoutError, InternalServerError)
+LLM_MAX_ATTEMPTS = 6
+LLM_BACKOFF_MIN_SECONDS = 1.0
+LLM_BACKOFF_MAX_SECONDS = 30.0
+
+# Batch API jobs are polled from every 10s up to every 5 minutes until they end
+BATCH_POLL_MIN_SECONDS = 10.0
+BATCH_POLL_MAX_SECONDS = 300.0
+BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+_openai_client: Optional[AsyncAzureOpenAI] = None
+_openai_http_client: Optional[httpx.AsyncClient] = None
+
+def get_openai_client() -> AsyncAzureOpenAI:
+    """
+    Return the process-wide Azure OpenAI client, creating it on first use
+
+    It sits on the shared bounded HTTP pool; if that pool has been closed and
+    replaced, a new client is built over the new one.
+    """
+    global _openai_client, _openai_http_client
+    http_client = get_http_client()
+    if _openai_client is None or _openai_http_client is not http_client:
+        settings = get_settings()
+        _openai_client = AsyncAzureOpenAI(
+            api_version=settings.AZURE_OPENAI_API_VERSION,
+            azure_endpoint=settings.AZURE_OPENAI_API_ENDPOINT,
+            api_key=settings.AZURE_OPENAI_API_KEY,
+            http_client=http_client,
+            max_retries=OPENAI_MAX_RETRIES,
+        )
+        _openai_http_client = http_client
+    return _openai_client
+
+
+@lru_cache(maxsize=1)
+def _inflight_semaphore() -> asyncio.Semaphore:
+    """Process-wide cap on in-flight chat completions, sized to the Azure tier"""
+    return asyncio.Semaphore(get_settings().AZURE_OPENAI_MAX_INFLIGHT)
+
+
+def _backoff_seconds(attempt: int, error: Exception) -> float:
+    """Delay before the next attempt: Retry-After when the service sent one, else jittered exponential"""
+    delay = retry_after_seconds(error)
+    if delay is not None:
+        return delay
+    return random.uniform(
+        LLM_BACKOFF_MIN_SECONDS,
+        min(LLM_BACKOFF_MAX_SECONDS, LLM_BACKOFF_MIN_SECONDS * 2 ** attempt)
+    )
+
+
+@lru_cache(maxsize=1)
+def get_semantic_cache():
+    """Semantic response cache, created on first use (it opens a Chroma collection)"""
+    from .semantic_cache import SemanticCache
+    settings = get_settings()
+    return SemanticCache(
+        ttl_seconds=settings.LLM_SEMANTIC_CACHE_TTL_SECONDS,
+        max_entries=settings.LLM_SEMANTIC_CACHE_MAX_ENTRIES,
+    )
+
+
+def _prompt_key(*parts: str) -> str:
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+@lru_cache(maxsize=32)
+def _parser_for(schema: Optional[type]) -> Tuple[JsonOutputParser, str]:
+    """JSON parser and its format instructions, built once per schema class"""
+    parser = JsonOutputParser(pydantic_object=schema)
+    return parser, parser.get_format_instructions()
+
+
+class CompiledPrompt(NamedTuple):
+    """Everything generate() derives from (model, prompt, schema) alone"""
+    parser: JsonOutputParser
+    system_message: Dict[str, str]
+    prompt_key: str
+
+    def messages(self, input: str) -> List[Dict[str, str]]:
+        # Constant instructions first and the variable input last, so every call
+        # shares a byte-identical prefix that Azure OpenAI can serve from its prompt cache
+        return [self.system_message, {"role": "user", "content": input}]
+
+
+@lru_cache(maxsize=32)
+def _compile_prompt(model: str, prompt: str, schema: Optional[type]) -> CompiledPrompt:
+    """
+    Specialize generate() for one (model, prompt, schema) combination
+
+    The analysis prompt and schema are fixed, so the parser, system message and
+    prompt key are built on the first call and reused after that.
+    """
+    schema_name = schema.__name__ if schema is not None else ""
+    parser, format_instructions = _parser_for(schema)
+    return CompiledPrompt(
+        parser=parser,
+        system_message={"role": "system", "content": f"{format_instructions}\n{prompt}"},
+        prompt_key=_prompt_key(model, schema_name, prompt),
+    )
+
+
+def _cached_token_usage() -> Dict[str, int]:
+    return {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0, "cached": True}
+
+# Fixed instructions for analyze_article; kept short because they are billed on
+# every call, and the field list itself comes from the schema's format instructions
+ARTICLE_ANALYSIS_PROMPT = (
+    "If the abstract is not in English, translate it first; write the whole analysis in English.\n"
+    "Analyze the research abstract rigorously and extract:\n"
+    "- objective: aim, research questions/hypotheses\n"
+    "- methodology: design, data collection, analytical techniques\n"
+    "- key_variables: dependent, independent, controls\n"
+    "- risk_type: standard risk classification\n"
+    "- level_of_analysis: e.g. firm, industry, country, multi-level\n"
+    "- main_findings: incl. significance/effect sizes if stated\n"
+    "- implications: theoretical and practical\n"
+    "- limitations: methodological constraints, generalizability, biases\n"
+    "Answer with JSON only, a detailed explanation per field."
+)
 
 class ArticleAnalysisSchema(BaseModel):
     objective: str
@@ -17,30 +162,36 @@ class ArticleAnalysisSchema(BaseModel):
 
 class LangChainModel:
     def __init__(self):
-        self.client = AsyncAzureOpenAI(
-            api_version=settings.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=settings.AZURE_OPENAI_API_ENDPOINT,
-            api_key=settings.AZURE_OPENAI_API_KEY,
-        )
+        self.client = get_openai_client()
 
     async def generate(self, input: str, prompt: str, schema: Optional[BaseModel] = None) -> Tuple[Dict[str, Any], Dict[str, int]]:
         """
         Generate a response with optional schema validation using JsonOutputParser
         Returns tuple of (response, token_usage)
+
+        Exact repeats are cached by the caller (ArticleAnalyzer); when the semantic
+        cache is enabled, near-identical inputs (same prompt and schema) are served
+        from it with zero token usage and "cached": True.
         """
-        parser = JsonOutputParser(pydantic_object=schema)
-        format_instructions = parser.get_format_instructions()
-        
-        messages = [
-            {"role": "system", "content": format_instructions},
-            {"role": "user", "content": f"{input}\n{prompt}"}
-        ]
-
-        response = await self.client.chat.completions.create(
-            messages=messages,
-            model=settings.AZURE_OPENAI_DEPLOYMENT_NAME,
-            temperature=0,  # Lower temperature for more consistent structured output
-        )
+        settings = get_settings()
+        compiled = _compile_prompt(settings.AZURE_OPENAI_DEPLOYMENT_NAME, prompt, schema)
+        prompt_key = compiled.prompt_key
+
+        semantic_cache = None
+        embedding = None
+        if settings.LLM_SEMANTIC_CACHE_ENABLED:
+            try:
+                semantic_cache = get_semantic_cache()
+                embedding = await semantic_cache.embed(input)
+                hit = await semantic_cache.lookup(prompt_key, embedding)
+            except Exception as e:
+                logger.warning("Semantic cache lookup failed: %s", e)
+                hit = None
+            if hit is not None:
+                response, _ = hit
+                return response, _cached_token_usage()
+
+        response = await self._call_llm(compiled.messages(input), settings.AZURE_OPENAI_DEPLOYMENT_NAME)
 
         # Extract token usage
         token_usage = {
@@ -51,37 +202,162 @@ class LangChainModel:
 
         # Parse the response content
         content = response.choices[0].message.content
-        parsed_response = parser.parse(content)
+        parsed_response = compiled.parser.parse(content)
+        
+        if semantic_cache is not None and embedding is not None:
+            try:
+                await semantic_cache.insert(prompt_key, input, embedding, parsed_response, token_usage)
+            except Exception as e:
+                logger.warning("Semantic cache insert failed: %s", e)
         
         return parsed_response, token_usage
 
+    async def _call_llm(self, messages: list, model: str) -> Any:
+        """
+        Send a chat completion, retrying transient failures
+        
+        Rate limits, timeouts, connection errors and 5xx responses are retried up to
+        LLM_MAX_ATTEMPTS times, waiting Retry-After when given and a jittered
+        exponential backoff otherwise. The wait happens outside the in-flight
+        semaphore so other calls can use the slot.
+        """
+        for attempt in range(LLM_MAX_ATTEMPTS):
+            try:
+                async with _inflight_semaphore():
+                    return await self.client.chat.completions.create(
+                        messages=messages,
+                        model=model,
+                        temperature=0,  # Lower temperature for more consistent structured output
+                    )
+            except LLM_RETRY_EXCEPTIONS as e:
+                if attempt == LLM_MAX_ATTEMPTS - 1:
+                    raise
+                delay = _backoff_seconds(attempt, e)
+                logger.warning("LLM call failed (%s), retrying in %.1fs", type(e).__name__, delay)
+                await asyncio.sleep(delay)
+
+    async def batch_generate(
+        self,
+        inputs: List[str],
+        prompt: str,
+        schema: Optional[BaseModel] = None
+    ) -> List[Union[Tuple[Dict[str, Any], Dict[str, int]], Exception]]:
+        """
+        Generate responses for many inputs through the Azure OpenAI Batch API
+
+        Batch jobs are billed at half the price of synchronous calls but complete
+        asynchronously within 24 hours, so this suits bulk ingestion rather than
+        interactive requests. All inputs go into one JSONL job that is polled until it
+        finishes; callers submit only their cache misses.
+
+        Returns:
+            One entry per input, in order: a (response, token_usage) tuple, or the
+            exception for that input so one failure doesn't abort the rest
+        """
+        settings = get_settings()
+        model = settings.AZURE_OPENAI_DEPLOYMENT_NAME
+        compiled = _compile_prompt(model, prompt, schema)
+
+        results: List[Any] = [None] * len(inputs)
+        if not inputs:
+            return results
+
+        lines = []
+        for i, input in enumerate(inputs):
+            lines.append(orjson.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/chat/completions",
+                "body": {
+                    "model": model,
+                    "messages": compiled.messages(input),
+                    "temperature": 0,
+                },
+            }))
+
+        outputs = await self._run_batch(b"\n".join(lines))
+
+        for i in range(len(inputs)):
+            output = outputs.get(str(i))
+            try:
+                if output is None:
+                    raise RuntimeError("No output returned for this input by the batch job")
+                response = output.get("response") or {}
+                if response.get("status_code") != 200:
+                    raise RuntimeError(f"Batch request failed: {output.get('error') or response.get('body')}")
+
+                body = response["body"]
+                usage = body["usage"]
+                token_usage = {
+                    "prompt_tokens": usage["prompt_tokens"],
+                    "completion_tokens": usage["completion_tokens"],
+                    "total_tokens": usage["total_tokens"]
+                }
+                parsed_response = compiled.parser.parse(body["choices"][0]["message"]["content"])
+            except Exception as e:
+                results[i] = e
+                continue
+
+            results[i] = (parsed_response, token_usage)
+
+        return results
+
+    async def _run_batch(self, jsonl: bytes) -> Dict[str, Dict[str, Any]]:
+        """
+        Upload a JSONL request file, run it as a batch job and collect its output lines
+
+        Returns:
+            Output and error lines keyed by custom_id
+        """
+        batch_file = await self.client.files.create(file=("batch.jsonl", jsonl), purpose="batch")
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/chat/completions",
+            completion_window="24h",
+        )
+
+        # Jobs take minutes to hours, so polling backs off exponentially
+        delay = BATCH_POLL_MIN_SECONDS
+        while batch.status not in BATCH_TERMINAL_STATUSES:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, BATCH_POLL_MAX_SECONDS)
+            batch = await self.client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch job {batch.id} ended with status {batch.status}")
+
+        outputs: Dict[str, Dict[str, Any]] = {}
+        for file_id in (batch.error_file_id, batch.output_file_id):
+            if not file_id:
+                continue
+            content = await self.client.files.content(file_id)
+            for line in content.content.splitlines():
+                if line.strip():
+                    record = orjson.loads(line)
+                    outputs[record["custom_id"]] = record
+        return outputs
+
     async def analyze_article(self, abstract: str) -> Tuple[Dict[str, Any], Dict[str, int]]:
         """
         Analyze an article abstract and extract structured information
         Returns tuple of (analysis_result, token_usage)
         """
-        prompt = """
-        First, if the abstract is not in English, translate it to English.
-        Then, conduct a comprehensive academic analysis of the research article abstract. Extract and synthesize key information using established research analysis frameworks.
-
-        Systematically identify and elaborate on:
-        - The main objective of the research (including research questions or hypotheses if present)
-        - The methodological approach (including research design, data collection methods, analytical techniques)
-        - Key variables studied (both dependent and independent variables, control variables if mentioned)
-        - Type of risk discussed (categorize according to standard risk classification frameworks)
-        - Level of analysis (e.g., firm-level, industry-level, country-level, multi-level analysis)
-        - Main findings (including statistical significance and effect sizes if mentioned)
-        - Theoretical and practical implications (contributions to literature and recommendations for practitioners)
-        - Limitations of the study (methodological constraints, generalizability issues, potential biases)
-
-        Important: If the original abstract was not in English, ensure all analysis is done on the English translation.
-
-        Ensure your analysis maintains academic rigor and follows systematic review principles.
-        Structure your response in a clear JSON format, with detailed explanations for each component in English.
-        """
-        
         return await self.generate(
             input=abstract,
-            prompt=prompt,
+            prompt=ARTICLE_ANALYSIS_PROMPT,
+            schema=ArticleAnalysisSchema
+        )
+
+    async def batch_analyze(
+        self,
+        abstracts: List[str]
+    ) -> List[Union[Tuple[Dict[str, Any], Dict[str, int]], Exception]]:
+        """
+        Analyze many abstracts as one Batch API job (see batch_generate)
+        Returns one (analysis_result, token_usage) tuple or exception per abstract
+        """
+        return await self.batch_generate(
+            inputs=abstracts,
+            prompt=ARTICLE_ANALYSIS_PROMPT,
             schema=ArticleAnalysisSchema
         )
\ No newline at end of file
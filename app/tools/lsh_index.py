@@ -0,0 +1,127 @@
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+# Random-projection LSH: each table hashes a vector to DEFAULT_NUM_BITS hyperplane
+# signs; several independent tables recover neighbours a single table would miss
+DEFAULT_NUM_BITS = 16
+DEFAULT_NUM_TABLES = 8
+
+# Rows preallocated for stored vectors; the matrix doubles whenever it fills up
+INITIAL_CAPACITY = 1024
+
+
+class LSHIndex:
+    def __init__(
+        self,
+        dim: int,
+        num_bits: int = DEFAULT_NUM_BITS,
+        num_tables: int = DEFAULT_NUM_TABLES,
+        seed: int = 0
+    ):
+        """
+        In-memory cosine-similarity index with random-projection LSH buckets
+
+        A query probes one bucket per table and scores only the vectors found
+        there, with a single matrix-vector product, instead of scanning every
+        stored vector.
+
+        Args:
+            dim: Vector dimension
+            num_bits: Hyperplanes per table (bucket key length)
+            num_tables: Independent hash tables, trading memory for recall
+            seed: Seed of the random hyperplanes
+        """
+        rng = np.random.default_rng(seed)
+        self._planes = rng.standard_normal((num_tables * num_bits, dim)).astype(np.float32)
+        self._num_tables = num_tables
+        self._num_bits = num_bits
+        self._tables: List[Dict[bytes, List[int]]] = [{} for _ in range(num_tables)]
+
+        # Row-aligned storage, vectors in one contiguous float32 matrix so candidates
+        # are gathered and scored without Python-level copies; removed rows are
+        # tombstoned until the next rebuild
+        self._keys: List[Hashable] = []
+        self._groups: List[Hashable] = []
+        self._matrix = np.empty((INITIAL_CAPACITY, dim), dtype=np.float32)
+        self._rows: Dict[Hashable, int] = {}
+        self._removed: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _normalize(self, vector) -> np.ndarray:
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _bucket_keys(self, vector: np.ndarray) -> List[bytes]:
+        bits = (self._planes @ vector > 0).reshape(self._num_tables, self._num_bits)
+        return [row.tobytes() for row in np.packbits(bits, axis=1)]
+
+    def add(self, key: Hashable, vector, group: Hashable = None) -> None:
+        """
+        Index a vector under a key
+
+        Args:
+            key: Identifier returned by query()
+            vector: Embedding
+            group: Partition; query() only matches vectors of the same group
+        """
+        if key in self._rows:
+            self.remove([key])
+
+        vector = self._normalize(vector)
+        row = len(self._keys)
+        if row == len(self._matrix):
+            self._matrix = np.concatenate([self._matrix, np.empty_like(self._matrix)])
+        self._matrix[row] = vector
+        self._keys.append(key)
+        self._groups.append(group)
+        self._rows[key] = row
+        for table, bucket in zip(self._tables, self._bucket_keys(vector)):
+            table.setdefault(bucket, []).append(row)
+
+    def remove(self, keys: Iterable[Hashable]) -> None:
+        """Drop keys; storage is compacted once tombstones outnumber live rows"""
+        for key in keys:
+            row = self._rows.pop(key, None)
+            if row is not None:
+                self._removed.add(row)
+        if len(self._removed) > len(self._rows):
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        live = [(self._keys[row], self._matrix[row].copy(), self._groups[row]) for row in self._rows.values()]
+        self._tables = [{} for _ in range(self._num_tables)]
+        self._keys, self._groups = [], []
+        self._matrix = np.empty((max(INITIAL_CAPACITY, len(live)), self._matrix.shape[1]), dtype=np.float32)
+        self._rows, self._removed = {}, set()
+        for key, vector, group in live:
+            self.add(key, vector, group)
+
+    def query(self, vector, group: Hashable = None) -> Optional[Tuple[Hashable, float]]:
+        """
+        Find the most similar indexed vector sharing a bucket with this one
+
+        Returns:
+            (key, cosine similarity) of the best candidate in the group, or None when
+            no candidate collides with the query in any table
+        """
+        vector = self._normalize(vector)
+        candidates = {
+            row
+            for table, bucket in zip(self._tables, self._bucket_keys(vector))
+            for row in table.get(bucket, ())
+        }
+        candidates = np.fromiter(
+            (row for row in candidates if row not in self._removed and self._groups[row] == group),
+            dtype=np.intp
+        )
+        if not len(candidates):
+            return None
+
+        # Gather the candidate rows and score them in one matrix-vector product
+        similarities = self._matrix[candidates] @ vector
+        best = int(np.argmax(similarities))
+        return self._keys[candidates[best]], float(similarities[best])
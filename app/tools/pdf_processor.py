@@ -1,40 +1,322 @@
 import PyPDF2
+import pypdfium2 as pdfium
+import asyncio
+import hashlib
 import io
-from typing import Dict, Any, List, Optional
+import os
+from contextlib import contextmanager
+from itertools import islice
+from typing import Dict, Any, List, Optional, Tuple, Union, Iterator
 import re
 from datetime import datetime
 
-from .article_analyzer import ArticleAnalyzer
+from ..config import get_settings
+from .article_analyzer import ArticleAnalyzer, abstract_hash, get_analysis_store
+from .process_pool import get_process_pool
+from .tokenizer import encoding_for
 from .vector_store import VectorStoreService
 
+# A PDF can be handed over as in-memory bytes or as a path to a file on disk
+PDFSource = Union[bytes, str, os.PathLike]
+
+# Text cleanup and metadata heuristics, compiled once at import
+_RE_WS = re.compile(r'\s+')
+# URLs, DOIs, emails and page number lines, removed in a single scan
+_RE_CLEAN = re.compile(
+    r'(?P<url>https?://\S+)'
+    r'|(?P<doi>doi:\s*[\w./\-]+)'
+    r'|(?P<email>\S+@\S+)'
+    r'|(?P<pagenum>\n\d+\n)'
+    r'|(?P<pageword>\nPage \d+\n)',
+    re.IGNORECASE
+)
+_RE_ABSTRACT = re.compile(
+    r'(?:Abstract|ABSTRACT)\s*[:\-]?\s*(.*?)(?:\n\s*\n|Keywords|KEYWORDS|1\.|Introduction|INTRODUCTION)',
+    re.DOTALL | re.IGNORECASE
+)
+# Abstracts sit near the top; years appear there or in the references at the end
+ABSTRACT_SEARCH_CHARS = 8000
+YEAR_SEARCH_HEAD_CHARS = 5000
+YEAR_SEARCH_TAIL_CHARS = 2000
+
+# Source files are hashed in blocks of this size so large PDFs aren't loaded at once
+HASH_BLOCK_SIZE = 1024 * 1024
+
+# validate_pdf only needs to know that a page has real text, not read all of it
+VALIDATION_SAMPLE_CHARS = 512
+VALIDATION_MIN_TEXT_CHARS = 50
+
+# Soft cap on extracted text: pages stop being read once this many characters are
+# collected, bounding memory on very long documents
+MAX_TEXT_CHARS = 1_500_000
+
+AUTHOR_SEARCH_CHARS = 1000
+
+_RE_YEAR = re.compile(r'(?:19|20)\d{2}')
+# Years and labelled author lists in one scan of the document head; the branches
+# can't overlap (digits vs letters), so each finds exactly what it would alone
+_RE_HEAD_META = re.compile(
+    r'(?P<year>(?:19|20)\d{2})'
+    r'|(?:Author[s]?|By)\s*[:\-]?\s*'
+    r'(?P<authors>[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s*,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)*)',
+    re.IGNORECASE
+)
+# Fallback: a line made only of names
+_RE_AUTHOR_LINE = re.compile(
+    r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s*,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)*)\s*$',
+    re.MULTILINE | re.IGNORECASE
+)
+
+
+# Abstracts sent for analysis are capped in model tokens rather than characters, so
+# PDF artifacts that tokenize poorly can't inflate the prompt
+ABSTRACT_MAX_TOKENS = 600
+# Tokens are rarely longer than this many characters, so slicing first keeps the
+# tokenizer off the rest of a long document
+MAX_CHARS_PER_TOKEN = 8
+
+
+def _truncate_tokens(text: str, max_tokens: int = ABSTRACT_MAX_TOKENS) -> str:
+    """Cut text to at most max_tokens tokens of the configured chat model"""
+    text = text[:max_tokens * MAX_CHARS_PER_TOKEN]
+    encoding = encoding_for(get_settings().AZURE_OPENAI_MODEL_NAME)
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoding.decode(tokens[:max_tokens])
+
+
+def _iter_segments(text: str, separator: str) -> Iterator[str]:
+    """Lazily yield the pieces of text.split(separator), without building the whole list"""
+    start = 0
+    while True:
+        end = text.find(separator, start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + len(separator)
+
+
+def _parse_authors(matches: List[str]) -> List[str]:
+    """Split the first matched author list into names, dropping implausibly long ones"""
+    if not matches:
+        return []
+    authors = [author.strip() for author in matches[0].split(',')]
+    return [author for author in authors if len(author.split()) <= 4]  # Filter out long strings
+
+
+def _bare_processor() -> "PDFProcessor":
+    # The PDF reading methods use no instance state, so skip __init__ and the
+    # analyzer/vector store it would build in every worker
+    return PDFProcessor.__new__(PDFProcessor)
+
+
+def _extract_text_in_worker(pdf_source: PDFSource) -> str:
+    return _bare_processor().extract_text_from_pdf(pdf_source)
+
+
+def _validate_pdf_in_worker(pdf_source: PDFSource, max_size_mb: int) -> Dict[str, Any]:
+    return _bare_processor().validate_pdf(pdf_source, max_size_mb=max_size_mb)
+
+
+def _pdf_info_in_worker(pdf_source: PDFSource) -> Dict[str, Any]:
+    return _bare_processor().get_pdf_info(pdf_source)
+
 
 class PDFProcessor:
     def __init__(self):
         """Initialize the PDF processor with article analyzer and vector store"""
         self.article_analyzer = ArticleAnalyzer()
         self.vector_store = VectorStoreService()
+        
+        # Bounds concurrent PDF analyses in process_pdfs_batch
+        self._semaphore = asyncio.Semaphore(get_settings().LLM_MAX_CONCURRENCY)
     
-    def extract_text_from_pdf(self, pdf_content: bytes) -> str:
+    @contextmanager
+    def _open_pdf(self, pdf_source: PDFSource) -> Iterator[PyPDF2.PdfReader]:
         """
-        Extract text content from PDF bytes
+        Open a PDF reader over bytes or a file path
+        
+        Files on disk are read lazily through an open handle rather than being
+        loaded into memory up front.
         
         Args:
-            pdf_content: PDF file content as bytes
+            pdf_source: PDF file content as bytes, or a path to the PDF file
+            
+        Yields:
+            PdfReader for the document
+        """
+        if isinstance(pdf_source, (bytes, bytearray)):
+            yield PyPDF2.PdfReader(io.BytesIO(pdf_source))
+        else:
+            with open(pdf_source, 'rb') as pdf_file:
+                yield PyPDF2.PdfReader(pdf_file)
+    
+    @contextmanager
+    def _open_pdfium(self, pdf_source: PDFSource) -> Iterator[pdfium.PdfDocument]:
+        """
+        Open a PDFium document over bytes or a file path
+        
+        Args:
+            pdf_source: PDF file content as bytes, or a path to the PDF file
+            
+        Yields:
+            PdfDocument for the document
+            
+        Raises:
+            pdfium.PdfiumError: If PDFium cannot parse the file
+        """
+        pdf = self._load_pdfium(pdf_source)
+        try:
+            yield pdf
+        finally:
+            pdf.close()
+    
+    def _load_pdfium(self, pdf_source: PDFSource) -> pdfium.PdfDocument:
+        if isinstance(pdf_source, (bytes, bytearray)):
+            return pdfium.PdfDocument(bytes(pdf_source))
+        return pdfium.PdfDocument(os.fspath(pdf_source))
+    
+    def _iter_pages_text(self, pdf_source: PDFSource) -> Iterator[str]:
+        """
+        Yield the raw text of each page in order, one page at a time
+        
+        Uses PDFium, falling back to PyPDF2 when PDFium cannot open the file.
+        
+        Args:
+            pdf_source: PDF file content as bytes, or a path to the PDF file
+            
+        Yields:
+            Page text
+        """
+        try:
+            # PDFium's C++ text extraction is much faster than pure-Python PyPDF2
+            pdf = self._load_pdfium(pdf_source)
+        except pdfium.PdfiumError:
+            # PyPDF2 is more lenient with some malformed files
+            with self._open_pdf(pdf_source) as pdf_reader:
+                for page in pdf_reader.pages:
+                    yield page.extract_text() or ""
+            return
+        
+        try:
+            for i in range(len(pdf)):
+                yield self._pdfium_page_text(pdf, i)
+        finally:
+            pdf.close()
+    
+    def _pdfium_page_text(self, pdf: pdfium.PdfDocument, index: int, max_chars: int = -1) -> str:
+        """Extract the text of one page (its first max_chars characters if given), releasing its native handles right away"""
+        page = pdf[index]
+        textpage = page.get_textpage()
+        try:
+            if max_chars < 0:
+                return textpage.get_text_range()
+            return textpage.get_text_range(count=min(max_chars, textpage.count_chars()))
+        finally:
+            textpage.close()
+            page.close()
+    
+    def _content_hash(self, pdf_source: PDFSource) -> str:
+        """Hash of the PDF bytes, identifying re-uploads of the same file"""
+        digest = hashlib.blake2b(digest_size=16)
+        if isinstance(pdf_source, (bytes, bytearray)):
+            digest.update(pdf_source)
+        else:
+            with open(pdf_source, 'rb') as pdf_file:
+                for block in iter(lambda: pdf_file.read(HASH_BLOCK_SIZE), b''):
+                    digest.update(block)
+        return digest.hexdigest()
+    
+    async def _find_duplicate(self, doc_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Build the processing result for a file that is already in the knowledge base
+        
+        The stored chunk metadata gives the article fields, and its abstract hash
+        recovers the analysis from the persistent analysis cache, so nothing is
+        extracted, analyzed or embedded again.
+        
+        Returns:
+            A successful result flagged "duplicate", or None if the file is new
+        """
+        stored = await asyncio.to_thread(self.vector_store.find_by_doc_hash, doc_hash)
+        if stored is None:
+            return None
+        
+        analysis = {}
+        if stored.get("abstract_hash"):
+            analysis = await asyncio.to_thread(get_analysis_store().get, stored["abstract_hash"]) or {}
+        
+        metadata = {
+            "title": stored.get("title", ""),
+            "authors": [author for author in stored.get("authors", "").split(", ") if author],
+            "year": stored.get("year"),
+            "journal": stored.get("journal", ""),
+            "doc_hash": doc_hash
+        }
+        return {
+            "success": True,
+            "duplicate": True,
+            "article": {**metadata, **analysis},
+            "analysis": analysis,
+            "token_usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+            "vector_stats": {"total_articles": 0, "processed_articles": 0, "total_chunks": 0, "duplicate_chunks": 0},
+            "extracted_text_length": 0,
+            "metadata": metadata
+        }
+    
+    def _get_source_size(self, pdf_source: PDFSource) -> int:
+        """Get the size in bytes of a PDF given as bytes or a file path"""
+        if isinstance(pdf_source, (bytes, bytearray)):
+            return len(pdf_source)
+        return os.path.getsize(pdf_source)
+    
+    def extract_text_from_pdf(self, pdf_source: PDFSource) -> str:
+        """
+        Extract text content from a PDF
+        
+        Pages are cleaned as they are read, and reading stops once MAX_TEXT_CHARS
+        characters have been collected.
+        
+        Args:
+            pdf_source: PDF file content as bytes, or a path to the PDF file
             
         Returns:
             Extracted text content
         """
-        try:
-            pdf_file = io.BytesIO(pdf_content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
+        return self._extract_pages_text(pdf_source, max_chars=MAX_TEXT_CHARS)
+    
+    async def extract_text_async(self, pdf_source: PDFSource) -> str:
+        """
+        Extract text content from a PDF in the shared process pool
+        
+        Extraction is CPU-bound, so a worker process runs it outside the GIL; this
+        also keeps PDFium, which is not thread-safe, to one document per process.
+        
+        Args:
+            pdf_source: PDF file content as bytes, or a path to the PDF file
             
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
+        Returns:
+            Extracted text content
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_process_pool(), _extract_text_in_worker, pdf_source)
+    
+    def _extract_pages_text(self, pdf_source: PDFSource, max_chars: Optional[int] = None) -> str:
+        """Clean pages as they are read and join them, stopping once max_chars is reached"""
+        try:
+            parts = []
+            num_chars = 0
+            for page_text in self._iter_pages_text(pdf_source):
+                page_text = self._clean_extracted_text(page_text)
+                if page_text:
+                    parts.append(page_text)
+                    num_chars += len(page_text) + 1
+                if max_chars is not None and num_chars >= max_chars:
+                    break
             
-            # Clean up the text
-            text = self._clean_extracted_text(text)
-            return text
+            return " ".join(parts)
             
         except Exception as e:
             raise Exception(f"Error extracting text from PDF: {str(e)}")
@@ -49,22 +331,11 @@ class PDFProcessor:
         Returns:
             Cleaned text
         """
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove page numbers and headers/footers (basic patterns)
-        text = re.sub(r'\n\d+\n', ' ', text)
-        text = re.sub(r'\nPage \d+\n', ' ', text)
+        # Remove URLs, DOIs, email addresses and page numbers (basic patterns)
+        text = _RE_CLEAN.sub(' ', text)
         
-        # Remove URLs and DOIs (basic patterns)
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
-        text = re.sub(r'doi:\s*[\w\./\-]+', '', text)
-        
-        # Remove email addresses
-        text = re.sub(r'\S+@\S+', '', text)
-        
-        # Clean up extra spaces
-        text = re.sub(r'\s+', ' ', text).strip()
+        # Collapse whitespace
+        text = _RE_WS.sub(' ', text).strip()
         
         return text
     
@@ -90,8 +361,7 @@ class PDFProcessor:
         }
         
         # Try to extract title (usually in the first few lines)
-        lines = text.split('\n')[:10]
-        for line in lines:
+        for line in islice(_iter_segments(text, '\n'), 10):
             line = line.strip()
             if len(line) > 20 and len(line) < 200 and not line.startswith('Abstract'):
                 # Simple heuristic: title is often the longest line in the beginning
@@ -99,17 +369,31 @@ class PDFProcessor:
                     metadata["title"] = line
         
         # Try to extract abstract
-        abstract_match = re.search(r'(?:Abstract|ABSTRACT)\s*[:\-]?\s*(.*?)(?:\n\s*\n|Keywords|KEYWORDS|1\.|Introduction|INTRODUCTION)', 
-                                 text, re.DOTALL | re.IGNORECASE)
+        abstract_match = _RE_ABSTRACT.search(text[:ABSTRACT_SEARCH_CHARS])
         if abstract_match:
             abstract = abstract_match.group(1).strip()
             # Clean up the abstract
-            abstract = re.sub(r'\s+', ' ', abstract)
+            abstract = _RE_WS.sub(' ', abstract)
             if len(abstract) > 50:  # Only use if it's substantial
-                metadata["abstract"] = abstract[:2000]  # Limit length
+                metadata["abstract"] = _truncate_tokens(abstract)  # Limit length
+        
+        # Collect years and labelled authors from the head in one pass, then years from the tail
+        if len(text) > YEAR_SEARCH_HEAD_CHARS + YEAR_SEARCH_TAIL_CHARS:
+            head, tail = text[:YEAR_SEARCH_HEAD_CHARS], text[-YEAR_SEARCH_TAIL_CHARS:]
+        else:
+            head, tail = text, ""
+        
+        year_matches = []
+        author_matches = []
+        for match in _RE_HEAD_META.finditer(head):
+            year = match.group('year')
+            if year is not None:
+                year_matches.append(year)
+            elif match.end() <= AUTHOR_SEARCH_CHARS:
+                author_matches.append(match.group('authors'))
+        year_matches.extend(_RE_YEAR.findall(tail))
         
         # Try to extract year
-        year_matches = re.findall(r'(?:19|20)\d{2}', text)
         if year_matches:
             # Get the most recent reasonable year
             years = [int(y) for y in year_matches if 1990 <= int(y) <= datetime.now().year]
@@ -117,27 +401,19 @@ class PDFProcessor:
                 metadata["year"] = max(years)
         
         # Try to extract authors (very basic heuristics)
-        # Look for common author patterns
-        author_patterns = [
-            r'(?:Author[s]?|By)\s*[:\-]?\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s*,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)*)',
-            r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s*,\s*[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)*)\s*$'
-        ]
-        
-        for pattern in author_patterns:
-            matches = re.findall(pattern, text[:1000], re.MULTILINE | re.IGNORECASE)
-            if matches:
-                authors_text = matches[0]
-                authors = [author.strip() for author in authors_text.split(',')]
-                authors = [author for author in authors if len(author.split()) <= 4]  # Filter out long strings
-                if authors:
-                    metadata["authors"] = authors
-                    break
+        # Look for common author patterns: a labelled list first, then a line of names
+        authors = _parse_authors(author_matches) or _parse_authors(
+            _RE_AUTHOR_LINE.findall(text[:AUTHOR_SEARCH_CHARS])
+        )
+        if authors:
+            metadata["authors"] = authors
         
         # If no abstract found, use first substantial paragraph
         if not metadata["abstract"]:
-            paragraphs = [p.strip() for p in text.split('\n\n') if len(p.strip()) > 100]
-            if paragraphs:
-                metadata["abstract"] = paragraphs[0][:2000]
+            paragraphs = (p.strip() for p in _iter_segments(text, '\n\n'))
+            paragraph = next((p for p in paragraphs if len(p) > 100), None)
+            if paragraph:
+                metadata["abstract"] = _truncate_tokens(paragraph)
         
         # Use filename as title if no title found
         if not metadata["title"] and filename:
@@ -145,9 +421,74 @@ class PDFProcessor:
         
         return metadata
     
+    def _build_pdf_metadata(
+        self,
+        extracted_text: str,
+        filename: str = "",
+        custom_metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Derive article metadata from extracted text, ready for analysis
+        
+        Args:
+            extracted_text: Cleaned text of the PDF
+            filename: Original filename
+            custom_metadata: Optional custom metadata to override extracted metadata
+            
+        Returns:
+            Metadata dictionary with a non-empty abstract
+        """
+        if len(extracted_text) < 100:
+            raise Exception("Extracted text is too short. PDF might be empty or text extraction failed.")
+        
+        # Extract metadata
+        metadata = self.extract_metadata_from_text(extracted_text, filename)
+        
+        # Override with custom metadata if provided
+        if custom_metadata:
+            metadata.update(custom_metadata)
+        
+        # Use extracted text as abstract if no abstract found
+        if not metadata.get("abstract"):
+            # Use the first ABSTRACT_MAX_TOKENS tokens as abstract
+            metadata["abstract"] = _truncate_tokens(extracted_text)
+        
+        if not metadata.get("abstract"):
+            raise Exception("No substantial content found for analysis")
+        
+        return metadata
+    
+    async def _store_pdf_article(
+        self,
+        extracted_text: str,
+        metadata: Dict[str, Any],
+        analysis: Dict[str, Any],
+        token_usage: Dict[str, int]
+    ) -> Dict[str, Any]:
+        """Combine metadata with its analysis, add it to the knowledge base and build the result"""
+        # Combine metadata with analysis
+        full_article = {**metadata, **analysis}
+        full_article["abstract_hash"] = abstract_hash(metadata["abstract"])
+        
+        # Add the full text for better context
+        full_article["full_text"] = extracted_text
+        
+        # Add to vector store
+        vector_stats = await self.vector_store.add_articles_async([full_article])
+        
+        return {
+            "success": True,
+            "article": full_article,
+            "analysis": analysis,
+            "token_usage": token_usage,
+            "vector_stats": vector_stats,
+            "extracted_text_length": len(extracted_text),
+            "metadata": metadata
+        }
+    
     async def process_pdf(
         self, 
-        pdf_content: bytes, 
+        pdf_source: PDFSource, 
         filename: str = "",
         custom_metadata: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
@@ -155,92 +496,168 @@ class PDFProcessor:
         Process a PDF file: extract text, analyze content, and add to knowledge base
         
         Args:
-            pdf_content: PDF file content as bytes
+            pdf_source: PDF file content as bytes, or a path to the PDF file
             filename: Original filename
             custom_metadata: Optional custom metadata to override extracted metadata
             
         Returns:
             Dictionary with processing results and analysis
         """
+        extracted_text = ""
         try:
-            # Extract text from PDF
-            extracted_text = self.extract_text_from_pdf(pdf_content)
-            
-            if len(extracted_text) < 100:
-                raise Exception("Extracted text is too short. PDF might be empty or text extraction failed.")
-            
-            # Extract metadata
-            metadata = self.extract_metadata_from_text(extracted_text, filename)
+            # A file already in the knowledge base is answered from what was stored
+            doc_hash = await asyncio.to_thread(self._content_hash, pdf_source)
+            duplicate = await self._find_duplicate(doc_hash)
+            if duplicate is not None:
+                return duplicate
             
-            # Override with custom metadata if provided
-            if custom_metadata:
-                metadata.update(custom_metadata)
-            
-            # Use extracted text as abstract if no abstract found
-            if not metadata.get("abstract"):
-                # Use first 2000 characters as abstract
-                metadata["abstract"] = extracted_text[:2000]
+            # Extract text in a worker process so it overlaps in-flight LLM calls
+            extracted_text = await self.extract_text_async(pdf_source)
+            metadata = await asyncio.to_thread(self._build_pdf_metadata, extracted_text, filename, custom_metadata)
+            metadata["doc_hash"] = doc_hash
             
             # Analyze the content using the article analyzer
-            if metadata.get("abstract"):
-                analysis, token_usage = await self.article_analyzer.analyze(metadata["abstract"])
-                
-                # Combine metadata with analysis
-                full_article = {**metadata, **analysis}
-                
-                # Add the full text for better context
-                full_article["full_text"] = extracted_text
-                
-                # Add to vector store
-                vector_stats = self.vector_store.add_articles([full_article])
-                
-                return {
-                    "success": True,
-                    "article": full_article,
-                    "analysis": analysis,
-                    "token_usage": token_usage,
-                    "vector_stats": vector_stats,
-                    "extracted_text_length": len(extracted_text),
-                    "metadata": metadata
-                }
-            else:
-                raise Exception("No substantial content found for analysis")
+            analysis, token_usage = await self.article_analyzer.analyze(metadata["abstract"])
+            
+            return await self._store_pdf_article(extracted_text, metadata, analysis, token_usage)
             
         except Exception as e:
             return {
                 "success": False,
                 "error": str(e),
-                "extracted_text_length": len(extracted_text) if 'extracted_text' in locals() else 0
+                "extracted_text_length": len(extracted_text)
             }
     
-    def get_pdf_info(self, pdf_content: bytes) -> Dict[str, Any]:
+    async def process_pdfs_batch(
+        self,
+        pdfs: List[Tuple[PDFSource, str]],
+        custom_metadata: Optional[Dict[str, Any]] = None,
+        bulk: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Process several PDFs concurrently, at most LLM_MAX_CONCURRENCY at a time
+        
+        Args:
+            pdfs: (pdf_source, filename) pairs
+            custom_metadata: Optional metadata applied to every PDF
+            bulk: Analyze all abstracts as one LLM Batch API job instead of individual
+                calls; half the cost, but it may take hours, so use it for backfills
+            
+        Returns:
+            One process_pdf result per PDF, in order; a failure doesn't abort the others
+        """
+        if bulk:
+            return await self._process_pdfs_bulk(pdfs, custom_metadata)
+        
+        async def process_bounded(pdf_source: PDFSource, filename: str) -> Dict[str, Any]:
+            async with self._semaphore:
+                return await self.process_pdf(pdf_source, filename, custom_metadata)
+        
+        outcomes = await asyncio.gather(
+            *(process_bounded(pdf_source, filename) for pdf_source, filename in pdfs),
+            return_exceptions=True
+        )
+        
+        return [
+            {"success": False, "error": str(outcome), "extracted_text_length": 0}
+            if isinstance(outcome, Exception) else outcome
+            for outcome in outcomes
+        ]
+    
+    async def _process_pdfs_bulk(
+        self,
+        pdfs: List[Tuple[PDFSource, str]],
+        custom_metadata: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Extract every PDF, analyze all abstracts in one batch job, then store the articles"""
+        async def prepare(
+            pdf_source: PDFSource,
+            filename: str
+        ) -> Union[Tuple[str, Dict[str, Any]], Dict[str, Any]]:
+            extracted_text = ""
+            try:
+                doc_hash = await asyncio.to_thread(self._content_hash, pdf_source)
+                duplicate = await self._find_duplicate(doc_hash)
+                if duplicate is not None:
+                    return duplicate
+                
+                extracted_text = await self.extract_text_async(pdf_source)
+                metadata = await asyncio.to_thread(self._build_pdf_metadata, extracted_text, filename, custom_metadata)
+                metadata["doc_hash"] = doc_hash
+                return extracted_text, metadata
+            except Exception as e:
+                return {
+                    "success": False,
+                    "error": str(e),
+                    "extracted_text_length": len(extracted_text)
+                }
+        
+        # Duplicates and failed extractions already hold their result dict; the rest await analysis
+        results = await asyncio.gather(*(prepare(pdf_source, filename) for pdf_source, filename in pdfs))
+        ready = [i for i, outcome in enumerate(results) if isinstance(outcome, tuple)]
+        prepared = {i: results[i] for i in ready}
+        
+        if not ready:
+            return results
+        
+        try:
+            analyses = await self.article_analyzer.analyze_bulk([prepared[i][1]["abstract"] for i in ready])
+        except Exception as e:
+            # The batch job itself failed (upload, expiry, cancellation): fail its PDFs
+            analyses = [e] * len(ready)
+        
+        for i, outcome in zip(ready, analyses):
+            extracted_text, metadata = prepared[i]
+            try:
+                if isinstance(outcome, Exception):
+                    raise outcome
+                analysis, token_usage = outcome
+                results[i] = await self._store_pdf_article(extracted_text, metadata, analysis, token_usage)
+            except Exception as e:
+                results[i] = {
+                    "success": False,
+                    "error": str(e),
+                    "extracted_text_length": len(extracted_text)
+                }
+        
+        return results
+    
+    def get_pdf_info(self, pdf_source: PDFSource) -> Dict[str, Any]:
         """
         Get basic information about a PDF file
         
         Args:
-            pdf_content: PDF file content as bytes
+            pdf_source: PDF file content as bytes, or a path to the PDF file
             
         Returns:
             Dictionary with PDF information
         """
         try:
-            pdf_file = io.BytesIO(pdf_content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
+            size_bytes = self._get_source_size(pdf_source)
+            
+            try:
+                # PDFium reads the page count and the info dictionary in one pass
+                with self._open_pdfium(pdf_source) as pdf:
+                    num_pages, metadata = self._pdfium_info(pdf)
+            except pdfium.PdfiumError:
+                with self._open_pdf(pdf_source) as pdf_reader:
+                    num_pages = len(pdf_reader.pages)
+                    metadata = pdf_reader.metadata
             
             info = {
-                "num_pages": len(pdf_reader.pages),
-                "size_bytes": len(pdf_content),
-                "size_mb": round(len(pdf_content) / (1024 * 1024), 2)
+                "num_pages": num_pages,
+                "size_bytes": size_bytes,
+                "size_mb": round(size_bytes / (1024 * 1024), 2)
             }
             
             # Try to get metadata if available
-            if pdf_reader.metadata:
+            if metadata:
                 info.update({
-                    "title": pdf_reader.metadata.get('/Title', ''),
-                    "author": pdf_reader.metadata.get('/Author', ''),
-                    "subject": pdf_reader.metadata.get('/Subject', ''),
-                    "creator": pdf_reader.metadata.get('/Creator', ''),
-                    "creation_date": pdf_reader.metadata.get('/CreationDate', '')
+                    "title": metadata.get('/Title', ''),
+                    "author": metadata.get('/Author', ''),
+                    "subject": metadata.get('/Subject', ''),
+                    "creator": metadata.get('/Creator', ''),
+                    "creation_date": metadata.get('/CreationDate', '')
                 })
             
             return info
@@ -248,18 +665,52 @@ class PDFProcessor:
         except Exception as e:
             return {"error": f"Error reading PDF info: {str(e)}"}
     
-    def validate_pdf(self, pdf_content: bytes, max_size_mb: int = 50) -> Dict[str, Any]:
+    async def get_pdf_info_async(self, pdf_source: PDFSource) -> Dict[str, Any]:
+        """get_pdf_info in the shared process pool, which keeps PDFium off the app's threads"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_process_pool(), _pdf_info_in_worker, pdf_source)
+    
+    def _pdfium_info(self, pdf: pdfium.PdfDocument) -> Tuple[int, Dict[str, str]]:
+        """Page count and info dictionary (keys prefixed with '/' as in PyPDF2) of an open document"""
+        return len(pdf), {f"/{key}": value for key, value in pdf.get_metadata_dict().items()}
+    
+    def _sample_pdf_text(self, pdf_source: PDFSource) -> Tuple[int, str]:
+        """
+        Count pages and read a short text sample with PDFium
+        
+        Only the first VALIDATION_SAMPLE_CHARS characters of a page are read, and
+        later pages (up to the third) only when the first has too little text,
+        e.g. a scanned cover.
+        
+        Returns:
+            (num_pages, sample_text)
+        """
+        with self._open_pdfium(pdf_source) as pdf:
+            num_pages = len(pdf)
+            
+            sample_parts = []
+            sample_length = 0
+            for i in range(min(num_pages, 3)):  # Check first 3 pages
+                page_text = self._pdfium_page_text(pdf, i, VALIDATION_SAMPLE_CHARS).strip()
+                sample_parts.append(page_text)
+                sample_length += len(page_text)
+                if sample_length >= VALIDATION_MIN_TEXT_CHARS:  # Found some text
+                    break
+        
+        return num_pages, " ".join(sample_parts)
+    
+    def validate_pdf(self, pdf_source: PDFSource, max_size_mb: int = 50) -> Dict[str, Any]:
         """
         Validate PDF file before processing
         
         Args:
-            pdf_content: PDF file content as bytes
+            pdf_source: PDF file content as bytes, or a path to the PDF file
             max_size_mb: Maximum allowed file size in MB
             
         Returns:
             Validation result dictionary
         """
-        size_mb = len(pdf_content) / (1024 * 1024)
+        size_mb = self._get_source_size(pdf_source) / (1024 * 1024)
         
         if size_mb > max_size_mb:
             return {
@@ -268,23 +719,30 @@ class PDFProcessor:
             }
         
         try:
-            pdf_file = io.BytesIO(pdf_content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
+            try:
+                num_pages, sample_text = self._sample_pdf_text(pdf_source)
+            except pdfium.PdfiumError:
+                with self._open_pdf(pdf_source) as pdf_reader:
+                    num_pages = len(pdf_reader.pages)
+                    
+                    # Try to extract some text to ensure it's readable
+                    sample_parts = []
+                    sample_length = 0
+                    for page in pdf_reader.pages[:3]:  # Check first 3 pages
+                        page_text = page.extract_text() or ""
+                        sample_parts.append(page_text)
+                        sample_length += len(page_text)
+                        if sample_length > 100:  # Found some text
+                            break
+                    sample_text = "".join(sample_parts)
             
-            if len(pdf_reader.pages) == 0:
+            if num_pages == 0:
                 return {
                     "valid": False,
                     "error": "PDF file appears to be empty (no pages found)"
                 }
             
-            # Try to extract some text to ensure it's readable
-            sample_text = ""
-            for i, page in enumerate(pdf_reader.pages[:3]):  # Check first 3 pages
-                sample_text += page.extract_text()
-                if len(sample_text) > 100:  # Found some text
-                    break
-            
-            if len(sample_text.strip()) < 50:
+            if len(sample_text.strip()) < VALIDATION_MIN_TEXT_CHARS:
                 return {
                     "valid": False,
                     "error": "PDF appears to contain no readable text (might be image-based)"
@@ -292,7 +750,7 @@ class PDFProcessor:
             
             return {
                 "valid": True,
-                "num_pages": len(pdf_reader.pages),
+                "num_pages": num_pages,
                 "size_mb": size_mb,
                 "sample_text_length": len(sample_text)
             }
@@ -301,4 +759,21 @@ class PDFProcessor:
             return {
                 "valid": False,
                 "error": f"Error validating PDF: {str(e)}"
-            }
\ No newline at end of file
+            }
+    
+    async def validate_pdf_async(self, pdf_source: PDFSource, max_size_mb: int = 50) -> Dict[str, Any]:
+        """
+        validate_pdf in the shared process pool
+        
+        Like extraction, validation opens the file with PDFium, so it runs in a worker
+        process rather than a thread of this one.
+        
+        Args:
+            pdf_source: PDF file content as bytes, or a path to the PDF file
+            max_size_mb: Maximum allowed file size in MB
+            
+        Returns:
+            Validation result dictionary
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_process_pool(), _validate_pdf_in_worker, pdf_source, max_size_mb)
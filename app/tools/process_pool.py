@@ -0,0 +1,30 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+# One pool of worker processes per app for CPU-bound work (PDF text extraction),
+# which would otherwise hold the GIL and stall the event loop
+PROCESS_POOL_WORKERS = min(4, os.cpu_count() or 1)
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared process pool, starting it on first use"""
+    global _pool
+    if _pool is None:
+        # spawn rather than fork: forking a process running an event loop and threads is unsafe
+        _pool = ProcessPoolExecutor(
+            max_workers=PROCESS_POOL_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _pool
+
+
+def shutdown_process_pool() -> None:
+    """Stop the worker processes, dropping queued work"""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(cancel_futures=True)
+        _pool = None
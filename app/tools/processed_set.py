@@ -0,0 +1,111 @@
+import hashlib
+import re
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, Set
+
+# Default on-disk location of the processed-article index
+PROCESSED_DB_PATH = "processed_articles.db"
+
+_NON_ALNUM_RE = re.compile(r"[\W_]+")
+
+
+def _normalize(text: str) -> str:
+    return _NON_ALNUM_RE.sub(" ", text.lower()).strip()
+
+
+def article_key(article: Dict[str, Any]) -> bytes:
+    """
+    16-byte content key identifying an article across formatting variants
+
+    Combines the normalized title, the publication year and the sorted family names
+    of the authors, so punctuation, case or given-name differences map to one key.
+    """
+    authors = article.get('authors') or []
+    if isinstance(authors, str):
+        authors = [authors]
+    family_names = sorted({_normalize(author).rsplit(" ", 1)[-1] for author in authors if author})
+
+    fingerprint = f"{_normalize(article.get('title') or '')}|{article.get('year') or ''}|{','.join(family_names)}"
+    return hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=16).digest()
+
+
+class ProcessedSet:
+    def __init__(self, path: str = PROCESSED_DB_PATH):
+        """
+        Persistent set of processed article keys backed by an append-only SQLite table
+
+        Membership checks are indexed lookups, and new keys are buffered in memory
+        until flush() writes them in one executemany, so a cycle never rewrites the
+        whole set.
+
+        Args:
+            path: SQLite database file
+        """
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS processed_articles ("
+            "article_key BLOB NOT NULL, "
+            "processed_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+        )
+        self._conn.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS processed_articles_key ON processed_articles(article_key)"
+        )
+        self._lock = threading.Lock()
+        self._pending: Set[bytes] = set()
+
+    def __contains__(self, key: bytes) -> bool:
+        if key in self._pending:
+            return True
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM processed_articles WHERE article_key = ?", (key,)).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM processed_articles").fetchone()
+        return count + len(self._pending)
+
+    def add(self, key: bytes) -> None:
+        """Mark an article key as processed; persisted on the next flush()"""
+        self._pending.add(key)
+
+    def discard(self, key: bytes) -> None:
+        """Release a key that has not been flushed yet"""
+        self._pending.discard(key)
+
+    def commit(self, keys: Iterable[bytes]) -> None:
+        """Persist specific pending keys now, e.g. once their articles are stored"""
+        keys = list(keys)
+        self._pending.difference_update(keys)
+        self._insert(keys)
+
+    def flush(self) -> int:
+        """
+        Persist the keys added since the last flush
+
+        Returns:
+            Number of keys written
+        """
+        pending, self._pending = self._pending, set()
+        self._insert(pending)
+        return len(pending)
+
+    def _insert(self, keys: Iterable[bytes]) -> None:
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO processed_articles (article_key) VALUES (?)",
+                    ((key,) for key in keys)
+                )
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Flush pending keys and close the database"""
+        self.flush()
+        self._conn.close()
@@ -1,19 +1,50 @@
-from typing import Dict, Any, List, Optional
+import asyncio
+import functools
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Dict, Any, List, Optional, Tuple
+import orjson
 from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
-from langchain_core.runnables import RunnablePassthrough
+from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableLambda
 from langchain_openai import AzureChatOpenAI
-from langchain.chains import create_retrieval_chain
-from langchain.chains.combine_documents import create_stuff_documents_chain
 
+from .http_client import get_http_client, get_sync_http_client
+from .semantic_cache import SemanticCache
 from .vector_store import VectorStoreService
-from ..config import settings
+from ..config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Chunks retrieved per article for multi-article synthesis
+MULTI_ARTICLE_CHUNKS_PER_TITLE = 10
+
+# Worker threads for the synchronous Chroma calls made by the async RAG methods, kept
+# apart from the default executor so searches don't queue behind unrelated blocking work
+VECTOR_SEARCH_WORKERS = 16
+
+# Per-article digests of a multi-article summary requested at once from the LLM
+ARTICLE_DIGEST_CONCURRENCY = 8
+
+# Characters of each retrieved chunk echoed back with a RAG answer's sources
+SOURCE_PREVIEW_CHARS = 200
+
+
+def _preview(text: str, limit: int = SOURCE_PREVIEW_CHARS) -> str:
+    """Text cut to limit characters, with an ellipsis only when something was cut"""
+    return text if len(text) <= limit else f"{text[:limit]}..."
 
 
 class RAGService:
     def __init__(self):
         """Initialize the RAG service with vector store and Azure OpenAI"""
         self.vector_store = VectorStoreService()
+        self._search_pool = ThreadPoolExecutor(
+            max_workers=VECTOR_SEARCH_WORKERS, thread_name_prefix="vector-search"
+        )
+        settings = get_settings()
         
         # Initialize Azure OpenAI chat model
         self.llm = AzureChatOpenAI(
@@ -23,10 +54,14 @@ class RAGService:
             api_key=settings.AZURE_OPENAI_API_KEY,
             model=settings.AZURE_OPENAI_MODEL_NAME,
             temperature=0.3,
+            # Reuse pooled keep-alive connections instead of a TLS handshake per call
+            http_client=get_sync_http_client(),
+            http_async_client=get_http_client(),
         )
         
-        # Define the QA prompt template
-        self.qa_prompt = PromptTemplate.from_template("""
+        # Define the QA prompt; a plain str.format template filled with format_map,
+        # so answering skips LangChain's template parsing and validation
+        self.qa_template = """
 You are an expert research assistant specializing in academic literature analysis. Use the following pieces of retrieved context from research articles to answer the question. 
 
 Guidelines:
@@ -42,7 +77,142 @@ Context from research articles:
 Question: {input}
 
 Provide a comprehensive, well-structured answer based on the retrieved research:
+"""
+        
+        # Define the multi-article synthesis prompt
+        self.synthesis_prompt = PromptTemplate.from_template("""
+You are tasked with synthesizing insights from multiple research articles. Analyze the following content from {num_articles} research articles and provide a comprehensive synthesis.
+
+{focus_instruction}
+
+Content from articles:
+{context}
+
+Provide a structured synthesis that includes:
+1. **Common Themes**: What consistent patterns or themes emerge across the articles?
+2. **Methodological Approaches**: What research methods were used and how do they compare?
+3. **Key Findings**: What are the main findings and how do they relate to each other?
+4. **Contradictions or Gaps**: Are there any conflicting findings or notable gaps?
+5. **Implications**: What are the broader implications of these combined findings?
+6. **Future Research Directions**: What areas need further investigation?
+
+Synthesis:
+""")
+        
+        # Map step of the multi-article synthesis: condense each article on its own
+        self.article_digest_prompt = PromptTemplate.from_template("""
+You are preparing one article for a cross-article research synthesis. {focus_instruction}
+
+Summarize the following content from the article "{title}": its objective, methodology, key findings, implications and limitations. Be concise and keep specific details that allow comparison with other studies.
+
+Content:
+{content}
+
+Article digest:
 """)
+        
+        # Chains are immutable object graphs: build them once, not per request
+        self.document_chain = RunnableLambda(self._qa_messages) | self.llm | StrOutputParser()
+        self.synthesis_chain = self.synthesis_prompt | self.llm | StrOutputParser()
+        self.article_digest_chain = self.article_digest_prompt | self.llm | StrOutputParser()
+        
+        # Answers to semantically equivalent questions are served from cache
+        self.query_cache = None
+        if settings.RAG_CACHE_ENABLED:
+            self.query_cache = SemanticCache(
+                threshold=settings.RAG_CACHE_THRESHOLD,
+                collection_name=settings.RAG_CACHE_COLLECTION_NAME,
+                ttl_seconds=settings.RAG_CACHE_TTL_SECONDS,
+                max_entries=settings.RAG_CACHE_MAX_ENTRIES,
+                use_lsh=settings.RAG_CACHE_USE_LSH,
+            )
+    
+    def _qa_messages(self, inputs: Dict[str, Any]) -> List[HumanMessage]:
+        """QA prompt for a question and its retrieved documents, stuffed into one message"""
+        context = "\n\n".join(doc.page_content for doc in inputs["context"])
+        return [HumanMessage(content=self.qa_template.format_map({"context": context, "input": inputs["input"]}))]
+    
+    def _query_scope_key(self, k: int, filters: Optional[Dict[str, Any]], kb_version: int) -> str:
+        """
+        Cache partition for a query: answers only match under the same prompt, k and
+        filters, and against the same knowledge base contents (kb_version), so an
+        answer stops matching once documents are added
+        """
+        scope = orjson.dumps(
+            {"prompt": self.qa_template, "k": k, "filters": filters or {}, "kb_version": kb_version},
+            option=orjson.OPT_SORT_KEYS
+        )
+        return hashlib.sha256(scope).hexdigest()
+    
+    async def _embed_and_scope(
+        self,
+        question: str,
+        k: int,
+        filters: Optional[Dict[str, Any]]
+    ) -> Tuple[list, str]:
+        """Embed the question and read the knowledge base version concurrently"""
+        question_embedding, kb_version = await asyncio.gather(
+            self.vector_store.embeddings.aembed_query(question),
+            self._run_search(self.vector_store.document_count)
+        )
+        return question_embedding, self._query_scope_key(k, filters, kb_version)
+    
+    async def _run_search(self, search, *args, **kwargs):
+        """Run a blocking vector store call on the search pool, off the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._search_pool, functools.partial(search, *args, **kwargs)
+        )
+    
+    async def _lookup_cached_answer(self, scope_key: str, question_embedding: list) -> Optional[Dict[str, Any]]:
+        """Stored answer and sources of a semantically equivalent question, if any"""
+        if self.query_cache is None:
+            return None
+        try:
+            hit = await self.query_cache.lookup(scope_key, question_embedding)
+        except Exception as e:
+            logger.warning("RAG cache lookup failed: %s", e)
+            return None
+        return hit[0] if hit is not None else None
+    
+    async def _store_answer(
+        self,
+        scope_key: str,
+        question: str,
+        question_embedding: list,
+        answer: str,
+        sources: List[Dict[str, Any]]
+    ) -> None:
+        if self.query_cache is not None:
+            try:
+                await self.query_cache.insert(
+                    scope_key, question, question_embedding, {"answer": answer, "sources": sources}, {}
+                )
+            except Exception as e:
+                logger.warning("RAG cache insert failed: %s", e)
+    
+    async def _retrieve(self, question_embedding: list, k: int, filters: Optional[Dict[str, Any]]) -> List[Any]:
+        """Retrieve with the precomputed embedding and optional filters"""
+        return await self._run_search(
+            self.vector_store.search_similar_by_vector,
+            question_embedding,
+            k=k,
+            filter=filters
+        )
+    
+    def _extract_sources(self, context: List[Any]) -> List[Dict[str, Any]]:
+        """Source information returned alongside an answer"""
+        sources = []
+        for doc in context:
+            source_info = {
+                "title": doc.metadata.get("title", "Unknown"),
+                "authors": doc.metadata.get("authors", "Unknown"),
+                "year": doc.metadata.get("year"),
+                "journal": doc.metadata.get("journal", "Unknown"),
+                "risk_type": doc.metadata.get("risk_type"),
+                "chunk_content": _preview(doc.page_content)
+            }
+            sources.append(source_info)
+        return sources
     
     async def query_knowledge_base(
         self, 
@@ -59,45 +229,87 @@ Provide a comprehensive, well-structured answer based on the retrieved research:
             filters: Optional filters for retrieval
             
         Returns:
-            Dictionary containing answer, sources, and metadata
+            Dictionary containing answer, sources, and metadata; "cached" is True
+            when a semantically equivalent question was answered before
         """
-        # Get retriever with optional filters
-        retriever = self.vector_store.get_retriever(k=k)
+        # Embed the question once: the vector serves both the cache and retrieval
+        question_embedding, scope_key = await self._embed_and_scope(question, k, filters)
+        cached = await self._lookup_cached_answer(scope_key, question_embedding)
+        if cached is not None:
+            return {
+                "answer": cached["answer"],
+                "sources": cached["sources"],
+                "question": question,
+                "total_sources": len(cached["sources"]),
+                "cached": True
+            }
         
-        if filters:
-            # Apply filters to the retriever
-            search_kwargs = retriever.search_kwargs.copy()
-            search_kwargs.update({"filter": filters})
-            retriever.search_kwargs = search_kwargs
+        context = await self._retrieve(question_embedding, k, filters)
         
-        # Create the documents chain
-        document_chain = create_stuff_documents_chain(self.llm, self.qa_prompt)
+        # Execute the prebuilt documents chain
+        answer = await self.document_chain.ainvoke({"input": question, "context": context})
         
-        # Create the retrieval chain
-        retrieval_chain = create_retrieval_chain(retriever, document_chain)
+        # Extract source information
+        sources = self._extract_sources(context)
         
-        # Execute the chain
-        result = await retrieval_chain.ainvoke({"input": question})
+        await self._store_answer(scope_key, question, question_embedding, answer, sources)
         
-        # Extract source information
-        sources = []
-        for doc in result.get("context", []):
-            source_info = {
-                "title": doc.metadata.get("title", "Unknown"),
-                "authors": doc.metadata.get("authors", "Unknown"),
-                "year": doc.metadata.get("year"),
-                "journal": doc.metadata.get("journal", "Unknown"),
-                "risk_type": doc.metadata.get("risk_type"),
-                "chunk_content": doc.page_content[:200] + "..." if len(doc.page_content) > 200 else doc.page_content
+        return {
+            "answer": answer,
+            "sources": sources,
+            "question": question,
+            "total_sources": len(sources)
+        }
+    
+    async def query_knowledge_base_stream(
+        self,
+        question: str,
+        k: int = 5,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Query the knowledge base using RAG, streaming the answer as it is generated
+        
+        Args:
+            question: User's question
+            k: Number of documents to retrieve
+            filters: Optional filters for retrieval
+            
+        Yields:
+            First a "sources" event with the retrieved sources, then "token" events
+            carrying answer deltas; a cached answer arrives as a single token event
+        """
+        question_embedding, scope_key = await self._embed_and_scope(question, k, filters)
+        cached = await self._lookup_cached_answer(scope_key, question_embedding)
+        if cached is not None:
+            yield {
+                "type": "sources",
+                "sources": cached["sources"],
+                "question": question,
+                "total_sources": len(cached["sources"]),
+                "cached": True
             }
-            sources.append(source_info)
+            yield {"type": "token", "content": cached["answer"]}
+            return
         
-        return {
-            "answer": result["answer"],
+        context = await self._retrieve(question_embedding, k, filters)
+        sources = self._extract_sources(context)
+        
+        # Sources are known before generation starts, so they go out first
+        yield {
+            "type": "sources",
             "sources": sources,
             "question": question,
             "total_sources": len(sources)
         }
+        
+        answer_parts = []
+        async for delta in self.document_chain.astream({"input": question, "context": context}):
+            answer_parts.append(delta)
+            yield {"type": "token", "content": delta}
+        
+        # Only a fully streamed answer is cached
+        await self._store_answer(scope_key, question, question_embedding, "".join(answer_parts), sources)
     
     async def multi_article_summary(
         self, 
@@ -114,18 +326,20 @@ Provide a comprehensive, well-structured answer based on the retrieved research:
         Returns:
             Dictionary containing the synthesized summary and analysis
         """
-        # Build a query to retrieve documents from specific articles
-        title_query = " OR ".join(f'"{title}"' for title in article_titles)
-        
-        # Retrieve documents from the specified articles
-        relevant_docs = []
-        for title in article_titles:
-            docs = self.vector_store.search_similar(
+        # One filtered search per title, all concurrently: a shared search ranked against
+        # every title could fill its k slots from a single article and leave others empty
+        titles = list(dict.fromkeys(article_titles))
+        results = await asyncio.gather(*(
+            self._run_search(
+                self.vector_store.search_similar,
                 query=title,
-                k=10,  # Get more chunks per article
-                title=title  # Filter by exact title match
+                k=MULTI_ARTICLE_CHUNKS_PER_TITLE,
+                title=title  # Exact title match
             )
-            relevant_docs.extend(docs)
+            for title in titles
+        ))
+        docs_by_title: Dict[str, List[Any]] = dict(zip(titles, results))
+        relevant_docs = [doc for title_docs in docs_by_title.values() for doc in title_docs]
         
         if not relevant_docs:
             return {
@@ -134,62 +348,52 @@ Provide a comprehensive, well-structured answer based on the retrieved research:
                 "focus_question": focus_question
             }
         
-        # Create a synthesis prompt
-        synthesis_prompt = PromptTemplate.from_template("""
-You are tasked with synthesizing insights from multiple research articles. Analyze the following content from {num_articles} research articles and provide a comprehensive synthesis.
-
-{focus_instruction}
-
-Content from articles:
-{context}
-
-Provide a structured synthesis that includes:
-1. **Common Themes**: What consistent patterns or themes emerge across the articles?
-2. **Methodological Approaches**: What research methods were used and how do they compare?
-3. **Key Findings**: What are the main findings and how do they relate to each other?
-4. **Contradictions or Gaps**: Are there any conflicting findings or notable gaps?
-5. **Implications**: What are the broader implications of these combined findings?
-6. **Future Research Directions**: What areas need further investigation?
-
-Synthesis:
-""")
-        
-        # Prepare the context
-        context = "\n\n".join([
-            f"Article: {doc.metadata.get('title', 'Unknown')}\n{doc.page_content}"
-            for doc in relevant_docs
-        ])
-        
         focus_instruction = (
             f"Focus your synthesis specifically on: {focus_question}"
             if focus_question
             else "Provide a general synthesis of the key insights."
         )
         
-        # Generate the synthesis
-        chain = synthesis_prompt | self.llm | StrOutputParser()
+        # Prepare the per-article inputs and the unique articles found in one pass over the groups
+        digest_inputs = []
+        unique_articles = []
+        for title, title_docs in docs_by_title.items():
+            if not title_docs:
+                continue
+            metadata = title_docs[0].metadata
+            unique_articles.append({
+                "title": title,
+                "authors": metadata.get('authors', 'Unknown'),
+                "year": metadata.get('year'),
+                "journal": metadata.get('journal', 'Unknown')
+            })
+            digest_inputs.append({
+                "title": title,
+                "content": "\n\n".join(doc.page_content for doc in title_docs),
+                "focus_instruction": focus_instruction
+            })
         
-        synthesis = await chain.ainvoke({
+        # Map: digest every article concurrently in one batched call
+        digests = await self.article_digest_chain.abatch(
+            digest_inputs, config={"max_concurrency": ARTICLE_DIGEST_CONCURRENCY}
+        )
+        
+        # Reduce: synthesize across the short digests instead of all raw chunks
+        context = "\n\n".join(
+            f"Article: {digest_input['title']}\n{digest}"
+            for digest_input, digest in zip(digest_inputs, digests)
+        )
+        
+        # Generate the synthesis
+        synthesis = await self.synthesis_chain.ainvoke({
             "context": context,
-            "num_articles": len(set(doc.metadata.get('title') for doc in relevant_docs)),
+            "num_articles": len(unique_articles),
             "focus_instruction": focus_instruction
         })
         
-        # Extract unique articles found
-        unique_articles = {}
-        for doc in relevant_docs:
-            title = doc.metadata.get('title', 'Unknown')
-            if title not in unique_articles:
-                unique_articles[title] = {
-                    "title": title,
-                    "authors": doc.metadata.get('authors', 'Unknown'),
-                    "year": doc.metadata.get('year'),
-                    "journal": doc.metadata.get('journal', 'Unknown')
-                }
-        
         return {
             "summary": synthesis,
-            "articles_analyzed": list(unique_articles.values()),
+            "articles_analyzed": unique_articles,
             "articles_found": len(unique_articles),
             "focus_question": focus_question,
             "total_chunks_analyzed": len(relevant_docs)
@@ -206,7 +410,8 @@ Synthesis:
             Dictionary containing suggested research gaps and analysis
         """
         # Query for recent research in the domain
-        recent_docs = self.vector_store.search_similar(
+        recent_docs = await self._run_search(
+            self.vector_store.search_similar,
             query=f"{domain} research methodology findings",
             k=20
         )
@@ -238,13 +443,22 @@ Based on this analysis, provide 5-7 specific, actionable research gap suggestion
 Research Gap Analysis:
 """)
         
-        # Prepare context from retrieved documents
-        context = "\n\n".join([
-            f"Study: {doc.metadata.get('title', 'Unknown')}\n"
-            f"Focus: {doc.metadata.get('risk_type', 'General')}\n"
-            f"Method: {doc.page_content[:300]}..."
-            for doc in recent_docs
-        ])
+        # Prepare context, studied titles and covered risk types in one pass
+        context_parts = []
+        titles = set()
+        coverage_areas = {}
+        for doc in recent_docs:
+            metadata = doc.metadata
+            risk_type = metadata.get('risk_type')
+            titles.add(metadata.get('title'))
+            if risk_type:
+                coverage_areas[risk_type] = None
+            context_parts.append(
+                f"Study: {metadata.get('title', 'Unknown')}\n"
+                f"Focus: {metadata.get('risk_type', 'General')}\n"
+                f"Method: {doc.page_content[:300]}..."
+            )
+        context = "\n\n".join(context_parts)
         
         # Generate gap analysis
         chain = gap_analysis_prompt | self.llm | StrOutputParser()
@@ -257,8 +471,8 @@ Research Gap Analysis:
         return {
             "gap_analysis": analysis,
             "domain": domain,
-            "articles_analyzed": len(set(doc.metadata.get('title') for doc in recent_docs)),
-            "coverage_areas": list(set(doc.metadata.get('risk_type') for doc in recent_docs if doc.metadata.get('risk_type')))
+            "articles_analyzed": len(titles),
+            "coverage_areas": list(coverage_areas)
         }
     
     def get_knowledge_base_stats(self) -> Dict[str, Any]:
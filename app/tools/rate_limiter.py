@@ -0,0 +1,81 @@
+import asyncio
+import time
+from typing import Any, Optional
+
+
+class TokenBucket:
+    def __init__(self, capacity: float, refill_per_sec: float):
+        """
+        Proactive token-bucket rate limiter for async callers
+
+        Callers wait only as long as the bucket is empty instead of sending a request,
+        getting a 429 and backing off.
+
+        Args:
+            capacity: Maximum burst size in tokens
+            refill_per_sec: Tokens added back per second
+        """
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_sec)
+        self._updated_at = now
+
+    async def acquire(self, tokens: float = 1) -> None:
+        """Wait until the requested number of tokens is available, then take them"""
+        if tokens > self.capacity:
+            raise ValueError(f"Cannot acquire {tokens} tokens from a bucket of capacity {self.capacity}")
+
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+
+                await asyncio.sleep((tokens - self._tokens) / self.refill_per_sec)
+
+    def pause(self, seconds: float) -> None:
+        """Hold all acquisitions for the given time, e.g. to honor a Retry-After header"""
+        now = time.monotonic()
+        self._paused_until = max(self._paused_until, now + seconds)
+        self._refill(now)
+        self._tokens = 0
+
+    async def __aenter__(self) -> "TokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+def retry_after_seconds(source: Any) -> Optional[float]:
+    """
+    Read a Retry-After delay in seconds from an HTTP response or an exception carrying one
+
+    Returns:
+        The delay, or None when the header is absent or not a number of seconds
+    """
+    response = getattr(source, "response", source)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    value = headers.get("retry-after")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
@@ -0,0 +1,194 @@
+import asyncio
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+from langchain_chroma import Chroma
+
+from ..config import get_settings
+from .lsh_index import LSHIndex
+from .vector_store import create_embeddings, get_chroma_client
+
+# Size-bounded caches check for overflow every this many inserts rather than on each one
+EVICTION_CHECK_INTERVAL = 100
+
+
+class SemanticCache:
+    def __init__(
+        self,
+        threshold: Optional[float] = None,
+        collection_name: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        use_lsh: bool = False
+    ):
+        """
+        Cache of LLM responses looked up by embedding similarity of the input
+
+        Entries are partitioned by a prompt key (prompt, schema and model), so only
+        inputs sent with the same instructions can match. Stored in its own Chroma
+        collection next to the knowledge base, using cosine distance.
+
+        Args:
+            threshold: Minimum cosine similarity for a hit (defaults to the setting)
+            collection_name: Chroma collection (defaults to the LLM cache setting)
+            ttl_seconds: Entries older than this never hit (no expiry when None)
+            max_entries: Oldest entries are evicted beyond this size (unbounded when None)
+            use_lsh: Keep the cached embeddings in an in-memory LSH index and look
+                them up there first, fetching only the matching entry from Chroma;
+                an index miss falls back to querying Chroma
+        """
+        settings = get_settings()
+        self.threshold = settings.LLM_SEMANTIC_CACHE_THRESHOLD if threshold is None else threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._inserts = 0
+        self.use_lsh = use_lsh
+        self._lsh: Optional[LSHIndex] = None
+        self._lsh_lock = asyncio.Lock()
+        self.embeddings = create_embeddings()
+        self.store = Chroma(
+            client=get_chroma_client(),
+            collection_name=collection_name or settings.LLM_CACHE_COLLECTION_NAME,
+            embedding_function=self.embeddings,
+            collection_metadata={"hnsw:space": "cosine"},
+        )
+
+    async def embed(self, text: str) -> list:
+        """Embed an input once so lookup and insert can share the vector"""
+        return await self.embeddings.aembed_query(text)
+
+    async def lookup(
+        self,
+        prompt_key: str,
+        embedding: list
+    ) -> Optional[Tuple[Dict[str, Any], Dict[str, int]]]:
+        """
+        Find the cached response whose input is most similar to this one
+
+        Returns:
+            (response, token_usage) of the original call when similarity reaches the
+            threshold, otherwise None
+        """
+        if self.use_lsh:
+            # The index only knows entries loaded at startup or inserted by this process;
+            # entries cached by other workers are found by the Chroma query below
+            hit = await self._lookup_lsh(prompt_key, embedding)
+            if hit is not None:
+                return hit
+
+        index = self._lsh
+        results = await asyncio.to_thread(
+            self.store._collection.query,
+            query_embeddings=[embedding],
+            n_results=1,
+            where={"prompt_key": prompt_key},
+            include=["metadatas", "distances", "embeddings"] if index is not None else ["metadatas", "distances"],
+        )
+        if not results["ids"] or not results["ids"][0]:
+            return None
+
+        # Cosine distance is 1 - cosine similarity
+        if 1 - results["distances"][0][0] < self.threshold:
+            return None
+
+        metadata = results["metadatas"][0][0]
+        if self.ttl_seconds is not None and time.time() - metadata.get("ts", 0) > self.ttl_seconds:
+            return None
+
+        # Index the entry locally so repeats of this question hit without Chroma
+        if index is not None:
+            index.add(results["ids"][0][0], results["embeddings"][0][0], prompt_key)
+        return orjson.loads(metadata["response"]), orjson.loads(metadata["usage"])
+
+    async def _load_lsh(self, dim: int) -> LSHIndex:
+        """Build the LSH index from the collection on first use"""
+        async with self._lsh_lock:
+            if self._lsh is None:
+                entries = await asyncio.to_thread(
+                    self.store._collection.get, include=["embeddings", "metadatas"]
+                )
+                index = LSHIndex(dim)
+                for entry_id, embedding, metadata in zip(
+                    entries["ids"], entries["embeddings"], entries["metadatas"]
+                ):
+                    index.add(entry_id, embedding, metadata.get("prompt_key"))
+                self._lsh = index
+        return self._lsh
+
+    async def _lookup_lsh(
+        self,
+        prompt_key: str,
+        embedding: list
+    ) -> Optional[Tuple[Dict[str, Any], Dict[str, int]]]:
+        """lookup() through the in-memory LSH index; Chroma is only read on a hit"""
+        index = await self._load_lsh(len(embedding))
+        match = index.query(embedding, prompt_key)
+        if match is None or match[1] < self.threshold:
+            return None
+
+        entry_id, _ = match
+        results = await asyncio.to_thread(self.store._collection.get, ids=[entry_id], include=["metadatas"])
+        if not results["metadatas"]:
+            return None
+
+        metadata = results["metadatas"][0]
+        if self.ttl_seconds is not None and time.time() - metadata.get("ts", 0) > self.ttl_seconds:
+            return None
+        return orjson.loads(metadata["response"]), orjson.loads(metadata["usage"])
+
+    async def insert(
+        self,
+        prompt_key: str,
+        text: str,
+        embedding: list,
+        response: Dict[str, Any],
+        token_usage: Dict[str, int]
+    ) -> None:
+        """Store a response under its input embedding"""
+        entry_id = str(uuid.uuid4())
+        await asyncio.to_thread(
+            self.store._collection.add,
+            ids=[entry_id],
+            embeddings=[embedding],
+            documents=[text],
+            metadatas=[{
+                "prompt_key": prompt_key,
+                "response": orjson.dumps(response).decode(),
+                "usage": orjson.dumps(token_usage).decode(),
+                "ts": time.time(),
+            }],
+        )
+
+        if self._lsh is not None:
+            self._lsh.add(entry_id, embedding, prompt_key)
+
+        self._inserts += 1
+        if self.max_entries is not None and self._inserts % EVICTION_CHECK_INTERVAL == 0:
+            evicted = await asyncio.to_thread(self._evict)
+            if self._lsh is not None:
+                self._lsh.remove(evicted)
+
+    def _evict(self) -> List[str]:
+        """
+        Delete the oldest entries beyond max_entries, and any expired ones
+
+        Returns:
+            IDs of the deleted entries
+        """
+        collection = self.store._collection
+        if collection.count() <= self.max_entries and self.ttl_seconds is None:
+            return []
+
+        entries = collection.get(include=["metadatas"])
+        by_age = sorted(zip(entries["ids"], entries["metadatas"]), key=lambda entry: entry[1].get("ts", 0))
+        excess = max(0, len(by_age) - self.max_entries)
+        expired_before = time.time() - self.ttl_seconds if self.ttl_seconds is not None else 0
+        stale = [
+            entry_id for i, (entry_id, metadata) in enumerate(by_age)
+            if i < excess or metadata.get("ts", 0) < expired_before
+        ]
+        if stale:
+            collection.delete(ids=stale)
+        return stale
@@ -1,9 +1,51 @@
 from google.oauth2.credentials import Credentials
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
-from typing import List
+from googleapiclient.errors import HttpError
+from googleapiclient.http import set_user_agent
+import google_auth_httplib2
+import httplib2
+from typing import List, Dict, Any
 import os
-import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Google APIs only gzip responses for clients whose User-Agent contains "gzip";
+# httplib2 already sends Accept-Encoding: gzip and decompresses transparently
+SHEETS_USER_AGENT = "SmartLit/1.0 (gzip)"
+
+# Rows per values.append request, keeping each payload well under the API size limit
+SHEETS_APPEND_CHUNK_ROWS = 10_000
+
+# Sheet layout as (header, article field) pairs, shared by the header row and appends
+SHEET_COLUMNS = [
+    ('Title', 'title'),
+    ('Authors', 'authors'),
+    ('Year', 'year'),
+    ('Journal', 'journal'),
+    ('Objective', 'objective'),
+    ('Methodology', 'methodology'),
+    ('Key Variables', 'key_variables'),
+    ('Risk Type', 'risk_type'),
+    ('Level of Analysis', 'level_of_analysis'),
+    ('Main Findings', 'main_findings'),
+    ('Implications', 'implications'),
+    ('Limitations', 'limitations')
+]
+
+
+def articles_to_columns(articles: List[dict]) -> Dict[str, List[Any]]:
+    """Transpose article records into one list of cell values per sheet column"""
+    columns = {}
+    for _, field in SHEET_COLUMNS:
+        if field == 'authors':
+            columns[field] = [', '.join(article.get('authors', [])) for article in articles]
+        elif field == 'year':
+            columns[field] = [str(article.get('year', '')) for article in articles]
+        else:
+            columns[field] = [article.get(field, '') for article in articles]
+    return columns
 
 class GoogleSheetsHandler:
     def __init__(self):
@@ -12,7 +54,7 @@ class GoogleSheetsHandler:
             SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
             
             # Print the current working directory
-            print(f"Current working directory: {os.getcwd()}")
+            logger.debug("Current working directory: %s", os.getcwd())
             
             # Verify credentials file exists
             if not os.path.exists('credentials.json'):
@@ -21,36 +63,33 @@ class GoogleSheetsHandler:
             credentials = service_account.Credentials.from_service_account_file(
                 'credentials.json', scopes=SCOPES)
             
-            self.service = build('sheets', 'v4', credentials=credentials)
+            # One authorized keep-alive transport, with gzip-compressed responses
+            http = google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http())
+            self.service = build('sheets', 'v4', http=set_user_agent(http, SHEETS_USER_AGENT))
             self.spreadsheet_id = os.getenv('SPREADSHEET_ID')
             
             if not self.spreadsheet_id:
                 raise ValueError("SPREADSHEET_ID not found in environment variables")
                 
-            print(f"Successfully initialized Google Sheets handler with spreadsheet ID: {self.spreadsheet_id}")
+            logger.info("Successfully initialized Google Sheets handler with spreadsheet ID: %s", self.spreadsheet_id)
             
         except Exception as e:
-            print(f"Error initializing Google Sheets handler: {str(e)}")
+            logger.error("Error initializing Google Sheets handler: %s", e)
             raise
 
     def initialize_sheet(self):
         try:
-            print("Starting sheet initialization...")
-            sheet_metadata = self.service.spreadsheets().get(
-                spreadsheetId=self.spreadsheet_id).execute()
-            
-            print("Successfully got sheet metadata")
-            print(f"Available sheets: {json.dumps(sheet_metadata.get('sheets', []), indent=2)}")
-            
-            # Check if "Articles" sheet exists
-            sheet_exists = False
-            for sheet in sheet_metadata.get('sheets', ''):
-                if sheet.get('properties', {}).get('title', '') == 'Articles':
-                    sheet_exists = True
-                    break
+            logger.info("Starting sheet initialization...")
             
-            if not sheet_exists:
-                print("Creating new 'Articles' sheet...")
+            # Write the headers straight away: when the "Articles" sheet already
+            # exists (every startup but the first) this is the only round trip
+            try:
+                self._write_headers()
+            except HttpError as e:
+                if e.resp.status != 400:
+                    raise
+                
+                logger.info("Creating new 'Articles' sheet...")
                 request = {
                     'addSheet': {
                         'properties': {
@@ -62,67 +101,52 @@ class GoogleSheetsHandler:
                     spreadsheetId=self.spreadsheet_id,
                     body={'requests': [request]}
                 ).execute()
-                print("'Articles' sheet created successfully")
-
-            # Define headers
-            headers = [
-                'Title', 'Authors', 'Year', 'Journal', 'Objective', 'Methodology',
-                'Key Variables', 'Risk Type', 'Level of Analysis', 'Main Findings',
-                'Implications', 'Limitations'
-            ]
+                logger.info("'Articles' sheet created successfully")
+                self._write_headers()
             
-            print("Updating headers...")
-            body = {
-                'values': [headers]
-            }
-            self.service.spreadsheets().values().update(
-                spreadsheetId=self.spreadsheet_id,
-                range='Articles!A1',
-                valueInputOption='RAW',
-                body=body
-            ).execute()
-            print("Headers updated successfully")
+            logger.info("Headers updated successfully")
             
         except Exception as e:
-            print(f"Error in initialize_sheet: {str(e)}")
+            logger.error("Error in initialize_sheet: %s", e)
             raise
 
+    def _write_headers(self):
+        """Write the header row; raises a 400 HttpError if the sheet is missing"""
+        headers = [header for header, _ in SHEET_COLUMNS]
+        self.service.spreadsheets().values().update(
+            spreadsheetId=self.spreadsheet_id,
+            range='Articles!A1',
+            valueInputOption='RAW',
+            body={'values': [headers]}
+        ).execute()
+
     def append_articles(self, articles: List[dict]):
+        self.append_columns(articles_to_columns(articles))
+
+    def append_columns(self, columns: Dict[str, List[Any]]):
+        """Append rows given column-wise, keyed by the article fields in SHEET_COLUMNS"""
         try:
-            print(f"Starting to append {len(articles)} articles...")
-            rows = []
-            for article in articles:
-                row = [
-                    article.get('title', ''),
-                    ', '.join(article.get('authors', [])),
-                    str(article.get('year', '')),
-                    article.get('journal', ''),
-                    article.get('objective', ''),
-                    article.get('methodology', ''),
-                    article.get('key_variables', ''),
-                    article.get('risk_type', ''),
-                    article.get('level_of_analysis', ''),
-                    article.get('main_findings', ''),
-                    article.get('implications', ''),
-                    article.get('limitations', '')
-                ]
-                rows.append(row)
+            # The values grid is the column buffers zipped back into rows
+            rows = [list(row) for row in zip(*(columns[field] for _, field in SHEET_COLUMNS))]
+            logger.info("Starting to append %d articles...", len(rows))
 
-            body = {
-                'values': rows
-            }
-            
-            print("Sending append request to Google Sheets...")
-            result = self.service.spreadsheets().values().append(
-                spreadsheetId=self.spreadsheet_id,
-                range='Articles!A2',
-                valueInputOption='RAW',
-                insertDataOption='INSERT_ROWS',
-                body=body
-            ).execute()
-            
-            print(f"Append result: {json.dumps(result, indent=2)}")
+            # Large batches go out in bounded blocks, appended in order
+            for start in range(0, len(rows), SHEETS_APPEND_CHUNK_ROWS):
+                body = {
+                    'values': rows[start:start + SHEETS_APPEND_CHUNK_ROWS]
+                }
+                
+                logger.debug("Sending append request to Google Sheets...")
+                result = self.service.spreadsheets().values().append(
+                    spreadsheetId=self.spreadsheet_id,
+                    range='Articles!A2',
+                    valueInputOption='RAW',
+                    insertDataOption='INSERT_ROWS',
+                    body=body
+                ).execute()
+                
+                logger.debug("Append result: %s", result)
             
         except Exception as e:
-            print(f"Error in append_articles: {str(e)}")
+            logger.error("Error in append_columns: %s", e)
             raise 
\ No newline at end of file
@@ -0,0 +1,15 @@
+from functools import lru_cache
+
+import tiktoken
+
+# Encoding of recent OpenAI models, used when tiktoken doesn't know a deployment's model name
+FALLBACK_ENCODING = "o200k_base"
+
+
+@lru_cache(maxsize=4)
+def encoding_for(model: str) -> tiktoken.Encoding:
+    """Return the tiktoken encoding of a model, loading each one only once"""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding(FALLBACK_ENCODING)
@@ -0,0 +1,60 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    def __init__(self, maxsize: int, ttl: float, max_stale: Optional[float] = None):
+        """
+        Bounded LRU cache whose entries go stale after a time-to-live
+
+        Args:
+            maxsize: Maximum number of entries kept before evicting the least recently used
+            ttl: Seconds an entry is considered fresh
+            max_stale: Seconds past the TTL a stale entry may still be served
+                (None keeps stale entries until they are evicted)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value if it is still fresh, otherwise the default"""
+        entry = self.get_with_freshness(key)
+        if entry is None or not entry[1]:
+            return default
+        return entry[0]
+
+    def get_with_freshness(self, key: Hashable) -> Optional[Tuple[Any, bool]]:
+        """
+        Look up an entry for stale-while-revalidate callers
+
+        Returns:
+            Tuple of (value, is_fresh), or None when the key is missing or too stale to serve
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, value = entry
+        age = time.monotonic() - stored_at
+        if self.max_stale is not None and age > self.ttl + self.max_stale:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value, age <= self.ttl
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,5 +1,10 @@
 from typing import List, Dict, Any, Optional
+import asyncio
+import hashlib
 import uuid
+from functools import lru_cache
+import chromadb
+from chromadb.config import Settings as ChromaSettings
 from langchain_chroma import Chroma
 from langchain_openai import AzureOpenAIEmbeddings
 from langchain_text_splitters import RecursiveCharacterTextSplitter
@@ -7,35 +12,93 @@ from langchain_core.documents import Document
 from langchain_core.vectorstores import VectorStoreRetriever
 import os
 
-from ..config import settings
+from ..config import get_settings
+from .http_client import get_http_client, get_sync_http_client
+from .tokenizer import encoding_for
+
+# Chunks are embedded in slices of this size, well under Azure OpenAI's per-request input limit
+EMBEDDING_BATCH_SIZE = 256
+
+# Distinct query strings whose embeddings are kept, so repeated searches skip the embedding call
+QUERY_EMBEDDING_CACHE_SIZE = 4096
+
+# Chunks are sized in embedding-model tokens, matching what the embedding call sees
+CHUNK_SIZE_TOKENS = 300
+CHUNK_OVERLAP_TOKENS = 50
+
+# Analysis fields appended to an article's chunked content, with their section labels
+ANALYSIS_FIELD_LABELS = {
+    field: field.replace('_', ' ').title()
+    for field in [
+        'objective', 'methodology', 'key_variables', 'main_findings',
+        'implications', 'limitations'
+    ]
+}
+
+# HNSW graph parameters of the knowledge-base collection, sized for 10k-100k chunks
+# at high recall; Chroma applies them when the collection is first created
+KB_COLLECTION_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:M": 32,
+    "hnsw:construction_ef": 200,
+    "hnsw:search_ef": 64,
+}
+
+
+def chunk_hash(text: str) -> str:
+    """Content hash of a chunk's text, used to skip re-embedding identical chunks"""
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=1)
+def get_chroma_client() -> chromadb.ClientAPI:
+    """Process-wide persistent Chroma client shared by the knowledge base and the caches"""
+    settings = get_settings()
+    
+    # Create persist directory if it doesn't exist
+    os.makedirs(settings.CHROMA_PERSIST_DIRECTORY, exist_ok=True)
+    return chromadb.PersistentClient(
+        path=settings.CHROMA_PERSIST_DIRECTORY,
+        settings=ChromaSettings(anonymized_telemetry=False)
+    )
+
+
+def create_embeddings() -> AzureOpenAIEmbeddings:
+    """Azure OpenAI embeddings client configured from settings, on the shared connection pools"""
+    settings = get_settings()
+    return AzureOpenAIEmbeddings(
+        azure_deployment=settings.AZURE_OPENAI_EMBEDDING_DEPLOYMENT,
+        openai_api_version=settings.AZURE_OPENAI_API_VERSION,
+        azure_endpoint=settings.AZURE_OPENAI_API_ENDPOINT,
+        api_key=settings.AZURE_OPENAI_API_KEY,
+        model=settings.AZURE_OPENAI_EMBEDDING_MODEL,
+        dimensions=settings.AZURE_OPENAI_EMBEDDING_DIMENSIONS,
+        http_client=get_sync_http_client(),
+        http_async_client=get_http_client(),
+    )
 
 
 class VectorStoreService:
     def __init__(self):
         """Initialize the vector store with Azure OpenAI embeddings and ChromaDB"""
-        self.embeddings = AzureOpenAIEmbeddings(
-            azure_deployment=settings.AZURE_OPENAI_EMBEDDING_DEPLOYMENT,
-            openai_api_version=settings.AZURE_OPENAI_API_VERSION,
-            azure_endpoint=settings.AZURE_OPENAI_API_ENDPOINT,
-            api_key=settings.AZURE_OPENAI_API_KEY,
-            model=settings.AZURE_OPENAI_EMBEDDING_MODEL,
-        )
-        
-        # Create persist directory if it doesn't exist
-        os.makedirs(settings.CHROMA_PERSIST_DIRECTORY, exist_ok=True)
+        settings = get_settings()
+        self.embeddings = create_embeddings()
+        self._embed_query_cached = lru_cache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)(self._embed_query)
         
-        # Initialize ChromaDB vector store
+        # Initialize ChromaDB vector store on the shared persistent client
         self.vector_store = Chroma(
+            client=get_chroma_client(),
             collection_name=settings.CHROMA_COLLECTION_NAME,
             embedding_function=self.embeddings,
-            persist_directory=settings.CHROMA_PERSIST_DIRECTORY,
+            collection_metadata=KB_COLLECTION_METADATA,
         )
         
-        # Initialize text splitter for document chunking
+        # Initialize text splitter for document chunking, measuring length in tokens
+        encoding = encoding_for(settings.AZURE_OPENAI_EMBEDDING_MODEL)
         self.text_splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1000,
-            chunk_overlap=200,
-            length_function=len,
+            chunk_size=CHUNK_SIZE_TOKENS,
+            chunk_overlap=CHUNK_OVERLAP_TOKENS,
+            length_function=lambda text: len(encoding.encode(text, disallowed_special=())),
             separators=["\n\n", "\n", " ", ""]
         )
     
@@ -52,17 +115,15 @@ class VectorStoreService:
         documents = []
         
         # Combine title and abstract for primary content
-        primary_content = f"Title: {article.get('title', '')}\n\nAbstract: {article.get('abstract', '')}"
+        sections = [f"Title: {article.get('title', '')}", f"Abstract: {article.get('abstract', '')}"]
         
         # Add analysis components if available
-        analysis_fields = [
-            'objective', 'methodology', 'key_variables', 'main_findings', 
-            'implications', 'limitations'
-        ]
-        
-        for field in analysis_fields:
+        for field, label in ANALYSIS_FIELD_LABELS.items():
             if article.get(field):
-                primary_content += f"\n\n{field.replace('_', ' ').title()}: {article[field]}"
+                sections.append(f"{label}: {article[field]}")
+        
+        # Joined once rather than grown by repeated concatenation
+        primary_content = "\n\n".join(sections)
         
         # Create metadata for all chunks
         metadata = {
@@ -73,7 +134,10 @@ class VectorStoreService:
             "risk_type": article.get('risk_type', ''),
             "level_of_analysis": article.get('level_of_analysis', ''),
             "source": "crossref",
-            "document_id": str(uuid.uuid4())
+            "document_id": str(uuid.uuid4()),
+            # Content hashes of the source file and abstract, used to detect re-uploads
+            "doc_hash": article.get('doc_hash', ''),
+            "abstract_hash": article.get('abstract_hash', '')
         }
         
         # Chunk the content
@@ -83,7 +147,8 @@ class VectorStoreService:
             chunk_metadata = metadata.copy()
             chunk_metadata.update({
                 "chunk_id": i,
-                "total_chunks": len(chunks)
+                "total_chunks": len(chunks),
+                "chunk_hash": chunk_hash(chunk)
             })
             
             doc = Document(
@@ -94,62 +159,205 @@ class VectorStoreService:
         
         return documents
     
+    def _chunk_articles(self, articles: List[Dict[str, Any]]) -> List[Document]:
+        """Chunk every article that has an abstract into a single flat document list"""
+        all_documents = []
+        
+        for article in articles:
+            if article.get('abstract'):  # Only process articles with abstracts
+                docs = self.chunk_article_content(article)
+                all_documents.extend(docs)
+        
+        return all_documents
+    
+    def _drop_duplicate_chunks(self, documents: List[Document]) -> List[Document]:
+        """
+        Remove chunks whose exact text is already stored, or repeated earlier in the batch
+        
+        Boilerplate shared across articles (affiliations, standard method text) is
+        then embedded and indexed only once.
+        """
+        if not documents:
+            return documents
+        
+        hashes = list(dict.fromkeys(doc.metadata["chunk_hash"] for doc in documents))
+        existing = self.vector_store._collection.get(
+            where={"chunk_hash": {"$in": hashes}},
+            include=["metadatas"]
+        )
+        seen = {metadata["chunk_hash"] for metadata in existing["metadatas"]}
+        
+        unique = []
+        for doc in documents:
+            digest = doc.metadata["chunk_hash"]
+            if digest not in seen:
+                seen.add(digest)
+                unique.append(doc)
+        return unique
+    
+    def _insert_documents(self, documents: List[Document], embeddings: List[List[float]]) -> None:
+        """
+        Write pre-embedded documents to the Chroma collection in one call
+        
+        IDs are derived from each chunk's document and position, and metadata is
+        coerced up front to the scalar types Chroma accepts (None becomes "").
+        """
+        self.vector_store._collection.add(
+            ids=[f"{doc.metadata['document_id']}:{doc.metadata['chunk_id']}" for doc in documents],
+            embeddings=embeddings,
+            documents=[doc.page_content for doc in documents],
+            metadatas=[
+                {key: "" if value is None else value for key, value in doc.metadata.items()}
+                for doc in documents
+            ]
+        )
+    
+    def _add_stats(
+        self,
+        articles: List[Dict[str, Any]],
+        documents: List[Document],
+        duplicate_chunks: int = 0
+    ) -> Dict[str, int]:
+        return {
+            "total_articles": len(articles),
+            "processed_articles": len([a for a in articles if a.get('abstract')]),
+            "total_chunks": len(documents),
+            "duplicate_chunks": duplicate_chunks
+        }
+    
     def add_articles(self, articles: List[Dict[str, Any]]) -> Dict[str, int]:
         """
         Add articles to the vector store
         
+        All chunks are embedded in batches of EMBEDDING_BATCH_SIZE and written to
+        the collection with a single insert; chunks already stored are skipped.
+        
         Args:
             articles: List of article dictionaries
             
         Returns:
             Dictionary with statistics about added documents
         """
-        all_documents = []
+        chunked = self._chunk_articles(articles)
+        all_documents = self._drop_duplicate_chunks(chunked)
         
-        for article in articles:
-            if article.get('abstract'):  # Only process articles with abstracts
-                docs = self.chunk_article_content(article)
-                all_documents.extend(docs)
+        if all_documents:
+            texts = [doc.page_content for doc in all_documents]
+            # One call across all articles; the client splits it into EMBEDDING_BATCH_SIZE requests
+            embeddings = self.embeddings.embed_documents(texts, chunk_size=EMBEDDING_BATCH_SIZE)
+            
+            # Add documents to vector store
+            self._insert_documents(all_documents, embeddings)
+        
+        return self._add_stats(articles, all_documents, len(chunked) - len(all_documents))
+    
+    async def add_articles_async(self, articles: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Add articles to the vector store without blocking the event loop
+        
+        Embedding batches are requested concurrently; chunking (token counting), the
+        duplicate check and the collection insert run in worker threads.
+        
+        Args:
+            articles: List of article dictionaries
+            
+        Returns:
+            Dictionary with statistics about added documents
+        """
+        chunked = await asyncio.to_thread(self._chunk_articles, articles)
+        all_documents = await asyncio.to_thread(self._drop_duplicate_chunks, chunked)
         
         if all_documents:
+            texts = [doc.page_content for doc in all_documents]
+            batches = await asyncio.gather(*(
+                self.embeddings.aembed_documents(texts[start:start + EMBEDDING_BATCH_SIZE])
+                for start in range(0, len(texts), EMBEDDING_BATCH_SIZE)
+            ))
+            embeddings = [embedding for batch in batches for embedding in batch]
+            
             # Add documents to vector store
-            self.vector_store.add_documents(all_documents)
+            await asyncio.to_thread(self._insert_documents, all_documents, embeddings)
         
-        return {
-            "total_articles": len(articles),
-            "processed_articles": len([a for a in articles if a.get('abstract')]),
-            "total_chunks": len(all_documents)
-        }
+        return self._add_stats(articles, all_documents, len(chunked) - len(all_documents))
+    
+    def _embed_query(self, query: str) -> tuple:
+        # Tuples, so callers can't mutate a cached vector
+        return tuple(self.embeddings.embed_query(query))
+    
+    def embed_query(self, query: str) -> List[float]:
+        """Embed a search query, reusing the vector of an identical earlier query"""
+        return list(self._embed_query_cached(query))
     
-    def search_similar(self, query: str, k: int = 5, **filters) -> List[Document]:
+    def search_similar_by_vector(
+        self,
+        embedding: List[float],
+        k: int = 5,
+        filter: Optional[Dict[str, Any]] = None
+    ) -> List[Document]:
+        """
+        Search for documents similar to a precomputed query embedding
+        
+        Args:
+            embedding: Query embedding
+            k: Number of results to return
+            filter: Optional ChromaDB metadata filter
+            
+        Returns:
+            List of relevant Document objects
+        """
+        return self.vector_store.similarity_search_by_vector(embedding, k=k, filter=filter or None)
+    
+    def search_similar(
+        self,
+        query: str,
+        k: int = 5,
+        where: Optional[Dict[str, Any]] = None,
+        **filters
+    ) -> List[Document]:
         """
         Search for similar documents using semantic similarity
         
         Args:
             query: Search query
             k: Number of results to return
+            where: Structured ChromaDB filter, e.g. {"title": {"$in": [...]}};
+                takes precedence over **filters
             **filters: Additional metadata filters
             
         Returns:
             List of relevant Document objects
         """
         # Apply filters if provided
-        search_kwargs = {"k": k}
+        where_clause = where
         
-        if filters:
+        if not where_clause and filters:
             # Build filter dictionary for ChromaDB
             where_clause = {}
             for key, value in filters.items():
                 if value is not None:
                     where_clause[key] = value
-            
-            if where_clause:
-                search_kwargs["filter"] = where_clause
         
-        # Perform similarity search
-        results = self.vector_store.similarity_search(query, **search_kwargs)
+        # Perform similarity search with the (possibly cached) query embedding
+        results = self.search_similar_by_vector(self.embed_query(query), k=k, filter=where_clause)
         return results
     
+    def find_by_doc_hash(self, doc_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up an article already stored from the same source file
+        
+        Args:
+            doc_hash: Content hash of the source file
+            
+        Returns:
+            Metadata of one of its chunks, or None if the file hasn't been added
+        """
+        results = self.vector_store._collection.get(
+            where={"doc_hash": doc_hash},
+            limit=1,
+            include=["metadatas"]
+        )
+        return results["metadatas"][0] if results["metadatas"] else None
+    
     def get_retriever(self, k: int = 5, **search_kwargs) -> VectorStoreRetriever:
         """
         Get a retriever object for use in LangChain chains
@@ -169,13 +377,33 @@ class VectorStoreService:
         """Delete the entire collection (useful for testing/reset)"""
         self.vector_store.delete_collection()
     
+    def warm_index(self) -> None:
+        """
+        Load the collection's HNSW index into memory ahead of the first search
+        
+        Queries with a stored vector, so warming makes no embedding call.
+        """
+        collection = self.vector_store._collection
+        sample = collection.peek(1)
+        if len(sample["ids"]):
+            collection.query(query_embeddings=[sample["embeddings"][0]], n_results=1, include=[])
+    
+    def document_count(self) -> int:
+        """
+        Number of chunks in the collection
+        
+        Inserts skip duplicate chunks, so the count changes exactly when new content
+        is added; it serves as a version of the knowledge base shared by all workers.
+        """
+        return self.vector_store._collection.count()
+    
     def get_collection_stats(self) -> Dict[str, Any]:
         """Get statistics about the current collection"""
         try:
             collection = self.vector_store._collection
             return {
                 "total_documents": collection.count(),
-                "collection_name": settings.CHROMA_COLLECTION_NAME
+                "collection_name": get_settings().CHROMA_COLLECTION_NAME
             }
         except Exception as e:
             return {"error": str(e), "total_documents": 0}
\ No newline at end of file
@@ -1,11 +1,19 @@
 import streamlit as st
 import requests
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from typing import Dict, List, Any
-import json
+import threading
+import hashlib
+import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import TYPE_CHECKING, Dict, List, Any, Iterator, Optional
+import orjson
 from datetime import datetime
+from urllib.parse import quote_plus
+
+# pandas and plotly are imported where results are charted, so reruns that show
+# no charts (and the first page load) don't pay for importing them
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Configure the page
 st.set_page_config(
@@ -18,6 +26,39 @@ st.set_page_config(
 # API base URL (adjust as needed)
 API_BASE_URL = "http://localhost:8000"
 
+# API responses are memoized across reruns for this long; "Refresh" clears them
+API_CACHE_TTL_SECONDS = 300
+
+# Seconds between background refreshes of the sidebar knowledge base stats
+STATS_REFRESH_SECONDS = 60
+
+# Search results rendered per page of article details
+PAGE_SIZE = 10
+
+# Layout shared by the search result charts
+CHART_MARGIN = dict(l=0, r=0, t=30, b=0)
+CHART_CONFIG = {'displayModeBar': False}
+
+# Background jobs the dashboard polls, and the delay between polls
+JOB_NAMES = ("summary", "gaps")
+JOB_POLL_INTERVAL_SECONDS = 1.0
+
+# (connect, read) timeouts; the read timeout covers endpoints that wait on LLM calls
+API_TIMEOUT = (3, 300)
+
+@st.cache_resource
+def get_session() -> requests.Session:
+    """One pooled keep-alive session per Streamlit process, shared by all reruns and tabs"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.2)  # Idempotent methods only (not POST)
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 # Custom CSS for better styling
 st.markdown("""
 <style>
@@ -57,26 +98,174 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-def call_api(endpoint: str, method: str = "GET", data: Dict = None) -> Dict:
-    """Make API calls to the SmartLit backend"""
+# Cached fetchers take the request payload as serialized JSON, since dicts aren't hashable;
+# failures raise, and Streamlit never caches a raised call. Bodies are encoded and
+# responses parsed with orjson, which is much faster than the stdlib on large payloads.
+@st.cache_data(ttl=API_CACHE_TTL_SECONDS, show_spinner=False)
+def _cached_get(url: str, params_json: bytes) -> Dict:
+    response = get_session().get(url, params=orjson.loads(params_json), timeout=API_TIMEOUT)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+@st.cache_data(ttl=API_CACHE_TTL_SECONDS, show_spinner=False)
+def _cached_post(url: str, body_json: bytes) -> Dict:
+    response = get_session().post(
+        url, data=body_json, headers={"Content-Type": "application/json"}, timeout=API_TIMEOUT
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+def encode_payload(payload: Any) -> bytes:
+    """Canonical JSON of a request payload, independent of key order"""
+    return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+
+def payload_key(payload: Any) -> str:
+    """Content hash of a request payload, given as a dict or as encode_payload bytes"""
+    if not isinstance(payload, bytes):
+        payload = encode_payload(payload)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+def _fetch(endpoint: str, method: str = "GET", data: Dict = None, body: Optional[bytes] = None) -> Dict:
+    """Call the SmartLit backend through the response cache, raising on failure"""
     url = f"{API_BASE_URL}{endpoint}"
+    payload = body if body is not None else encode_payload(data)
+    if method == "GET":
+        return _cached_get(url, payload)
+    elif method == "POST":
+        return _cached_post(url, payload)
+    raise ValueError(f"Unsupported method: {method}")
+
+def call_api(
+    endpoint: str,
+    method: str = "GET",
+    data: Dict = None,
+    cache: bool = True,
+    body: Optional[bytes] = None
+) -> Dict:
+    """
+    Make API calls to the SmartLit backend, reusing responses to identical calls unless cache=False
+
+    A POST payload already encoded with encode_payload can be passed as body instead
+    of data, so it isn't serialized a second time.
+    """
     try:
-        if method == "GET":
-            response = requests.get(url, params=data)
-        elif method == "POST":
-            response = requests.post(url, json=data)
-        
-        response.raise_for_status()
-        return response.json()
+        if not cache:
+            response = get_session().request(
+                method,
+                f"{API_BASE_URL}{endpoint}",
+                params=data if method == "GET" else None,
+                data=(body if body is not None else orjson.dumps(data)) if method != "GET" else None,
+                headers={"Content-Type": "application/json"},
+                timeout=API_TIMEOUT
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        return _fetch(endpoint, method, data, body)
     except requests.exceptions.RequestException as e:
         st.error(f"API Error: {str(e)}")
         return {}
 
+def call_api_stream(endpoint: str, data: Dict) -> Iterator[Dict]:
+    """
+    POST to a streaming SmartLit endpoint and yield its NDJSON events as they arrive
+    
+    Streams are never cached. A request failure ends the stream with an "error"
+    event, the same way the backend reports failures after the response started.
+    """
+    url = f"{API_BASE_URL}{endpoint}"
+    try:
+        with get_session().post(
+            url,
+            data=orjson.dumps(data),
+            headers={"Content-Type": "application/json"},
+            timeout=API_TIMEOUT,
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line:
+                    yield orjson.loads(line)
+    except requests.exceptions.RequestException as e:
+        yield {"type": "error", "error": f"API Error: {str(e)}"}
+
+def submit_job(name: str, endpoint: str, data: Dict = None):
+    """Start a backend job and remember it in session state, replacing any earlier result"""
+    response = call_api(endpoint, method="POST", data=data, cache=False)
+    st.session_state.pop(f"{name}_result", None)
+    st.session_state[f"{name}_job"] = response.get("job_id")
+
+def poll_job(name: str, label: str) -> Optional[Dict]:
+    """
+    Check on a job started with submit_job
+    
+    While it runs a status box is shown and main() schedules another rerun, so the
+    rest of the dashboard stays interactive instead of blocking under a spinner.
+    
+    Returns:
+        The job's result once done (kept across reruns), otherwise None
+    """
+    job_id = st.session_state.get(f"{name}_job")
+    if job_id:
+        job = call_api(f"/job/{job_id}", cache=False)
+        status = job.get("status")
+        if status == "running":
+            st.status(label, state="running")
+            return None
+        
+        del st.session_state[f"{name}_job"]
+        if status == "done":
+            st.session_state[f"{name}_result"] = job["result"]
+        elif status == "failed":
+            st.error(f"Job failed: {job.get('error')}")
+    return st.session_state.get(f"{name}_result")
+
+def jobs_running() -> bool:
+    return any(st.session_state.get(f"{name}_job") for name in JOB_NAMES)
+
+def _request_stats() -> Dict:
+    response = get_session().get(f"{API_BASE_URL}/knowledge_base_stats", timeout=API_TIMEOUT)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+def refresh_stats(holder: Dict) -> None:
+    """Reload knowledge base stats into the provider, keeping the last good value on failure"""
+    try:
+        holder["stats"] = _request_stats()
+    except requests.exceptions.RequestException:
+        pass
+
+@st.cache_resource
+def stats_provider() -> Dict:
+    """
+    Knowledge base stats shared by every session of this Streamlit process
+    
+    Loaded once on cold start, then kept current by a background thread, so reruns
+    read them from memory instead of calling the API.
+    """
+    holder = {"stats": {}}
+    refresh_stats(holder)
+    
+    def refresh_forever():
+        while True:
+            time.sleep(STATS_REFRESH_SECONDS)
+            refresh_stats(holder)
+    
+    threading.Thread(target=refresh_forever, name="stats-refresh", daemon=True).start()
+    return holder
+
 def display_knowledge_base_stats():
     """Display knowledge base statistics in the sidebar"""
     with st.sidebar:
         st.subheader("📊 Knowledge Base Stats")
-        stats = call_api("/knowledge_base_stats")
+        
+        provider = stats_provider()
+        
+        # Drop memoized responses and reload the stats now
+        if st.button("🔄 Refresh"):
+            st.cache_data.clear()
+            refresh_stats(provider)
+        
+        stats = provider["stats"]
         
         if stats:
             st.metric("Total Documents", stats.get("total_documents", 0))
@@ -84,126 +273,185 @@ def display_knowledge_base_stats():
         else:
             st.warning("Could not load stats")
 
+def present_values(column: "pd.Series") -> "pd.Series":
+    """Values of a column that are set and non-empty (not None, NaN, "" or 0)"""
+    return column[column.notna() & column.astype(bool)]
+
 def search_articles_tab():
     """Article search and analysis tab"""
     st.markdown('<div class="section-header">🔍 Search & Analyze Articles</div>', unsafe_allow_html=True)
     
-    col1, col2 = st.columns([2, 1])
+    # Widgets in a form only rerun the script when the search is submitted
+    with st.form("search_form"):
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            topic = st.text_input("Research Topic", placeholder="e.g., 'financial risk management'")
+            
+        with col2:
+            search_button = st.form_submit_button("🔍 Search Articles", type="primary")
+        
+        # Advanced filters
+        with st.expander("🎛️ Advanced Filters"):
+            filter_col1, filter_col2, filter_col3 = st.columns(3)
+            
+            with filter_col1:
+                year_from = st.number_input("Year From", min_value=1990, max_value=2024, value=2020)
+                year_to = st.number_input("Year To", min_value=1990, max_value=2024, value=2024)
+            
+            with filter_col2:
+                risk_type = st.selectbox("Risk Type", ["", "Financial", "Operational", "Strategic", "Credit", "Market"])
+                level_of_analysis = st.selectbox("Level of Analysis", ["", "Firm-level", "Industry-level", "Country-level", "Multi-level"])
+            
+            with filter_col3:
+                journal = st.text_input("Journal (optional)")
     
-    with col1:
-        topic = st.text_input("Research Topic", placeholder="e.g., 'financial risk management'")
+    if search_button and topic:
+        # Prepare filters
+        filters = {}
+        if year_from:
+            filters["year_from"] = year_from
+        if year_to:
+            filters["year_to"] = year_to
+        if risk_type:
+            filters["risk_type"] = risk_type
+        if level_of_analysis:
+            filters["level_of_analysis"] = level_of_analysis
+        if journal:
+            filters["journal"] = journal
         
-    with col2:
-        search_button = st.button("🔍 Search Articles", type="primary")
+        # Encoded once: the same bytes are the search key and the request body
+        body = encode_payload({"topic": topic, "filters": filters or None})
+        
+        # Only a new (topic, filters) search goes to the backend
+        search_key = payload_key(body)
+        if st.session_state.get("search_key") != search_key:
+            with st.spinner("Searching and analyzing articles..."):
+                # Call API
+                results = call_api("/search_articles", method="POST", body=body)
+                st.session_state["search_results"] = results
+                st.session_state["article_page"] = 1
+                # A failed search is retried on the next press
+                st.session_state["search_key"] = search_key if results else None
+    
+    # Results persist across reruns, so expanding an article doesn't discard them
+    results = st.session_state.get("search_results")
     
-    # Advanced filters
-    with st.expander("🎛️ Advanced Filters"):
-        filter_col1, filter_col2, filter_col3 = st.columns(3)
+    if results and "articles" in results:
+        import pandas as pd
+        import plotly.graph_objects as go
         
-        with filter_col1:
-            year_from = st.number_input("Year From", min_value=1990, max_value=2024, value=2020)
-            year_to = st.number_input("Year To", min_value=1990, max_value=2024, value=2024)
+        articles = results["articles"]
+        st.success(f"Found {len(articles)} articles")
         
-        with filter_col2:
-            risk_type = st.selectbox("Risk Type", ["", "Financial", "Operational", "Strategic", "Credit", "Market"])
-            level_of_analysis = st.selectbox("Level of Analysis", ["", "Firm-level", "Industry-level", "Country-level", "Multi-level"])
+        # One DataFrame feeds every metric and chart; empty values are ignored
+        df = pd.DataFrame(articles, columns=["risk_type", "year", "journal"])
+        risk_types = present_values(df["risk_type"])
+        years = present_values(df["year"]).astype(int)
+        journals = present_values(df["journal"])
         
-        with filter_col3:
-            journal = st.text_input("Journal (optional)")
-    
-    if search_button and topic:
-        with st.spinner("Searching and analyzing articles..."):
-            # Prepare filters
-            filters = {}
-            if year_from:
-                filters["year_from"] = year_from
-            if year_to:
-                filters["year_to"] = year_to
-            if risk_type:
-                filters["risk_type"] = risk_type
-            if level_of_analysis:
-                filters["level_of_analysis"] = level_of_analysis
-            if journal:
-                filters["journal"] = journal
+        # Display summary metrics
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.metric("Articles Found", len(articles))
+        
+        with col2:
+            st.metric("Risk Types", risk_types.nunique())
+        
+        with col3:
+            st.metric("Avg Year", f"{years.mean():.0f}" if not years.empty else "N/A")
+        
+        with col4:
+            st.metric("Unique Journals", journals.nunique())
+        
+        # Visualizations
+        if articles:
+            viz_col1, viz_col2 = st.columns(2)
             
-            # Call API
-            data = {"topic": topic}
-            if filters:
-                data["filters"] = filters
-                
-            results = call_api("/search_articles", method="POST", data=data)
+            with viz_col1:
+                # Risk type distribution
+                risk_counts = risk_types.value_counts()
+                if not risk_counts.empty:
+                    # Built directly from the count arrays, skipping Plotly Express's wrapper
+                    fig_risk = go.Figure(go.Bar(
+                        x=risk_counts.to_numpy(),
+                        y=risk_counts.index.to_numpy(),
+                        orientation='h'
+                    ))
+                    fig_risk.update_layout(
+                        title="Risk Type Distribution",
+                        xaxis_title='Count',
+                        yaxis_title='Risk Type',
+                        margin=CHART_MARGIN,
+                        uirevision='static'  # Keep zoom across reruns
+                    )
+                    st.plotly_chart(fig_risk, use_container_width=True, config=CHART_CONFIG)
             
-            if results and "articles" in results:
-                articles = results["articles"]
-                st.success(f"Found {len(articles)} articles")
-                
-                # Display summary metrics
-                col1, col2, col3, col4 = st.columns(4)
+            with viz_col2:
+                # Year distribution
+                if not years.empty:
+                    year_counts = years.value_counts().sort_index()
+                    # WebGL trace: drawn on the GPU, so large result sets stay responsive
+                    fig_year = go.Figure(go.Scattergl(
+                        x=year_counts.index.to_numpy(),
+                        y=year_counts.to_numpy(),
+                        mode='lines+markers'
+                    ))
+                    fig_year.update_layout(
+                        title="Publications by Year",
+                        xaxis_title='Year',
+                        yaxis_title='Count',
+                        margin=CHART_MARGIN,
+                        uirevision='static'
+                    )
+                    st.plotly_chart(fig_year, use_container_width=True, config=CHART_CONFIG)
+        
+        # Display articles, one page at a time so only PAGE_SIZE expanders are built
+        st.subheader("📄 Article Details")
+        page_count = max(1, -(-len(articles) // PAGE_SIZE))
+        page_col, _ = st.columns([1, 3])
+        with page_col:
+            page = st.number_input(
+                f"Page (of {page_count})", min_value=1, max_value=page_count, step=1, key="article_page"
+            ) - 1
+        
+        page_articles = articles[page * PAGE_SIZE:(page + 1) * PAGE_SIZE]
+        for i, article in enumerate(page_articles, start=page * PAGE_SIZE):
+            with st.expander(f"📑 {article.get('title', 'Unknown Title')}"):
+                col1, col2 = st.columns([2, 1])
                 
+                # One markdown element per column rather than one per field
                 with col1:
-                    st.metric("Articles Found", len(articles))
+                    st.markdown("\n\n".join([
+                        f"**Authors:** {', '.join(article.get('authors', []))}",
+                        f"**Journal:** {article.get('journal', 'Unknown')}",
+                        f"**Year:** {article.get('year', 'Unknown')}",
+                        f"**Risk Type:** {article.get('risk_type', 'Unknown')}",
+                        f"**Level of Analysis:** {article.get('level_of_analysis', 'Unknown')}",
+                    ]))
                 
                 with col2:
-                    risk_types = [a.get("risk_type", "Unknown") for a in articles if a.get("risk_type")]
-                    st.metric("Risk Types", len(set(risk_types)))
-                
-                with col3:
-                    years = [a.get("year") for a in articles if a.get("year")]
-                    avg_year = sum(years) / len(years) if years else 0
-                    st.metric("Avg Year", f"{avg_year:.0f}" if avg_year else "N/A")
-                
-                with col4:
-                    journals = [a.get("journal") for a in articles if a.get("journal")]
-                    st.metric("Unique Journals", len(set(journals)))
-                
-                # Visualizations
-                if articles:
-                    viz_col1, viz_col2 = st.columns(2)
-                    
-                    with viz_col1:
-                        # Risk type distribution
-                        risk_counts = pd.Series(risk_types).value_counts()
-                        if not risk_counts.empty:
-                            fig_risk = px.bar(
-                                x=risk_counts.values,
-                                y=risk_counts.index,
-                                orientation='h',
-                                title="Risk Type Distribution",
-                                labels={'x': 'Count', 'y': 'Risk Type'}
-                            )
-                            st.plotly_chart(fig_risk, use_container_width=True)
-                    
-                    with viz_col2:
-                        # Year distribution
-                        if years:
-                            year_counts = pd.Series(years).value_counts().sort_index()
-                            fig_year = px.line(
-                                x=year_counts.index,
-                                y=year_counts.values,
-                                title="Publications by Year",
-                                labels={'x': 'Year', 'y': 'Count'}
-                            )
-                            st.plotly_chart(fig_year, use_container_width=True)
+                    st.markdown("\n\n".join([
+                        f"**Objective:** {article.get('objective', 'N/A')[:200]}...",
+                        f"**Main Findings:** {article.get('main_findings', 'N/A')[:200]}...",
+                    ]))
                 
-                # Display articles
-                st.subheader("📄 Article Details")
-                for i, article in enumerate(articles):
-                    with st.expander(f"📑 {article.get('title', 'Unknown Title')}"):
-                        col1, col2 = st.columns([2, 1])
-                        
-                        with col1:
-                            st.write(f"**Authors:** {', '.join(article.get('authors', []))}")
-                            st.write(f"**Journal:** {article.get('journal', 'Unknown')}")
-                            st.write(f"**Year:** {article.get('year', 'Unknown')}")
-                            st.write(f"**Risk Type:** {article.get('risk_type', 'Unknown')}")
-                            st.write(f"**Level of Analysis:** {article.get('level_of_analysis', 'Unknown')}")
-                        
-                        with col2:
-                            st.write(f"**Objective:** {article.get('objective', 'N/A')[:200]}...")
-                            st.write(f"**Main Findings:** {article.get('main_findings', 'N/A')[:200]}...")
-                        
-                        if st.button(f"View Full Analysis {i}", key=f"analysis_{i}"):
-                            st.json(article)
+                if st.button(f"View Full Analysis {i}", key=f"analysis_{page}_{i}"):
+                    st.json(article)
+
+def render_source_cards(sources: List[Dict]) -> str:
+    """HTML for the RAG source cards, rendered as a single markdown element"""
+    return "\n".join(
+        f"""<div class="source-card">
+<strong>Source {i+1}:</strong> {source.get('title', 'Unknown')}<br>
+<strong>Authors:</strong> {source.get('authors', 'Unknown')}<br>
+<strong>Year:</strong> {source.get('year', 'Unknown')} | 
+<strong>Journal:</strong> {source.get('journal', 'Unknown')}<br>
+<strong>Content:</strong> {source.get('chunk_content', 'N/A')}
+</div>"""
+        for i, source in enumerate(sources)
+    )
 
 def rag_query_tab():
     """RAG knowledge base query tab"""
@@ -214,71 +462,104 @@ def rag_query_tab():
     articles and provide comprehensive answers based on the research findings.
     """)
     
-    # Query input
-    question = st.text_area(
-        "Your Question",
-        placeholder="e.g., 'What are the main risk factors identified in financial institutions?'"
-    )
-    
-    col1, col2, col3 = st.columns([1, 1, 2])
-    
-    with col1:
-        k_results = st.slider("Number of sources", min_value=3, max_value=10, value=5)
-    
-    with col2:
-        query_button = st.button("🔍 Query Knowledge Base", type="primary")
-    
-    # Query filters
-    with st.expander("🎛️ Query Filters"):
-        filter_col1, filter_col2 = st.columns(2)
+    # Widgets in a form only rerun the script when the query is submitted
+    with st.form("rag_query_form"):
+        # Query input
+        question = st.text_area(
+            "Your Question",
+            placeholder="e.g., 'What are the main risk factors identified in financial institutions?'"
+        )
+        
+        col1, col2, col3 = st.columns([1, 1, 2])
+        
+        with col1:
+            k_results = st.slider("Number of sources", min_value=3, max_value=10, value=5)
         
-        with filter_col1:
-            filter_risk_type = st.selectbox("Filter by Risk Type", ["", "Financial", "Operational", "Strategic"])
-            filter_year = st.number_input("Filter by Year", min_value=1990, max_value=2024, value=None)
+        with col2:
+            query_button = st.form_submit_button("🔍 Query Knowledge Base", type="primary")
         
-        with filter_col2:
-            filter_journal = st.text_input("Filter by Journal")
+        # Query filters
+        with st.expander("🎛️ Query Filters"):
+            filter_col1, filter_col2 = st.columns(2)
+            
+            with filter_col1:
+                filter_risk_type = st.selectbox("Filter by Risk Type", ["", "Financial", "Operational", "Strategic"])
+                filter_year = st.number_input("Filter by Year", min_value=1990, max_value=2024, value=None)
+            
+            with filter_col2:
+                filter_journal = st.text_input("Filter by Journal")
     
+    streamed = False
     if query_button and question:
-        with st.spinner("Searching knowledge base and generating answer..."):
-            # Prepare filters
-            filters = {}
-            if filter_risk_type:
-                filters["risk_type"] = filter_risk_type
-            if filter_year:
-                filters["year"] = filter_year
-            if filter_journal:
-                filters["journal"] = filter_journal
+        # Prepare filters
+        filters = {}
+        if filter_risk_type:
+            filters["risk_type"] = filter_risk_type
+        if filter_year:
+            filters["year"] = filter_year
+        if filter_journal:
+            filters["journal"] = filter_journal
+        
+        query_data = {
+            "question": question,
+            "k": k_results,
+            "filters": filters if filters else None
+        }
+        
+        # Resubmitting an unchanged query reuses the previous answer
+        query_key = payload_key(query_data)
+        if st.session_state.get("rag_key") != query_key:
+            st.session_state.pop("rag_result", None)
+            st.session_state.pop("rag_key", None)
             
-            query_data = {
-                "question": question,
-                "k": k_results,
-                "filters": filters if filters else None
-            }
+            # The stream opens with the retrieved sources, then carries the answer tokens
+            events = call_api_stream("/query_knowledge_base?stream=true", query_data)
+            with st.spinner("Searching knowledge base..."):
+                result = next(events, {})
+            
+            stream_errors = []
             
-            result = call_api("/query_knowledge_base", method="POST", data=query_data)
+            def answer_tokens() -> Iterator[str]:
+                for event in events:
+                    if event.get("type") == "token":
+                        yield event["content"]
+                    elif event.get("type") == "error":
+                        stream_errors.append(event.get("error", "Unknown error"))
+                        return
             
-            if result and "answer" in result:
-                # Display answer
+            if result.get("type") == "sources":
+                # Display answer as it is generated
                 st.markdown("### 💡 Answer")
-                st.markdown(result["answer"])
+                answer = st.write_stream(answer_tokens())
                 
-                # Display sources
-                st.markdown("### 📚 Sources")
-                sources = result.get("sources", [])
-                
-                for i, source in enumerate(sources):
-                    st.markdown(f"""
-                    <div class="source-card">
-                        <strong>Source {i+1}:</strong> {source.get('title', 'Unknown')}<br>
-                        <strong>Authors:</strong> {source.get('authors', 'Unknown')}<br>
-                        <strong>Year:</strong> {source.get('year', 'Unknown')} | 
-                        <strong>Journal:</strong> {source.get('journal', 'Unknown')}<br>
-                        <strong>Content:</strong> {source.get('chunk_content', 'N/A')}
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                st.info(f"Answer based on {len(sources)} relevant sources")
+                # A stream cut short by an error is shown but not kept as the answer
+                if stream_errors:
+                    st.error(stream_errors[0])
+                else:
+                    sources = result.get("sources", [])
+                    st.session_state["rag_result"] = {
+                        "answer": answer,
+                        "source_count": len(sources),
+                        "sources_html": render_source_cards(sources)
+                    }
+                    st.session_state["rag_key"] = query_key
+                    streamed = True
+            elif result.get("type") == "error":
+                st.error(result.get("error", "Unknown error"))
+    
+    # The last answer persists across reruns
+    rag_result = st.session_state.get("rag_result")
+    if rag_result:
+        if not streamed:
+            st.markdown("### 💡 Answer")
+            st.markdown(rag_result["answer"])
+        
+        # Display sources
+        st.markdown("### 📚 Sources")
+        # All cards go to the frontend as one element, built once per answer
+        st.markdown(rag_result["sources_html"], unsafe_allow_html=True)
+        
+        st.info(f"Answer based on {rag_result['source_count']} relevant sources")
 
 def multi_article_summary_tab():
     """Multi-article summary generation tab"""
@@ -304,39 +585,41 @@ def multi_article_summary_tab():
         if article_titles_text:
             article_titles = [title.strip() for title in article_titles_text.split('\n') if title.strip()]
             
-            with st.spinner("Analyzing articles and generating synthesis..."):
-                summary_data = {
-                    "article_titles": article_titles,
-                    "focus_question": focus_question if focus_question else None
-                }
-                
-                result = call_api("/multi_article_summary", method="POST", data=summary_data)
-                
-                if result and "summary" in result:
-                    # Display summary
-                    st.markdown("### 📋 Synthesis")
-                    st.markdown(result["summary"])
-                    
-                    # Display articles analyzed
-                    st.markdown("### 📚 Articles Analyzed")
-                    articles_analyzed = result.get("articles_analyzed", [])
-                    
-                    for article in articles_analyzed:
-                        st.markdown(f"""
-                        - **{article.get('title', 'Unknown')}** 
-                          - Authors: {article.get('authors', 'Unknown')}
-                          - Year: {article.get('year', 'Unknown')}
-                          - Journal: {article.get('journal', 'Unknown')}
-                        """)
-                    
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Articles Found", result.get("articles_found", 0))
-                    with col2:
-                        st.metric("Chunks Analyzed", result.get("total_chunks_analyzed", 0))
-                    with col3:
-                        if result.get("focus_question"):
-                            st.info(f"Focus: {result['focus_question']}")
+            summary_data = {
+                "article_titles": article_titles,
+                "focus_question": focus_question if focus_question else None
+            }
+            
+            submit_job("summary", "/multi_article_summary/submit", summary_data)
+    
+    result = poll_job("summary", "Analyzing articles and generating synthesis...")
+    
+    if result and "summary" in result:
+        # Display summary
+        st.markdown("### 📋 Synthesis")
+        st.markdown(result["summary"])
+        
+        # Display articles analyzed
+        st.markdown("### 📚 Articles Analyzed")
+        articles_analyzed = result.get("articles_analyzed", [])
+        
+        # One markdown list for all articles rather than an element per article
+        st.markdown("\n".join(
+            f"- **{article.get('title', 'Unknown')}**\n"
+            f"  - Authors: {article.get('authors', 'Unknown')}\n"
+            f"  - Year: {article.get('year', 'Unknown')}\n"
+            f"  - Journal: {article.get('journal', 'Unknown')}"
+            for article in articles_analyzed
+        ))
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Articles Found", result.get("articles_found", 0))
+        with col2:
+            st.metric("Chunks Analyzed", result.get("total_chunks_analyzed", 0))
+        with col3:
+            if result.get("focus_question"):
+                st.info(f"Focus: {result['focus_question']}")
 
 def research_gaps_tab():
     """Research gaps analysis tab"""
@@ -355,29 +638,30 @@ def research_gaps_tab():
     
     if st.button("🔍 Analyze Research Gaps", type="primary"):
         if domain:
-            with st.spinner("Analyzing research patterns and identifying gaps..."):
-                result = call_api(f"/suggest_research_gaps?domain={domain}")
-                
-                if result and "gap_analysis" in result:
-                    # Display gap analysis
-                    st.markdown("### 🔍 Research Gap Analysis")
-                    st.markdown(result["gap_analysis"])
-                    
-                    # Display metadata
-                    st.markdown("### 📊 Analysis Details")
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        st.metric("Articles Analyzed", result.get("articles_analyzed", 0))
-                        st.metric("Domain", result.get("domain", "Unknown"))
-                    
-                    with col2:
-                        coverage_areas = result.get("coverage_areas", [])
-                        if coverage_areas:
-                            st.write("**Coverage Areas:**")
-                            for area in coverage_areas:
-                                if area:  # Filter out None/empty values
-                                    st.write(f"• {area}")
+            submit_job("gaps", f"/suggest_research_gaps/submit?domain={quote_plus(domain)}")
+    
+    result = poll_job("gaps", "Analyzing research patterns and identifying gaps...")
+    
+    if result and "gap_analysis" in result:
+        # Display gap analysis
+        st.markdown("### 🔍 Research Gap Analysis")
+        st.markdown(result["gap_analysis"])
+        
+        # Display metadata
+        st.markdown("### 📊 Analysis Details")
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.metric("Articles Analyzed", result.get("articles_analyzed", 0))
+            st.metric("Domain", result.get("domain", "Unknown"))
+        
+        with col2:
+            coverage_areas = result.get("coverage_areas", [])
+            if coverage_areas:
+                st.write("**Coverage Areas:**")
+                for area in coverage_areas:
+                    if area:  # Filter out None/empty values
+                        st.write(f"• {area}")
 
 def main():
     """Main dashboard function"""
@@ -435,6 +719,11 @@ def main():
         
         Built with FastAPI, LangChain, ChromaDB, and Streamlit.
         """)
+    
+    # Poll unfinished jobs once the whole page has rendered
+    if jobs_running():
+        time.sleep(JOB_POLL_INTERVAL_SECONDS)
+        st.rerun()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file